@@ -23,4 +23,9 @@ setup(
     install_requires=[
         "starkcore>=0.1.0",
     ],
+    extras_require={
+        "fast": ["coincurve"],
+        "http2": ["httpx[http2]"],
+        "aio": ["httpx"],
+    },
 )
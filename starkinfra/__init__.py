@@ -2,184 +2,177 @@ version = "0.28.0"
 language = "en-US"
 timeout = 15
 user = None
+pool = None
+retries = None
+hedge = None
+rate_limiter = None
+circuit_breaker = None
+hooks = []
+prefetch = 0
+stream = False
+concurrency = 4
+signer = None
+compression = None
+public_key_cache = None
 request_methods_prefix = "Joker"
 
-from starkcore import Project, Organization, key, error
-
-from . import event
-from .event.__event import Event
-
-from . import brcodepreview
-from .brcodepreview.__brcodepreview import BrcodePreview
-
-from . import pixrequest
-from .pixrequest.__pixrequest import PixRequest
-
-from . import pixreversal
-from .pixreversal.__pixreversal import PixReversal
-
-from . import pixstatement
-from .pixstatement.__pixstatement import PixStatement
-
-from . import pixbalance
-from .pixbalance.__pixbalance import PixBalance
-
-from . import pixdirector
-from .pixdirector.__pixdirector import PixDirector
-
-from . import pixkey
-from .pixkey.__pixkey import PixKey
-
-from . import pixclaim
-from .pixclaim.__pixclaim import PixClaim
-
-from . import pixdomain
-from .pixdomain.__pixdomain import PixDomain
-
-from . import pixfraud
-from .pixfraud.__pixfraud import PixFraud
-
-from . import pixinfraction
-from .pixinfraction.__pixinfraction import PixInfraction
-
-from . import pixchargeback
-from .pixchargeback.__pixchargeback import PixChargeback
-
-from . import pixdispute
-from .pixdispute.__pixdispute import PixDispute
-
-from . import pixuser
-from .pixuser.__pixuser import PixUser
-
-from . import pixpullsubscription
-from .pixpullsubscription.__pixpullsubscription import PixPullSubscription
-
-from . import pixpullrequest
-from .pixpullrequest.__pixpullrequest import PixPullRequest
-
-from . import pixkeyholmes
-from .pixkeyholmes.__pixkeyholmes import PixKeyHolmes
-
-from . import pixinternaltransactionreport
-from .pixinternaltransactionreport.__pixinternaltransactionreport import PixInternalTransactionReport
-
-from . import issuingbalance
-from .issuingbalance.__issuingbalance import IssuingBalance
-
-from . import issuingbillinginvoice
-from .issuingbillinginvoice.__issuingbillinginvoice import IssuingBillingInvoice
-
-from . import issuingbillingtransaction
-from .issuingbillingtransaction.__issuingbillingtransaction import IssuingBillingTransaction
-
-from . import creditnote
-from .creditnote.__creditnote import CreditNote
-
-from . import creditsigner
-from .creditsigner.__creditsigner import CreditSigner
-
-from . import creditpreview
-from .creditpreview.__creditpreview import CreditPreview
-
-from . import creditholmes
-from .creditholmes.__creditholmes import CreditHolmes
-
-from . import individualidentity
-from .individualidentity.__individualidentity import IndividualIdentity
-
-from . import individualdocument
-from .individualdocument.__individualdocument import IndividualDocument
-
-from . import individualaccountrequest
-from .individualaccountrequest.__individualaccountrequest import IndividualAccountRequest
-
-from . import individualaccountattachment
-from .individualaccountattachment.__individualaccountattachment import IndividualAccountAttachment
-
-from . import businessidentity
-from .businessidentity.__businessidentity import BusinessIdentity
-
-from . import businessattachment
-from .businessattachment.__businessattachment import BusinessAttachment
-
-from . import dynamicbrcode
-from .dynamicbrcode.__dynamicbrcode import DynamicBrcode
-
-from . import staticbrcode
-from .staticbrcode.__staticbrcode import StaticBrcode
-
-from . import issuingtransaction
-from .issuingtransaction.__issuingtransaction import IssuingTransaction
-
-from . import issuingholder
-from .issuingholder.__issuingholder import IssuingHolder
-
-from . import issuingcard
-from .issuingcard.__issuingcard import IssuingCard
-
-from . import issuingpurchase
-from .issuingpurchase.__issuingpurchase import IssuingPurchase
-
-from . import issuinginvoice
-from .issuinginvoice.__issuinginvoice import IssuingInvoice
-
-from . import issuingwithdrawal
-from .issuingwithdrawal.__issuingwithdrawal import IssuingWithdrawal
-
-from . import issuingproduct
-from .issuingproduct.__issuingproduct import IssuingProduct
-
-from . import issuingrule
-from .issuingrule.__issuingrule import IssuingRule
-
-from . import issuingstock
-from .issuingstock.__issuingstock import IssuingStock
-
-from . import issuingrestock
-from .issuingrestock.__issuingrestock import IssuingRestock
-
-from . import issuingstockrule
-from .issuingstockrule.__issuingstockrule import IssuingStockRule
-
-from . import issuingdesign
-from .issuingdesign.__issuingdesign import IssuingDesign
-
-from . import issuingembossingrequest
-from .issuingembossingrequest.__issuingembossingrequest import IssuingEmbossingRequest
-
-from . import issuingembossingkit
-from .issuingembossingkit.__issuingembossingkit import IssuingEmbossingKit
-
-from . import issuingtoken
-from .issuingtoken.__issuingtoken import IssuingToken
-
-from . import issuingtokendesign
-from .issuingtokendesign.__issuingtokendesign import IssuingTokenDesign
-
-from . import issuingtokenrequest
-from .issuingtokenrequest.__issuingtokenrequest import IssuingTokenRequest
-
-from . import issuingtokenactivation
-from .issuingtokenactivation.__issuingtokenactivation import IssuingTokenActivation
-
-from . import ledger
-from .ledger.__ledger import Ledger
-
-from . import ledgertransaction
-from .ledgertransaction.__ledgertransaction import LedgerTransaction
-
-from . import merchantcategory
-from .merchantcategory.__merchantcategory import MerchantCategory
-
-from . import merchantcountry
-from .merchantcountry.__merchantcountry import MerchantCountry
-
-from . import cardmethod
-from .cardmethod.__cardmethod import CardMethod
-
-from . import webhook
-from .webhook.__webhook import Webhook
-
+from starkcore import Project, Organization, key
+from . import error
+from .utils.pool import Pool
+from .utils.http2 import Http2Pool
+from .utils.retry import Retry
+from .utils.hedge import Hedge
+from .utils.ratelimit import RateLimiter
+from .utils.breaker import CircuitBreaker
+from .utils.hooks import Histogram, Spans
+from .utils.signer import Signer, CoincurveSigner
+from .utils.keycache import PublicKeyCache
+from .utils.client import Client
 from .utils import endtoendid, returnid
 
-from . import request
\ No newline at end of file
+from sys import version_info as _python_version
+from importlib import import_module as _import_module
+
+_packages = [
+    "event",
+    "brcodepreview",
+    "pixrequest",
+    "pixreversal",
+    "pixstatement",
+    "pixbalance",
+    "pixdirector",
+    "pixkey",
+    "pixclaim",
+    "pixdomain",
+    "pixfraud",
+    "pixinfraction",
+    "pixchargeback",
+    "pixdispute",
+    "pixuser",
+    "pixpullsubscription",
+    "pixpullrequest",
+    "pixkeyholmes",
+    "pixinternaltransactionreport",
+    "issuingbalance",
+    "issuingbillinginvoice",
+    "issuingbillingtransaction",
+    "creditnote",
+    "creditsigner",
+    "creditpreview",
+    "creditholmes",
+    "individualidentity",
+    "individualdocument",
+    "individualaccountrequest",
+    "individualaccountattachment",
+    "businessidentity",
+    "businessattachment",
+    "dynamicbrcode",
+    "staticbrcode",
+    "issuingtransaction",
+    "issuingholder",
+    "issuingcard",
+    "issuingpurchase",
+    "issuinginvoice",
+    "issuingwithdrawal",
+    "issuingproduct",
+    "issuingrule",
+    "issuingstock",
+    "issuingrestock",
+    "issuingstockrule",
+    "issuingdesign",
+    "issuingembossingrequest",
+    "issuingembossingkit",
+    "issuingtoken",
+    "issuingtokendesign",
+    "issuingtokenrequest",
+    "issuingtokenactivation",
+    "ledger",
+    "ledgertransaction",
+    "merchantcategory",
+    "merchantcountry",
+    "cardmethod",
+    "webhook",
+    "request",
+]
+
+_classes = {
+    "Event": "event",
+    "BrcodePreview": "brcodepreview",
+    "PixRequest": "pixrequest",
+    "PixReversal": "pixreversal",
+    "PixStatement": "pixstatement",
+    "PixBalance": "pixbalance",
+    "PixDirector": "pixdirector",
+    "PixKey": "pixkey",
+    "PixClaim": "pixclaim",
+    "PixDomain": "pixdomain",
+    "PixFraud": "pixfraud",
+    "PixInfraction": "pixinfraction",
+    "PixChargeback": "pixchargeback",
+    "PixDispute": "pixdispute",
+    "PixUser": "pixuser",
+    "PixPullSubscription": "pixpullsubscription",
+    "PixPullRequest": "pixpullrequest",
+    "PixKeyHolmes": "pixkeyholmes",
+    "PixInternalTransactionReport": "pixinternaltransactionreport",
+    "IssuingBalance": "issuingbalance",
+    "IssuingBillingInvoice": "issuingbillinginvoice",
+    "IssuingBillingTransaction": "issuingbillingtransaction",
+    "CreditNote": "creditnote",
+    "CreditSigner": "creditsigner",
+    "CreditPreview": "creditpreview",
+    "CreditHolmes": "creditholmes",
+    "IndividualIdentity": "individualidentity",
+    "IndividualDocument": "individualdocument",
+    "IndividualAccountRequest": "individualaccountrequest",
+    "IndividualAccountAttachment": "individualaccountattachment",
+    "BusinessIdentity": "businessidentity",
+    "BusinessAttachment": "businessattachment",
+    "DynamicBrcode": "dynamicbrcode",
+    "StaticBrcode": "staticbrcode",
+    "IssuingTransaction": "issuingtransaction",
+    "IssuingHolder": "issuingholder",
+    "IssuingCard": "issuingcard",
+    "IssuingPurchase": "issuingpurchase",
+    "IssuingInvoice": "issuinginvoice",
+    "IssuingWithdrawal": "issuingwithdrawal",
+    "IssuingProduct": "issuingproduct",
+    "IssuingRule": "issuingrule",
+    "IssuingStock": "issuingstock",
+    "IssuingRestock": "issuingrestock",
+    "IssuingStockRule": "issuingstockrule",
+    "IssuingDesign": "issuingdesign",
+    "IssuingEmbossingRequest": "issuingembossingrequest",
+    "IssuingEmbossingKit": "issuingembossingkit",
+    "IssuingToken": "issuingtoken",
+    "IssuingTokenDesign": "issuingtokendesign",
+    "IssuingTokenRequest": "issuingtokenrequest",
+    "IssuingTokenActivation": "issuingtokenactivation",
+    "Ledger": "ledger",
+    "LedgerTransaction": "ledgertransaction",
+    "MerchantCategory": "merchantcategory",
+    "MerchantCountry": "merchantcountry",
+    "CardMethod": "cardmethod",
+    "Webhook": "webhook",
+}
+
+
+def __getattr__(name):
+    if name in _packages:
+        value = _import_module("." + name, __name__)
+    elif name in _classes:
+        package = _classes[name]
+        value = getattr(_import_module(".{package}.__{package}".format(package=package), __name__), name)
+    else:
+        raise AttributeError("module {module!r} has no attribute {name!r}".format(module=__name__, name=name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_packages) | set(_classes))
+
+
+if _python_version < (3, 7):
+    for _name in _packages + list(_classes):
+        __getattr__(_name)
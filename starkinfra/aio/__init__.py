@@ -0,0 +1,19 @@
+"""# Asyncio client
+Every resource package of the SDK is mirrored under starkinfra.aio with awaitable
+functions running on an httpx.AsyncClient, which keeps connections alive according
+to starkinfra.pool. Functions that return lists or single objects must be awaited and
+query functions return asynchronous generators. Requires Python 3.6+ and the httpx
+library (pip install starkinfra[aio]).
+"""
+import starkinfra as _starkinfra
+from ..utils.mirror import mirror as _mirror
+from .utils import rest as _rest
+
+
+async def _next(stream):
+    return await stream.__anext__()
+
+
+for _name in _starkinfra._packages:
+    globals()[_name] = _mirror(getattr(_starkinfra, _name), name="{name}.{package}".format(name=__name__, package=_name),
+                               rest=_rest, next=_next)
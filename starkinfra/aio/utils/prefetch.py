@@ -0,0 +1,46 @@
+from asyncio import Queue, ensure_future
+
+
+_end = object()
+
+
+def prefetch(iterator, size, tasks=None):
+    """# Prefetch an asynchronous iterator on a background task
+    Asynchronous counterpart of starkinfra.utils.prefetch.prefetch, which starts consuming
+    the iterator on a separate task with up to size items buffered ahead of the caller.
+    Must be called with a running event loop.
+    ## Parameters (required):
+    - iterator [asynchronous iterator]: iterator to be consumed in the background. ex: pages of a query
+    - size [integer]: maximum number of items buffered ahead of the caller, or 0 for no limit. ex: 2
+    ## Parameters (optional):
+    - tasks [list, default None]: list to which the worker task is appended, so it can be cancelled even if the returned generator was never iterated.
+    ## Return:
+    - asynchronous generator with the same items as the iterator
+    """
+    queue = Queue(maxsize=size)
+
+    async def work():
+        try:
+            async for item in iterator:
+                await queue.put((item, None))
+            await queue.put((_end, None))
+        except Exception as exception:
+            await queue.put((None, exception))
+
+    worker = ensure_future(work())
+    if tasks is not None:
+        tasks.append(worker)
+    return _consume(queue, worker)
+
+
+async def _consume(queue, worker):
+    try:
+        while True:
+            item, exception = await queue.get()
+            if exception is not None:
+                raise exception
+            if item is _end:
+                return
+            yield item
+    finally:
+        worker.cancel()
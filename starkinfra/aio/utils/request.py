@@ -0,0 +1,143 @@
+from time import time
+from weakref import WeakKeyDictionary
+from asyncio import Event, FIRST_COMPLETED, ensure_future, gather, get_event_loop, sleep, wait
+from starkcore.utils.request import Response
+from ...utils import retry as _retry
+from ...utils import hooks as _hooks
+from ...utils.pool import _key
+from ...utils.request import policy, respond, _failure
+
+
+_clients = WeakKeyDictionary()
+
+
+async def fetch(host, sdk_version, user, method, path, payload=None, query=None, prefix="", api_version="v2",
+                language="en-US", timeout=15, raiseException=True, transport=None, idempotent=None, read=None):
+    _, response = await _drive(policy(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method=method,
+        path=path,
+        payload=payload,
+        query=query,
+        prefix=prefix,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        idempotent=idempotent,
+        read=read,
+    ))
+    if raiseException and response.status != 200:
+        _hooks.emit(response)
+    return respond(response=response, raiseException=raiseException)
+
+
+async def _drive(steps):
+    result = None
+    while True:
+        try:
+            step, argument = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+        if step == "sleep":
+            result = await sleep(argument)
+        elif step == "exchange":
+            result = await _exchange(**argument)
+        else:
+            result = None, await _hedged(
+                send=_responder(argument["send"]),
+                hedge=argument["hedge"],
+                endpoint=argument["endpoint"],
+            )
+
+
+def _responder(send):
+    async def run(sent=None):
+        _, response = await _drive(send(sent=sent))
+        return response
+    return run
+
+
+async def _hedged(send, hedge, endpoint):
+    sent = Event()
+    original = ensure_future(_run(send=send, hedge=hedge, endpoint=endpoint, sent=sent.set))
+    await sent.wait()
+    done, _ = await wait({original}, timeout=hedge.wait(endpoint))
+    if done or not hedge.allow():
+        return await original
+
+    duplicate = ensure_future(_timed(send=send, hedge=hedge, endpoint=endpoint))
+    pending = {original, duplicate}
+    while pending:
+        done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+        for task in done:
+            response = task.result()
+            if response.status not in _retry._statuses:
+                if task is duplicate:
+                    hedge.won()
+                for other in done - {task}:
+                    _hooks.emit(other.result())
+                for other in pending:
+                    other.cancel()
+                return response
+            if pending:
+                _hooks.emit(response)
+    return response
+
+
+async def _run(send, hedge, endpoint, sent):
+    try:
+        return await _timed(send=send, hedge=hedge, endpoint=endpoint, sent=sent)
+    finally:
+        sent()
+
+
+async def _timed(send, hedge, endpoint, sent=None):
+    started = []
+
+    def start():
+        started.append(time())
+        if sent:
+            sent()
+
+    response = await send(sent=start)
+    hedge.observe(endpoint=endpoint, seconds=time() - started[0])
+    return response
+
+
+async def _exchange(pool, user, method, url, body, headers, timeout, stream=False):
+    client = await _client(pool=pool, user=user)
+    try:
+        response = await client.request(method, url, content=body or None, headers=headers, timeout=timeout)
+    except Exception as exception:
+        return None, _failure(exception)
+    return response, Response(status=response.status_code, content=response.content, headers=response.headers)
+
+
+async def _client(pool, user):
+    loop = get_event_loop()
+    if loop not in _clients:
+        clients = {}
+        closer = _closer(clients)
+        await closer.__anext__()
+        _clients[loop] = clients, closer
+    clients, _ = _clients[loop]
+    key = (id(pool), _key(user))
+    if key not in clients:
+        try:
+            from httpx import AsyncClient
+        except ImportError:
+            raise ImportError("starkinfra.aio requires the httpx library (pip install starkinfra[aio])")
+        clients[key] = AsyncClient(transport=pool._transport())
+    return clients[key]
+
+
+async def _closer(clients):
+    # the event loop closes its unfinished asynchronous generators when it shuts down
+    # (asyncio.run does so before closing the loop), which closes the loop's clients
+    try:
+        yield
+    finally:
+        await gather(*[client.aclose() for client in clients.values()], return_exceptions=True)
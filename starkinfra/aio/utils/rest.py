@@ -0,0 +1,292 @@
+from functools import wraps
+from asyncio import Event, Semaphore, gather
+from ...utils import bulk
+from ...utils import operation
+from ...utils.relay import set_relay
+from ...utils.decode import decode
+from .request import fetch
+from .prefetch import prefetch as _prefetch
+from ...utils.partition import windows
+from ...utils.rest import _window_buffer, _chunk_size
+from starkcore.error import InputErrors
+
+
+def _awaitable(function):
+    @wraps(function)
+    async def run(*args, **kwargs):
+        steps = function(*args, **kwargs)
+        response = None
+        while True:
+            try:
+                request = steps.send(response)
+            except StopIteration as stop:
+                return stop.value
+            response = await fetch(**request)
+    return run
+
+
+_get_page = _awaitable(operation.get_page)
+_get_json_page = _awaitable(operation.get_json_page)
+_get_id = _awaitable(operation.get_id)
+_get_content = _awaitable(operation.get_content)
+_get_sub_resource = _awaitable(operation.get_sub_resource)
+_get_sub_resources = _awaitable(operation.get_sub_resources)
+_post_chunk = _awaitable(operation.post_chunk)
+_post_single = _awaitable(operation.post_single)
+_delete_id = _awaitable(operation.delete_id)
+_patch_id = _awaitable(operation.patch_id)
+_put_multi = _awaitable(operation.put_multi)
+_get_raw = _awaitable(operation.get_raw)
+_post_raw = _awaitable(operation.post_raw)
+_patch_raw = _awaitable(operation.patch_raw)
+_put_raw = _awaitable(operation.put_raw)
+_delete_raw = _awaitable(operation.delete_raw)
+
+
+async def _get_stream(sdk_version, host, api_version, user, resource, language, timeout, transport=None, prefetch=None,
+                      parallel=None, progress=None, output=None, raw=False, fields=None, limit=None, **query):
+    if parallel and query.get("after"):
+        pages = _get_window_pages(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            parallel=parallel,
+            progress=progress,
+            limit=limit,
+            **query
+        )
+    else:
+        pages = _get_pages(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            limit=limit,
+            **query
+        )
+        if prefetch:
+            pages = _prefetch(pages, size=prefetch)
+
+    async for entities in pages:
+        batch = decode(resource, entities, output=output, raw=raw, fields=fields)
+        if output:
+            yield batch
+            continue
+        for entity in batch:
+            yield entity
+
+
+async def _get_window_pages(sdk_version, host, api_version, user, resource, language, timeout, transport, parallel,
+                            progress, limit=None, after=None, before=None, **query):
+    tasks = []
+    try:
+        streams = []
+        ranges = windows(after=after, before=before, count=parallel)
+        fetched = [0] * len(ranges)
+        reported = [Event() for _ in ranges]
+        for index, (window_after, window_before) in enumerate(ranges):
+            pages = _get_pages(
+                host=host,
+                sdk_version=sdk_version,
+                user=user,
+                resource=resource,
+                api_version=api_version,
+                language=language,
+                timeout=timeout,
+                transport=transport,
+                limit=limit,
+                after=window_after,
+                before=window_before,
+                **query
+            )
+            if limit is not None:
+                pages = _cap(pages, limit=limit, fetched=fetched, reported=reported, index=index)
+            if progress:
+                pages = _track(pages, after=window_after, before=window_before, progress=progress)
+            streams.append(_prefetch(pages, size=0 if index else _window_buffer, tasks=tasks))
+
+        for pages in streams:
+            async for entities in pages:
+                if limit is not None:
+                    entities = entities[:limit]
+                    limit -= len(entities)
+                yield entities
+                if limit is not None and limit <= 0:
+                    return
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _cap(pages, limit, fetched, reported, index):
+    try:
+        async for entities in pages:
+            fetched[index] += len(entities)
+            reported[index].set()
+            yield entities
+            for event in reported[:index]:
+                await event.wait()
+            if sum(fetched[:index + 1]) >= limit:
+                return
+    finally:
+        reported[index].set()
+
+
+async def _track(pages, after, before, progress):
+    count = 0
+    async for entities in pages:
+        count += len(entities)
+        progress(after=after, before=before, count=count, finished=False)
+        yield entities
+    progress(after=after, before=before, count=count, finished=True)
+
+
+async def _get_pages(sdk_version, host, api_version, user, resource, language, timeout, transport=None, limit=None,
+                     **query):
+    limit_query = {"limit": min(limit, 100) if limit else limit}
+    limit_query.update(query)
+
+    while True:
+        entities, cursor = await _get_json_page(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            **limit_query
+        )
+        yield entities
+
+        if limit:
+            limit -= 100
+            limit_query["limit"] = min(limit, 100)
+
+        limit_query["cursor"] = cursor
+        if not cursor or (limit is not None and limit <= 0):
+            break
+
+
+async def _get_many(sdk_version, host, api_version, user, resource, ids, language, timeout, transport=None,
+                    concurrency=None, id_filter=None, raw=False, fields=None, **query):
+    ids = list(dict.fromkeys(ids))
+    chunks = list(bulk.chunks(ids, size=_chunk_size if id_filter else 1))
+    semaphore = Semaphore(concurrency or 1)
+
+    async def batch(chunk):
+        pages = _get_pages(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            **dict(query, **{id_filter: chunk})
+        )
+        entities = [entity async for page in pages for entity in page]
+        decoded = decode(resource, entities, raw=raw, fields=fields)
+        return {entity[id_filter[:-1]]: value for entity, value in zip(entities, decoded)}
+
+    async def get(chunk):
+        async with semaphore:
+            try:
+                if id_filter:
+                    return await batch(chunk), None
+                return {chunk[0]: await _get_id(
+                    host=host,
+                    sdk_version=sdk_version,
+                    user=user,
+                    resource=resource,
+                    id=chunk[0],
+                    api_version=api_version,
+                    language=language,
+                    timeout=timeout,
+                    transport=transport,
+                    raw=raw,
+                    fields=fields,
+                    **query
+                )}, None
+            except InputErrors as exception:
+                if id_filter:
+                    return None, exception
+                return {}, None
+            except Exception as exception:
+                return None, exception
+
+    results = await gather(*[get(chunk) for chunk in chunks])
+    return bulk.index(ids, chunks, results)
+
+
+async def _post_multi(sdk_version, host, api_version, user, resource, entities, language, timeout, transport=None,
+                      read=False, concurrency=None, **query):
+    chunks = list(bulk.chunks(entities, size=_chunk_size))
+    if len(chunks) < 2:
+        return await _post_chunk(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            entities=chunks[0] if chunks else [],
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            read=read,
+            **query
+        )
+
+    semaphore = Semaphore(concurrency or 1)
+
+    async def post(chunk):
+        async with semaphore:
+            try:
+                return await _post_chunk(
+                    host=host,
+                    sdk_version=sdk_version,
+                    user=user,
+                    resource=resource,
+                    entities=chunk,
+                    api_version=api_version,
+                    language=language,
+                    timeout=timeout,
+                    transport=transport,
+                    read=read,
+                    **query
+                ), None
+            except Exception as exception:
+                return None, exception
+
+    results = await gather(*[post(chunk) for chunk in chunks])
+    return bulk.merge(chunks, results)
+
+
+get_page = set_relay(_get_page)
+get_stream = set_relay(_get_stream)
+get_id = set_relay(_get_id)
+get_many = set_relay(_get_many)
+get_content = set_relay(_get_content)
+get_sub_resource = set_relay(_get_sub_resource)
+get_sub_resources = set_relay(_get_sub_resources)
+post_multi = set_relay(_post_multi)
+put_multi = set_relay(_put_multi)
+post_single = set_relay(_post_single)
+delete_id = set_relay(_delete_id)
+patch_id = set_relay(_patch_id)
+get_raw = set_relay(_get_raw)
+post_raw = set_relay(_post_raw)
+put_raw = set_relay(_put_raw)
+patch_raw = set_relay(_patch_raw)
+delete_raw = set_relay(_delete_raw)
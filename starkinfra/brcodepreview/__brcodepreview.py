@@ -4,6 +4,7 @@ from starkcore.utils.api import from_api_json
 from ..subscription.__subscription import Subscription
 from starkcore.utils.checks import check_datetime, check_datetime_or_date
 from ..subscription.__subscription import _resource as _subscription_resource
+from ..utils.lazy import lazy
 
 
 class BrcodePreview(Resource):
@@ -45,6 +46,18 @@ class BrcodePreview(Resource):
     - tax_id [string]: Payment receiver tax ID. ex: "012.345.678-90"
     """
 
+    __slots__ = (
+        "id", "payer_id", "end_to_end_id", "account_number", "account_type", "amount", "amount_type", "bank_code",
+        "branch_code", "cash_amount", "cashier_bank_code", "cashier_type", "data", "discount_amount", "_due",
+        "_expired", "fine_amount", "interest_amount", "jws", "key_id", "name", "nominal_amount", "reconciliation_id",
+        "reduction_amount", "_scheduled", "status", "_subscription", "tax_id", "description",
+    )
+
+    due = lazy(check_datetime_or_date)
+    expired = lazy(check_datetime)
+    scheduled = lazy(check_datetime_or_date)
+    subscription = lazy(lambda subscription: _parse_subscription(subscription))
+
     def __init__(self, id, payer_id, account_number=None, account_type=None, amount=None, amount_type=None, bank_code=None,
                  branch_code=None, cash_amount=None, cashier_bank_code=None, cashier_type=None, data=None, discount_amount=None, due=None,
                  expired=None, fine_amount=None, interest_amount=None, jws=None, key_id=None, name=None, nominal_amount=None, end_to_end_id=None,
@@ -66,10 +79,10 @@ class BrcodePreview(Resource):
         self.discount_amount = discount_amount
         if(due == ""):
             due = None
-        self.due = check_datetime_or_date(due)
+        self.due = due
         if(expired == ""):
             expired = None
-        self.expired = check_datetime(expired)
+        self.expired = expired
         self.fine_amount = fine_amount
         self.interest_amount = interest_amount
         self.jws = jws
@@ -78,9 +91,9 @@ class BrcodePreview(Resource):
         self.nominal_amount = nominal_amount
         self.reconciliation_id = reconciliation_id
         self.reduction_amount = reduction_amount
-        self.scheduled = check_datetime_or_date(scheduled)
+        self.scheduled = scheduled
         self.status = status
-        self.subscription = _parse_subscription(subscription)
+        self.subscription = subscription
         self.tax_id = tax_id
         self.description = description
 
@@ -107,5 +120,6 @@ def create(previews, user=None):
     return rest.post_multi(
         resource=_resource,
         entities=previews,
+        read=True,
         user=user,
     )
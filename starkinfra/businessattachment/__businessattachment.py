@@ -2,6 +2,7 @@ from base64 import b64encode
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class BusinessAttachment(Resource):
@@ -27,6 +28,13 @@ class BusinessAttachment(Resource):
     - updated [datetime.datetime]: latest update datetime for the BusinessAttachment. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "name", "content", "business_identity_id", "tags", "attachment_id", "status", "_created", "_updated",
+    )
+
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, name, content, business_identity_id, content_type=None, tags=None, id=None, attachment_id=None,
                  status=None, created=None, updated=None):
         Resource.__init__(self, id=id)
@@ -37,8 +45,8 @@ class BusinessAttachment(Resource):
         self.tags = tags
         self.attachment_id = attachment_id
         self.status = status
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
         if content_type:
             if not content:
@@ -64,21 +72,41 @@ def create(attachments, user=None):
     return rest.post_multi(resource=_resource, entities=attachments, user=user)
 
 
-def get(id, expand=None, user=None):
+def get(id, expand=None, raw=False, fields=None, user=None):
     """# Retrieve a specific BusinessAttachment
     Receive a single BusinessAttachment object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
     - expand [list of strings, default None]: fields to expand information. ex: ["content"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - BusinessAttachment object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, expand=expand, user=user)
+    return rest.get_id(resource=_resource, id=id, expand=expand, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, expand=None, raw=False, fields=None, user=None):
+    """# Retrieve specific BusinessAttachments
+    Receive BusinessAttachment objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - expand [list of strings, default None]: fields to expand information. ex: ["content"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of BusinessAttachment objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", expand=expand, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve BusinessAttachments
     Receive a generator of BusinessAttachment objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -88,6 +116,11 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "canceled", "approved", "denied"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of BusinessAttachment objects with updated attributes
@@ -100,11 +133,17 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         status=status,
         tags=tags,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged BusinessAttachments
     Receive a list of up to 100 BusinessAttachment objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -116,6 +155,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "canceled", "approved", "denied"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of BusinessAttachment objects with updated attributes
@@ -130,6 +172,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         status=status,
         tags=tags,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,8 +1,10 @@
+from functools import partial
 from ...utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from starkcore.utils.api import from_api_json
 from ..__businessattachment import _resource as _business_attachment_resource
+from ...utils.lazy import lazy
 
 
 class Log(Resource):
@@ -19,32 +21,56 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "_created", "type", "errors", "_attachment")
+
+    created = lazy(check_datetime)
+    attachment = lazy(partial(from_api_json, _business_attachment_resource))
+
     def __init__(self, id, created, type, errors, attachment):
         Resource.__init__(self, id=id)
 
-        self.created = check_datetime(created)
+        self.created = created
         self.type = type
         self.errors = errors
-        self.attachment = from_api_json(_business_attachment_resource, attachment)
+        self.attachment = attachment
 
 
 _resource = {"class": Log, "name": "BusinessAttachmentLog"}
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific businessattachment.Log
     Receive a single businessattachment.Log object previously created by the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - businessattachment.Log object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific businessattachment.Logs
+    Receive businessattachment.Log objects previously created by the Stark Infra API by their ids
+    They are fetched by one request per id, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of businessattachment.Log objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter=None, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, attachment_ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, attachment_ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve businessattachment.Logs
     Receive a generator of businessattachment.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -53,6 +79,11 @@ def query(limit=None, after=None, before=None, types=None, attachment_ids=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "canceled", "approved", "denied"]
     - attachment_ids [list of strings, default None]: list of BusinessAttachment ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of businessattachment.Log objects with updated attributes
@@ -64,11 +95,17 @@ def query(limit=None, after=None, before=None, types=None, attachment_ids=None,
         before=check_date(before),
         types=types,
         attachment_ids=attachment_ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, types=None, attachment_ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, types=None, attachment_ids=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged businessattachment.Logs
     Receive a list of up to 100 businessattachment.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -79,6 +116,9 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, attachmen
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "canceled", "approved", "denied"]
     - attachment_ids [list of strings, default None]: list of BusinessAttachment ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of businessattachment.Log objects with updated attributes
@@ -92,5 +132,8 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, attachmen
         before=check_date(before),
         types=types,
         attachment_ids=attachment_ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class BusinessIdentity(Resource):
@@ -30,6 +31,14 @@ class BusinessIdentity(Resource):
     - updated [datetime.datetime]: latest update datetime for the BusinessIdentity. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "tax_id", "tags", "name", "tax_id_status", "insight_tax_id", "insight_document_type", "num_pages",
+        "representatives", "attachments", "rules", "status", "_created", "_updated",
+    )
+
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, tax_id, tags=None, id=None, name=None, tax_id_status=None, insight_tax_id=None,
                  insight_document_type=None, num_pages=None, representatives=None, attachments=None, rules=None,
                  status=None, created=None, updated=None):
@@ -46,8 +55,8 @@ class BusinessIdentity(Resource):
         self.attachments = attachments
         self.rules = rules
         self.status = status
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": BusinessIdentity, "name": "BusinessIdentity"}
@@ -66,20 +75,39 @@ def create(identities, user=None):
     return rest.post_multi(resource=_resource, entities=identities, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific BusinessIdentity
     Receive a single BusinessIdentity object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - BusinessIdentity object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific BusinessIdentities
+    Receive BusinessIdentity objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of BusinessIdentity objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, tax_ids=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, tax_ids=None, parallel=None,
+          progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve BusinessIdentities
     Receive a generator of BusinessIdentity objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -90,6 +118,11 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tax_ids [list of strings, default None]: list of company tax IDs (CNPJ) to filter retrieved objects. ex: ["20.018.183/0001-80"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of BusinessIdentity objects with updated attributes
@@ -103,11 +136,17 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         tags=tags,
         ids=ids,
         tax_ids=tax_ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, tax_ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, tax_ids=None,
+         output=None, raw=False, fields=None, user=None):
     """# Retrieve paged BusinessIdentities
     Receive a list of up to 100 BusinessIdentity objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -120,6 +159,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tax_ids [list of strings, default None]: list of company tax IDs (CNPJ) to filter retrieved objects. ex: ["20.018.183/0001-80"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of BusinessIdentity objects with updated attributes
@@ -135,6 +177,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         tags=tags,
         ids=ids,
         tax_ids=tax_ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -12,6 +12,8 @@ class CardMethod(SubResource):
     - number [string]: method's number. ex: "81"
     """
 
+    __slots__ = ("code", "name", "number")
+
     def __init__(self, code, name=None, number=None):
         self.code = code
         self.name = name
@@ -21,11 +23,14 @@ class CardMethod(SubResource):
 _resource = {"class": CardMethod, "name": "CardMethod"}
 
 
-def query(search=None, user=None):
+def query(search=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve CardMethods
     Receive a generator of CardMethod objects available in the Stark Infra API
     ## Parameters (optional):
     - search [string, default None]: keyword to search for code, name or number. ex:"token"
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of CardMethod objects with updated attributes
@@ -33,5 +38,8 @@ def query(search=None, user=None):
     return rest.get_stream(
         resource=_resource,
         search=search,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -10,6 +10,7 @@ from ..utils import rest
 from starkcore.utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date, check_datetime_or_date
+from ..utils.lazy import lazy
 
 
 class CreditNote(Resource):
@@ -56,6 +57,21 @@ class CreditNote(Resource):
     - updated [datetime.datetime]: latest update datetime for the CreditNote. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "template_id", "name", "tax_id", "_scheduled", "_invoices", "_signers", "external_id", "street_line_1",
+        "street_line_2", "district", "city", "state_code", "zip_code", "nominal_amount", "amount", "rebate_amount",
+        "tags", "expiration", "_rules", "document_id", "status", "transaction_ids", "workspace_id",
+        "debtor_workspace_id", "tax_amount", "nominal_interest", "interest", "_created", "_updated", "payment",
+        "payment_type",
+    )
+
+    scheduled = lazy(check_datetime_or_date)
+    invoices = lazy(lambda invoices: _parse_invoices(invoices))
+    signers = lazy(lambda signers: _parse_signers(signers))
+    rules = lazy(parse_rules)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, template_id, name, tax_id, scheduled, invoices, payment, signers, external_id,
                  street_line_1, street_line_2, district, city, state_code, zip_code, payment_type=None,
                  nominal_amount=None, amount=None, rebate_amount=None, tags=None, expiration=None, rules=None,
@@ -67,9 +83,9 @@ class CreditNote(Resource):
         self.template_id = template_id
         self.name = name
         self.tax_id = tax_id
-        self.scheduled = check_datetime_or_date(scheduled)
-        self.invoices = _parse_invoices(invoices)
-        self.signers = _parse_signers(signers)
+        self.scheduled = scheduled
+        self.invoices = invoices
+        self.signers = signers
         self.external_id = external_id
         self.street_line_1 = street_line_1
         self.street_line_2 = street_line_2
@@ -82,7 +98,7 @@ class CreditNote(Resource):
         self.rebate_amount = rebate_amount
         self.tags = tags
         self.expiration = expiration
-        self.rules = parse_rules(rules)
+        self.rules = rules
         self.document_id = document_id
         self.status = status
         self.transaction_ids = transaction_ids
@@ -91,8 +107,8 @@ class CreditNote(Resource):
         self.tax_amount = tax_amount
         self.nominal_interest = nominal_interest
         self.interest = interest
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
         self.payment, self.payment_type = _parse_payment(payment=payment, payment_type=payment_type)
 
@@ -121,6 +137,9 @@ def _parse_invoices(invoices):
 
 
 def _parse_payment(payment, payment_type):
+    if payment is None:
+        return None, payment_type
+
     if isinstance(payment, dict):
         try:
             return from_api_json(*({
@@ -156,20 +175,39 @@ def create(notes, user=None):
     return rest.post_multi(resource=_resource, entities=notes, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific CreditNote
     Receive a single CreditNote object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - CreditNote object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific CreditNotes
+    Receive CreditNote objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of CreditNote objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve CreditNotes
     Receive a generator of CreditNote objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -179,6 +217,11 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["canceled", "created", "expired", "failed", "processing", "signed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of CreditNote objects with updated attributes
@@ -191,11 +234,17 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
         status=status,
         tags=tags,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged CreditNotes
     Receive a list of up to 100 CreditNote objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -207,6 +256,9 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["canceled", "created", "expired", "failed", "processing", "signed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of CreditNote objects with updated attributes
@@ -221,6 +273,9 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
         status=status,
         tags=tags,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
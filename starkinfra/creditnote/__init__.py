@@ -7,4 +7,4 @@ from .invoice.__invoice import Invoice
 from .invoice.__discount import Discount
 from .invoice.__description import Description
 from .__rule import Rule
-from .__creditnote import create, get, query, page, cancel, pdf, payment
+from .__creditnote import create, get, get_many, query, page, cancel, pdf, payment
@@ -11,6 +11,8 @@ class Rule(SubResource):
     - value [string]: Value of the rule. ex: "scheduled", "instant", "never"
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -10,6 +10,8 @@ class Description(SubResource):
     - value [string, default ""]: amount related to the described key. ex: "R$100,00"
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key, value=None):
         self.key = key
         self.value = value
@@ -9,6 +9,8 @@ class Discount(SubResource):
     - due [datetime.datetime or string]: due datetime for the discount
     """
 
+    __slots__ = ("percentage", "due")
+
     def __init__(self, percentage, due):
         self.percentage = percentage
         self.due = due
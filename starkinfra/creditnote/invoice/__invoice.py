@@ -5,6 +5,7 @@ from .__discount import Discount
 from .__discount import resource as _discount_resource
 from .__description import Description
 from .__description import resource as _description_resource
+from ...utils.lazy import lazy
 
 
 class Invoice(Resource):
@@ -38,6 +39,18 @@ class Invoice(Resource):
     - updated [datetime.datetime]: latest update datetime for the Invoice. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "amount", "_due", "expiration", "fine", "interest", "tags", "_descriptions", "name", "tax_id", "pdf",
+        "link", "nominal_amount", "fine_amount", "interest_amount", "discount_amount", "_discounts", "brcode", "status",
+        "fee", "transaction_ids", "_created", "_updated",
+    )
+
+    due = lazy(check_datetime_or_date)
+    descriptions = lazy(lambda descriptions: parse_descriptions(descriptions))
+    discounts = lazy(lambda discounts: parse_discounts(discounts))
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, amount, due=None, expiration=None, tags=None, descriptions=None, id=None, name=None, tax_id=None,
                  pdf=None, link=None, fine=None, interest=None, nominal_amount=None, fine_amount=None,
                  interest_amount=None, discount_amount=None, discounts=None, brcode=None, status=None, fee=None,
@@ -45,12 +58,12 @@ class Invoice(Resource):
         Resource.__init__(self, id=id)
 
         self.amount = amount
-        self.due = check_datetime_or_date(due)
+        self.due = due
         self.expiration = check_timedelta(expiration)
         self.fine = fine
         self.interest = interest
         self.tags = tags
-        self.descriptions = parse_descriptions(descriptions)
+        self.descriptions = descriptions
         self.name = name
         self.tax_id = tax_id
         self.pdf = pdf
@@ -59,13 +72,13 @@ class Invoice(Resource):
         self.fine_amount = fine_amount
         self.interest_amount = interest_amount
         self.discount_amount = discount_amount
-        self.discounts = parse_discounts(discounts)
+        self.discounts = discounts
         self.brcode = brcode
         self.status = status
         self.fee = fee
         self.transaction_ids = transaction_ids
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 def parse_discounts(discounts):
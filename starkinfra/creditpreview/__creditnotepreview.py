@@ -1,6 +1,7 @@
 from starkcore.utils.api import from_api_json
 from starkcore.utils.subresource import SubResource
 from ..creditnote.invoice.__invoice import Invoice, _resource as _invoice_resource
+from ..utils.lazy import lazy
 
 
 class CreditNotePreview(SubResource):
@@ -29,6 +30,13 @@ class CreditNotePreview(SubResource):
     - tax_amount [integer]: tax amount included in the CreditNote. ex: 100
     """
 
+    __slots__ = (
+        "type", "nominal_amount", "scheduled", "tax_id", "_invoices", "nominal_interest", "initial_due", "count",
+        "initial_amount", "interval", "rebate_amount", "amount", "interest", "tax_amount",
+    )
+
+    invoices = lazy(lambda invoices: _parse_optional_invoices(invoices))
+
     def __init__(self, type, nominal_amount, scheduled, tax_id, invoices=None, nominal_interest=None,
                  initial_due=None, count=None, initial_amount=None, interval=None, rebate_amount=None,
                  amount=None, interest=None, tax_amount=None):
@@ -36,7 +44,7 @@ class CreditNotePreview(SubResource):
         self.nominal_amount = nominal_amount
         self.scheduled = scheduled
         self.tax_id = tax_id
-        self.invoices = _parse_optional_invoices(invoices)
+        self.invoices = invoices
         self.nominal_interest = nominal_interest
         self.initial_due = initial_due
         self.count = count
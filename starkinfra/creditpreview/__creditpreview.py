@@ -13,6 +13,8 @@ class CreditPreview(SubResource):
     - type [string]: Credit type. ex: "credit-note"
     """
 
+    __slots__ = ("credit", "type")
+
     def __init__(self, type=None, credit=None):
         self.credit, self.type = _parse_credit(credit=credit, type=type)
 
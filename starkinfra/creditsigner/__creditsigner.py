@@ -13,6 +13,8 @@ class CreditSigner(Resource):
     - id [string]: unique id returned when the CreditSigner is created. ex: "5656565656565656"
     """
 
+    __slots__ = ("id", "name", "contact", "method")
+
     def __init__(self, name, contact, method, id=None):
         Resource.__init__(self, id=id)
         self.name = name
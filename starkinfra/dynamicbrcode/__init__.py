@@ -1 +1 @@
-from .__dynamicbrcode import create, get, query, page, verify, response_due, response_instant
+from .__dynamicbrcode import create, get, get_many, query, page, verify, response_due, response_instant
@@ -0,0 +1,58 @@
+from starkcore.error import *
+
+
+class ChunkError(StarkError):
+    """# ChunkError
+    Failure of a single chunk of a bulk request.
+    ## Attributes:
+    - offset [integer]: position of the first entity of the chunk in the input. ex: 200
+    - entities [list]: entities sent in the chunk, in input order.
+    - error [Exception]: exception raised by the chunk request. ex: starkinfra.error.InputErrors
+    """
+
+    def __init__(self, offset, entities, error):
+        self.offset = offset
+        self.entities = entities
+        self.error = error
+        super(Exception, self).__init__("chunk at offset {offset} with {count} entities failed: {error}".format(
+            offset=offset,
+            count=len(entities),
+            error=error,
+        ))
+
+
+class BulkError(StarkError):
+    """# BulkError
+    Raised when some chunks of a bulk request fail while others succeed.
+    ## Attributes:
+    - entities [list or dictionary]: created entities in input order, or retrieved entities by id for get_many, with None at the positions of entities from failed chunks.
+    - errors [list of ChunkError]: failures of each rejected chunk.
+    """
+
+    def __init__(self, entities, errors):
+        self.entities = entities
+        self.errors = errors
+        super(Exception, self).__init__("{failed} of the bulk chunks failed: {errors}".format(
+            failed=len(errors),
+            errors="; ".join(str(error) for error in errors),
+        ))
+
+
+class CircuitOpenError(StarkError):
+    """# CircuitOpenError
+    Raised instead of sending a request whose host and resource have an open circuit breaker.
+    ## Attributes:
+    - scope [string]: host and resource of the open circuit. ex: "sandbox.api.starkinfra.com pix-key"
+    - state [string]: state of the circuit. Options: "open", "half-open"
+    - retry_in [float]: seconds until the circuit sends its next probe. ex: 12.5
+    """
+
+    def __init__(self, scope, state, retry_in):
+        self.scope = scope
+        self.state = state
+        self.retry_in = retry_in
+        super(Exception, self).__init__("circuit for {scope} is {state}, retry in {retry_in:.1f} seconds".format(
+            scope=scope,
+            state=state,
+            retry_in=retry_in,
+        ))
@@ -1,41 +1,29 @@
+from importlib import import_module
 from ..utils import rest
 from ..utils.parse import parse_and_verify
 from starkcore.utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
-from ..creditnote.log.__log import _resource as _creditnote_log_resource
-from ..pixkey.log.__log import _resource as _pixkey_log_resource
-from ..pixclaim.log.__log import _resource as _pixclaim_log_resource
-from ..pixrequest.log.__log import _resource as _pixrequest_log_resource
-from ..pixreversal.log.__log import _resource as _pixreversal_log_resource
-from ..pixchargeback.log.__log import _resource as _pixchargeback_log_resource
-from ..pixdispute.log.__log import _resource as _pixdispute_log_resource
-from ..pixinfraction.log.__log import _resource as _pixinfraction_log_resource
-from ..pixpullsubscription.log.__log import _resource as _pixpullsubscription_log_resource
-from ..pixpullrequest.log.__log import _resource as _pixpullrequest_log_resource
-from ..issuingcard.log.__log import _resource as _issuingcard_log_resource
-from ..issuinginvoice.log.__log import _resource as _issuinginvoice_log_resource
-from ..issuingpurchase.log.__log import _resource as _issuingpurchase_log_resource
-from ..businessidentity.log.__log import _resource as _businessidentity_log_resource
-
-
-_resource_by_subscription = {
-    "pix-key": _pixkey_log_resource,
-    "pix-claim": _pixclaim_log_resource,
-    "pix-chargeback": _pixchargeback_log_resource,
-    "pix-dispute": _pixdispute_log_resource,
-    "pix-infraction": _pixinfraction_log_resource,
-    "pix-request.in": _pixrequest_log_resource,
-    "pix-request.out": _pixrequest_log_resource,
-    "pix-reversal.in": _pixreversal_log_resource,
-    "pix-reversal.out": _pixreversal_log_resource,
-    "pix-pull-subscription": _pixpullsubscription_log_resource,
-    "pix-pull-request": _pixpullrequest_log_resource,
-    "issuing-card": _issuingcard_log_resource,
-    "issuing-invoice": _issuinginvoice_log_resource,
-    "issuing-purchase": _issuingpurchase_log_resource,
-    "credit-note": _creditnote_log_resource,
-    "business-identity": _businessidentity_log_resource,
+from ..utils.lazy import lazy
+
+
+_log_package_by_subscription = {
+    "pix-key": "pixkey",
+    "pix-claim": "pixclaim",
+    "pix-chargeback": "pixchargeback",
+    "pix-dispute": "pixdispute",
+    "pix-infraction": "pixinfraction",
+    "pix-request.in": "pixrequest",
+    "pix-request.out": "pixrequest",
+    "pix-reversal.in": "pixreversal",
+    "pix-reversal.out": "pixreversal",
+    "pix-pull-subscription": "pixpullsubscription",
+    "pix-pull-request": "pixpullrequest",
+    "issuing-card": "issuingcard",
+    "issuing-invoice": "issuinginvoice",
+    "issuing-purchase": "issuingpurchase",
+    "credit-note": "creditnote",
+    "business-identity": "businessidentity",
 }
 
 
@@ -53,35 +41,71 @@ class Event(Resource):
     - workspace_id [string]: ID of the Workspace that generated this Event. Mostly used when multiple Workspaces have Webhooks registered to the same endpoint. ex: "4545454545454545"
     """
 
+    __slots__ = ("id", "_log", "_created", "is_delivered", "subscription", "workspace_id")
+
+    created = lazy(check_datetime)
+
     def __init__(self, log, created, is_delivered, subscription, workspace_id, id):
         Resource.__init__(self, id=id)
 
         self.log = log
-        self.created = check_datetime(created)
+        self.created = created
         self.is_delivered = is_delivered
         self.subscription = subscription
         self.workspace_id = workspace_id
-        if subscription in _resource_by_subscription:
-            self.log = from_api_json(resource=_resource_by_subscription[subscription], json=log)
+
+    @property
+    def log(self):
+        if isinstance(self._log, dict) and self.subscription in _log_package_by_subscription:
+            self._log = from_api_json(resource=_log_resource(self.subscription), json=self._log)
+        return self._log
+
+    @log.setter
+    def log(self, log):
+        self._log = log
 
 
 _resource = {"class": Event, "name": "Event"}
 
 
-def get(id, user=None):
+def _log_resource(subscription):
+    package = _log_package_by_subscription[subscription]
+    return import_module("..{package}.log.__log".format(package=package), __package__)._resource
+
+
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific notification Event
     Receive a single notification Event object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - Event object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific notification Events
+    Receive notification Event objects previously created in the Stark Infra API by their ids
+    They are fetched by one request per id, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of Event objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter=None, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, is_delivered=None, user=None):
+def query(limit=None, after=None, before=None, is_delivered=None, parallel=None, progress=None, output=None,
+          raw=False, fields=None, user=None):
     """# Retrieve notification Events
     Receive a generator of notification Event objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -89,6 +113,11 @@ def query(limit=None, after=None, before=None, is_delivered=None, user=None):
     - after [datetime.date or string, default None]: date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - is_delivered [bool, default None]: bool to filter successfully delivered events. ex: True or False
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of Event objects with updated attributes
@@ -99,11 +128,17 @@ def query(limit=None, after=None, before=None, is_delivered=None, user=None):
         after=check_date(after),
         before=check_date(before),
         is_delivered=is_delivered,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, output=None, raw=False, fields=None,
+         user=None):
     """# Retrieve paged Events
     Receive a list of up to 100 Event objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -113,6 +148,9 @@ def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, us
     - after [datetime.date or string, default None]: date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - is_delivered [bool, default None]: bool to filter successfully delivered events. ex: True or False
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of Event objects with updated attributes
@@ -125,6 +163,9 @@ def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, us
         after=check_date(after),
         before=check_date(before),
         is_delivered=is_delivered,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,3 +1,3 @@
-from .__event import query, page, get, parse, delete, update
+from .__event import query, page, get, get_many, parse, delete, update
 from .attempt.__attempt import Attempt
 from . import attempt
@@ -1 +1 @@
-from .__attempt import query, page, get
+from .__attempt import query, page, get, get_many
@@ -2,6 +2,7 @@ from base64 import b64encode
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class IndividualAccountAttachment(Resource):
@@ -24,6 +25,10 @@ class IndividualAccountAttachment(Resource):
     - created [datetime.datetime]: creation datetime for the IndividualAccountAttachment. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "type", "account_request_id", "tags", "status", "_created", "content", "content_type")
+
+    created = lazy(check_datetime)
+
     def __init__(self, type, content, account_request_id, content_type=None, tags=None, id=None, status=None,
                  created=None):
         Resource.__init__(self, id=id)
@@ -32,7 +37,7 @@ class IndividualAccountAttachment(Resource):
         self.account_request_id = account_request_id
         self.tags = tags
         self.status = status
-        self.created = check_datetime(created)
+        self.created = created
         self.content = content
         self.content_type = content_type
 
@@ -72,20 +77,39 @@ def create(attachments, user=None):
     return rest.post_multi(resource=_resource, entities=attachments, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IndividualAccountAttachment
     Receive a single IndividualAccountAttachment object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IndividualAccountAttachment object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IndividualAccountAttachments
+    Receive IndividualAccountAttachment objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IndividualAccountAttachment objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve IndividualAccountAttachments
     Receive a generator of IndividualAccountAttachment objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -95,6 +119,11 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "success", "failed", "deleted"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IndividualAccountAttachment objects with updated attributes
@@ -107,11 +136,17 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         status=status,
         tags=tags,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged IndividualAccountAttachments
     Receive a list of up to 100 IndividualAccountAttachment objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -123,6 +158,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "success", "failed", "deleted"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IndividualAccountAttachment objects with updated attributes
@@ -137,6 +175,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         status=status,
         tags=tags,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
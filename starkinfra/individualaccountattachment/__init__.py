@@ -1,3 +1,3 @@
-from .__individualaccountattachment import create, get, query, page, cancel
+from .__individualaccountattachment import create, get, get_many, query, page, cancel
 from .log.__log import Log
 from . import log
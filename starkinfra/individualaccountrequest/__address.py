@@ -14,6 +14,8 @@ class Address(SubResource):
     - zip_code [string]: ZIP code (BR CEP), formatted or digit-only. ex: "05724005"
     """
 
+    __slots__ = ("street", "number", "neighborhood", "city", "state", "zip_code")
+
     def __init__(self, street=None, number=None, neighborhood=None, city=None, state=None, zip_code=None):
         self.street = street
         self.number = number
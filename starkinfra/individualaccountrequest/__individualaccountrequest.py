@@ -4,6 +4,7 @@ from starkcore.utils.checks import check_datetime, check_date
 from starkcore.utils.api import from_api_json
 from .__address import Address
 from .__address import resource as _address_resource
+from ..utils.lazy import lazy
 
 
 class IndividualAccountRequest(Resource):
@@ -30,21 +31,30 @@ class IndividualAccountRequest(Resource):
     - updated [datetime.datetime]: latest update datetime for the IndividualAccountRequest. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "name", "tax_id", "_address", "income", "birth_date", "tags", "account_type", "flags", "status",
+        "_created", "_updated",
+    )
+
+    address = lazy(lambda address: _parse_address(address))
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, name, tax_id, address, income, birth_date=None, tags=None, id=None, account_type=None,
                  flags=None, status=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.name = name
         self.tax_id = tax_id
-        self.address = _parse_address(address)
+        self.address = address
         self.income = income
         self.birth_date = check_date(birth_date or None)
         self.tags = tags
         self.account_type = account_type
         self.flags = flags
         self.status = status
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IndividualAccountRequest, "name": "IndividualAccountRequest"}
@@ -71,20 +81,39 @@ def create(requests, user=None):
     return rest.post_multi(resource=_resource, entities=requests, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IndividualAccountRequest
     Receive a single IndividualAccountRequest object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IndividualAccountRequest object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IndividualAccountRequests
+    Receive IndividualAccountRequest objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IndividualAccountRequest objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve IndividualAccountRequests
     Receive a generator of IndividualAccountRequest objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -94,6 +123,11 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "canceled", "processing", "failed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IndividualAccountRequest objects with updated attributes
@@ -106,11 +140,17 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
         status=status,
         tags=tags,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None, before=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged IndividualAccountRequests
     Receive a list of up to 100 IndividualAccountRequest objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -122,6 +162,9 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "canceled", "processing", "failed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IndividualAccountRequest objects with updated attributes
@@ -136,6 +179,9 @@ def page(cursor=None, limit=None, status=None, tags=None, ids=None, after=None,
         status=status,
         tags=tags,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -166,4 +212,4 @@ def update(id, status=None, name=None, tax_id=None, address=None, income=None, b
         "birth_date": check_date(birth_date),
         "tags": tags,
     }
-    return rest.patch_id(resource=_resource, id=id, user=user, payload=payload)
\ No newline at end of file
+    return rest.patch_id(resource=_resource, id=id, user=user, payload=payload)
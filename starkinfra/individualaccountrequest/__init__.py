@@ -1,4 +1,4 @@
-from .__individualaccountrequest import create, get, query, page, update
+from .__individualaccountrequest import create, get, get_many, query, page, update
 from .__address import Address
 from .log.__log import Log
 from . import log
@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__individualdocument import create, get, query, page
+from .__individualdocument import create, get, get_many, query, page
@@ -15,6 +15,8 @@ class IssuingBalance(Resource):
     - updated [datetime.datetime]: latest update datetime for the IssuingBalance. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "amount", "currency", "updated")
+
     def __init__(self, id, amount, currency, updated):
         Resource.__init__(self, id=id)
 
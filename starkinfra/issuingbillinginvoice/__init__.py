@@ -1 +1 @@
-from .__issuingbillinginvoice import get, query, page
+from .__issuingbillinginvoice import get, get_many, query, page
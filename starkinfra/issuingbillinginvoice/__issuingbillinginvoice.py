@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class IssuingBillingInvoice(Resource):
@@ -8,6 +9,17 @@ class IssuingBillingInvoice(Resource):
     Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-invoice
     """
 
+    __slots__ = (
+        "id", "tax_id", "name", "fine", "interest", "status", "amount", "nominal_amount", "brcode", "link", "_due",
+        "_start", "_end", "_created", "_updated",
+    )
+
+    due = lazy(check_datetime)
+    start = lazy(check_datetime)
+    end = lazy(check_datetime)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, id=None, name=None, tax_id=None, fine=None, interest=None, status=None, amount=None,
                  nominal_amount=None, brcode=None, link=None, due=None, start=None, end=None, created=None,
                  updated=None):
@@ -22,24 +34,32 @@ class IssuingBillingInvoice(Resource):
         self.nominal_amount = nominal_amount
         self.brcode = brcode
         self.link = link
-        self.due = check_datetime(due)
-        self.start = check_datetime(start)
-        self.end = check_datetime(end)
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.due = due
+        self.start = start
+        self.end = end
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingBillingInvoice, "name": "IssuingBillingInvoice"}
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
+    """# IssuingBillingInvoice object
+    Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-invoice
+    """
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
     """# IssuingBillingInvoice object
     Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-invoice
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_many(resource=_resource, ids=ids, id_filter=None, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, id=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, id=None, tags=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# IssuingBillingInvoice object
     Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-invoice
     """
@@ -51,11 +71,17 @@ def query(limit=None, after=None, before=None, status=None, id=None, tags=None,
         id=id,
         tags=tags,
         limit=limit,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, output=None, raw=False,
+         fields=None, user=None):
     """# IssuingBillingInvoice object
     Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-invoice
     """
@@ -67,5 +93,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         before=check_datetime(before),
         tags=tags,
         limit=limit,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class IssuingBillingTransaction(Resource):
@@ -8,6 +9,14 @@ class IssuingBillingTransaction(Resource):
     Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-transaction
     """
 
+    __slots__ = (
+        "id", "amount", "invoice_id", "installment", "installment_count", "balance", "holder_name", "source",
+        "external_id", "description", "card_ending", "tax", "rate", "merchant_amount", "merchant_currency_code",
+        "_created",
+    )
+
+    created = lazy(check_datetime)
+
     def __init__(self, id=None, amount=None, invoice_id=None, installment=None, installment_count=None,
                  balance=None, holder_name=None, source=None, external_id=None, description=None, card_ending=None,
                  tax=None, rate=None, merchant_amount=None, merchant_currency_code=None, created=None):
@@ -27,13 +36,14 @@ class IssuingBillingTransaction(Resource):
         self.rate = rate
         self.merchant_amount = merchant_amount
         self.merchant_currency_code = merchant_currency_code
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": IssuingBillingTransaction, "name": "IssuingBillingTransaction"}
 
 
-def query(limit=None, after=None, before=None, invoice_id=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, invoice_id=None, tags=None, parallel=None, progress=None, output=None,
+          raw=False, fields=None, user=None):
     """# IssuingBillingTransaction object
     Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-transaction
     """
@@ -44,10 +54,16 @@ def query(limit=None, after=None, before=None, invoice_id=None, tags=None, user=
         invoice_id=invoice_id,
         tags=tags,
         limit=limit,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
-def page(cursor=None, limit=None, after=None, before=None, invoice_id=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, invoice_id=None, tags=None, output=None, raw=False,
+         fields=None, user=None):
     """# IssuingBillingTransaction object
     Check out our API Documentation at https://starkinfra.com/docs/api#issuing-billing-transaction
     """
@@ -59,5 +75,8 @@ def page(cursor=None, limit=None, after=None, before=None, invoice_id=None, tags
         tags=tags,
         invoice_id=invoice_id,
         limit=limit,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
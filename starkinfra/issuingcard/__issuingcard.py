@@ -2,6 +2,7 @@ from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_date, check_datetime
 from ..utils import rest
 from ..issuingrule import parse_rules
+from ..utils.lazy import lazy
 
 
 class IssuingCard(Resource):
@@ -35,6 +36,17 @@ class IssuingCard(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingCard. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "holder_name", "holder_tax_id", "holder_external_id", "display_name", "_rules", "product_id", "tags",
+        "street_line_1", "street_line_2", "district", "city", "state_code", "zip_code", "holder_id", "type", "status",
+        "number", "security_code", "_expiration", "_created", "_updated",
+    )
+
+    rules = lazy(parse_rules)
+    expiration = lazy(check_datetime)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, holder_name, holder_tax_id, holder_external_id, display_name=None, rules=None, product_id=None,
                  tags=None, street_line_1=None, street_line_2=None, district=None, city=None, state_code=None,
                  zip_code=None, id=None, holder_id=None, type=None, status=None, number=None, security_code=None,
@@ -45,7 +57,7 @@ class IssuingCard(Resource):
         self.holder_tax_id = holder_tax_id
         self.holder_external_id = holder_external_id
         self.display_name = display_name
-        self.rules = parse_rules(rules)
+        self.rules = rules
         self.product_id = product_id
         self.tags = tags
         self.street_line_1 = street_line_1
@@ -59,9 +71,9 @@ class IssuingCard(Resource):
         self.status = status
         self.number = number
         self.security_code = security_code
-        self.expiration = check_datetime(expiration)
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.expiration = expiration
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingCard, "name": "IssuingCard"}
@@ -82,7 +94,7 @@ def create(cards, expand=None, user=None):
 
 
 def query(limit=None, ids=None, after=None, before=None, status=None, types=None, holder_ids=None, tags=None,
-          expand=None, user=None):
+          expand=None, parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingCards
     Receive a generator of IssuingCard objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -95,6 +107,11 @@ def query(limit=None, ids=None, after=None, before=None, status=None, types=None
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - expand [list of strings, default None]: fields to expand information. ex: ["rules", "security_code", "number", "expiration"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingCard objects with updated attributes
@@ -110,12 +127,17 @@ def query(limit=None, ids=None, after=None, before=None, status=None, types=None
         holder_ids=holder_ids,
         tags=tags,
         expand=expand,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None, types=None, holder_ids=None,
-         tags=None, expand=None, user=None):
+         tags=None, expand=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingCards
     Receive a list of IssuingCard objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -129,6 +151,9 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - expand [list of strings, default None]: fields to expand information. ex: ["rules", "security_code", "number", "expiration"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingCard objects with updated attributes
@@ -146,22 +171,44 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
         holder_ids=holder_ids,
         tags=tags,
         expand=expand,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def get(id, expand=None, user=None):
+def get(id, expand=None, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingCard
     Receive a single IssuingCard object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
     - expand [list of strings, default None]: fields to expand information. ex: ["rules", "security_code", "number", "expiration"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IssuingCards object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, expand=expand, user=user)
+    return rest.get_id(resource=_resource, id=id, expand=expand, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, expand=None, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingCards
+    Receive IssuingCard objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - expand [list of strings, default None]: fields to expand information. ex: ["rules", "security_code", "number", "expiration"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IssuingCard objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", expand=expand, raw=raw, fields=fields, user=user)
 
 
 def update(id, status=None, pin=None, display_name=None, rules=None, tags=None, user=None):
@@ -1 +1 @@
-from .__issuingdesign import get, query, page, pdf
+from .__issuingdesign import get, get_many, query, page, pdf
@@ -1 +1 @@
-from .__issuingembossingkit import get, query, page
+from .__issuingembossingkit import get, get_many, query, page
@@ -2,6 +2,7 @@ from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime
 from ..issuingdesign.__issuingdesign import parse_designs
 from ..utils import rest
+from ..utils.lazy import lazy
 
 
 class IssuingEmbossingKit(Resource):
@@ -15,19 +16,26 @@ class IssuingEmbossingKit(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingEmbossingKit. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "name", "_designs", "_created", "_updated")
+
+    designs = lazy(parse_designs)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, id=None, name=None, designs=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.name = name
-        self.designs = parse_designs(designs)
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.designs = designs
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingEmbossingKit, "name": "IssuingEmbossingKit"}
 
 
-def query(limit=None, after=None, before=None, status=None, design_ids=None, ids=None, user=None):
+def query(limit=None, after=None, before=None, status=None, design_ids=None, ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingEmbossingKits
     Receive a generator of IssuingEmbossingKit objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -37,6 +45,11 @@ def query(limit=None, after=None, before=None, status=None, design_ids=None, ids
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "processing", "success", "failed"]
     - design_ids [list of string, default None]: list of design_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingEmbossingKit objects with updated attributes
@@ -49,11 +62,17 @@ def query(limit=None, after=None, before=None, status=None, design_ids=None, ids
         status=status,
         design_ids=design_ids,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, design_ids=None, ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, design_ids=None, ids=None, output=None,
+         raw=False, fields=None, user=None):
     """# Retrieve paged IssuingEmbossingKits
     Receive a list of up to 100 IssuingEmbossingKit objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -65,6 +84,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, design_i
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "processing", "success", "failed"]
     - design_ids [list of string, default None]: list of design_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingEmbossingKit objects with updated attributes
@@ -79,18 +101,40 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, design_i
         status=status,
         design_ids=design_ids,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user
     )
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingEmbossingKit
     Receive a single IssuingEmbossingKit object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IssuingEmbossingKit object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingEmbossingKits
+    Receive IssuingEmbossingKit objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IssuingEmbossingKit objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__issuingholder import create, get, query, page, update, cancel
+from .__issuingholder import create, get, get_many, query, page, update, cancel
@@ -2,6 +2,7 @@ from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ..utils import rest
 from ..issuingrule import parse_rules
+from ..utils.lazy import lazy
 
 
 class IssuingHolder(Resource):
@@ -21,17 +22,23 @@ class IssuingHolder(Resource):
     - updated [datetime.datetime]: latest update datetime for the IssuingHolder. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "name", "tax_id", "external_id", "_rules", "tags", "status", "_updated", "_created")
+
+    rules = lazy(parse_rules)
+    updated = lazy(check_datetime)
+    created = lazy(check_datetime)
+
     def __init__(self, name, tax_id, external_id, rules=None, tags=None, id=None, status=None, updated=None, created=None):
         Resource.__init__(self, id=id)
 
         self.name = name
         self.tax_id = tax_id
         self.external_id = external_id
-        self.rules = parse_rules(rules)
+        self.rules = rules
         self.tags = tags
         self.status = status
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingHolder, "name": "IssuingHolder"}
@@ -51,21 +58,41 @@ def create(holders, expand=None, user=None):
     return rest.post_multi(resource=_resource, entities=holders, expand=expand, user=user)
 
 
-def get(id, expand=None, user=None):
+def get(id, expand=None, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingHolder
     Receive a single IssuingHolder object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
     - expand [list of strings, default None]: fields to expand information. Options: ["rules"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - IssuingHolder object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, expand=expand, user=user)
+    return rest.get_id(resource=_resource, id=id, expand=expand, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, expand=None, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingHolders
+    Receive IssuingHolder objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - expand [list of strings, default None]: fields to expand information. Options: ["rules"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - dictionary of IssuingHolder objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", expand=expand, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, user=None):
+def query(limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, parallel=None,
+          progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingHolders
     Receive a generator of IssuingHolder objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -76,6 +103,11 @@ def query(limit=None, ids=None, after=None, before=None, status=None, tags=None,
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - expand [string, default None]: fields to expand information. Options: ["rules"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingHolder objects with updated attributes
@@ -89,11 +121,17 @@ def query(limit=None, ids=None, after=None, before=None, status=None, tags=None,
         status=status,
         tags=tags,
         expand=expand,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, user=None):
+def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None,
+         output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingHolders
     Receive a list of IssuingHolder objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -105,6 +143,9 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - expand [string, default None]: fields to expand information. Options: ["rules"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of IssuingHolder objects with updated attributes
@@ -120,6 +161,9 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, status=None
         status=status,
         tags=tags,
         expand=expand,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,3 +1,3 @@
-from .__issuinginvoice import create, get, query, page
+from .__issuinginvoice import create, get, get_many, query, page
 from .log.__log import Log
 from . import log
@@ -1,6 +1,7 @@
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date, check_datetime_or_date
 from ..utils import rest
+from ..utils.lazy import lazy
 
 
 class IssuingInvoice(Resource):
@@ -23,6 +24,15 @@ class IssuingInvoice(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingInvoice. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "amount", "tax_id", "name", "tags", "brcode", "_due", "link", "status", "issuing_transaction_id",
+        "_updated", "_created",
+    )
+
+    due = lazy(check_datetime_or_date)
+    updated = lazy(check_datetime)
+    created = lazy(check_datetime)
+
     def __init__(self, amount, tax_id=None, name=None, tags=None, id=None, brcode=None, due=None, link=None, status=None, 
                 issuing_transaction_id=None, updated=None, created=None):
         Resource.__init__(self, id=id)
@@ -32,12 +42,12 @@ class IssuingInvoice(Resource):
         self.name = name
         self.tags = tags
         self.brcode = brcode
-        self.due = check_datetime_or_date(due)
+        self.due = due
         self.link = link
         self.status = status
         self.issuing_transaction_id = issuing_transaction_id
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingInvoice, "name": "IssuingInvoice"}
@@ -56,20 +66,39 @@ def create(invoice, user=None):
     return rest.post_single(resource=_resource, entity=invoice, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingInvoice
     Receive a single IssuingInvoice object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IssuingInvoice object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingInvoices
+    Receive IssuingInvoice objects previously created in the Stark Infra API by their ids
+    They are fetched by one request per id, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IssuingInvoice objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter=None, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, parallel=None, progress=None, output=None,
+          raw=False, fields=None, user=None):
     """# Retrieve IssuingInvoices
     Receive a generator of IssuingInvoice objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -78,6 +107,11 @@ def query(limit=None, after=None, before=None, status=None, tags=None, user=None
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "expired", "overdue", "paid"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingInvoice objects with updated attributes
@@ -89,11 +123,17 @@ def query(limit=None, after=None, before=None, status=None, tags=None, user=None
         before=check_date(before),
         tags=tags,
         limit=limit,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve IssuingInvoices
     Receive a list of IssuingInvoice objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -103,6 +143,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "expired", "overdue", "paid"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingInvoice objects with updated attributes
@@ -116,6 +159,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         before=check_date(before),
         tags=tags,
         limit=limit,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
-    
\ No newline at end of file
+    
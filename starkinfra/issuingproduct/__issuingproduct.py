@@ -15,6 +15,8 @@ class IssuingProduct(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingProduct. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "network", "funding_type", "holder_type", "code", "created")
+
     def __init__(self, id=None, network=None, funding_type=None, holder_type=None, code=None, created=None):
         Resource.__init__(self, id=id)
 
@@ -28,11 +30,14 @@ class IssuingProduct(Resource):
 _resource = {"class": IssuingProduct, "name": "IssuingProduct"}
 
 
-def query(limit=None, user=None):
+def query(limit=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingProducts
     Receive a generator of IssuingProduct objects previously registered in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingProduct objects with updated attributes
@@ -40,16 +45,22 @@ def query(limit=None, user=None):
     return rest.get_stream(
         resource=_resource,
         limit=limit,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(limit=None, cursor=None, user=None):
+def page(limit=None, cursor=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingProducts
     Receive a list of up to 100 IssuingProduct objects previously registered in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
     - cursor [string, default None]: cursor returned on the previous page function call
     - limit [integer, default 100]: maximum number of objects to be retrieved. Max = 100. ex: 35
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of IssuingProduct objects with updated attributes
@@ -59,5 +70,8 @@ def page(limit=None, cursor=None, user=None):
         resource=_resource,
         limit=limit,
         cursor=cursor,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
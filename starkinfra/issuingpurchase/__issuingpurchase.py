@@ -4,6 +4,7 @@ from ..utils.parse import parse_and_verify
 from starkcore.utils.api import api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class IssuingPurchase(Resource):
@@ -52,6 +53,18 @@ class IssuingPurchase(Resource):
     - holder_tags [list of strings]: tags of the IssuingHolder responsible for this purchase. ex: ["technology", "john snow"]
     """
 
+    __slots__ = (
+        "id", "holder_name", "product_id", "card_id", "card_ending", "purpose", "installment_count", "amount", "tax",
+        "issuer_amount", "issuer_currency_code", "issuer_currency_symbol", "merchant_amount", "merchant_currency_code",
+        "merchant_currency_symbol", "merchant_category_code", "merchant_category_type", "merchant_country_code",
+        "acquirer_id", "merchant_id", "merchant_name", "merchant_fee", "wallet_id", "method_code", "score",
+        "end_to_end_id", "tags", "issuing_transaction_ids", "status", "description", "metadata", "zip_code", "_updated",
+        "_created", "is_partial_allowed", "card_tags", "holder_id", "holder_tags",
+    )
+
+    updated = lazy(check_datetime)
+    created = lazy(check_datetime)
+
     def __init__(self, holder_name=None, product_id=None, card_id=None, card_ending=None, purpose=None,
                  installment_count=None, amount=None, tax=None, issuer_amount=None, issuer_currency_code=None,
                  issuer_currency_symbol=None, merchant_amount=None, merchant_currency_code=None,
@@ -93,8 +106,8 @@ class IssuingPurchase(Resource):
         self.description = description
         self.metadata = metadata
         self.zip_code = zip_code
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
         self.is_partial_allowed = is_partial_allowed
         self.card_tags = card_tags
         self.holder_id = holder_id
@@ -102,23 +115,42 @@ class IssuingPurchase(Resource):
 
 
 _resource = {"class": IssuingPurchase, "name": "IssuingPurchase"}
+_public_key_timeout = 1
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingPurchase
     Receive a single IssuingPurchase object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - IssuingPurchase object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingPurchase
+    Receive IssuingPurchase objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - dictionary of IssuingPurchase objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
 def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, holder_ids=None, card_ids=None,
-          status=None, user=None):
+          status=None, parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingPurchase
     Receive a generator of IssuingPurchase objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -130,6 +162,11 @@ def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, ho
     - card_ids [list of strings, default None]: card  IDs. ex: ["5656565656565656", "4545454545454545"]
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["approved", "canceled", "denied", "confirmed", "voided"]
     - ids [list of strings, default None, default None]: purchase IDs
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingPurchase objects with updated attributes
@@ -144,12 +181,17 @@ def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, ho
         holder_ids=holder_ids,
         card_ids=card_ids,
         status=status,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(end_to_end_ids=None, holder_ids=None, card_ids=None, status=None, after=None, before=None, ids=None,
-        cursor=None, limit=None, user=None):
+        cursor=None, limit=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingPurchases
     Receive a list of IssuingPurchase objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -162,6 +204,9 @@ def page(end_to_end_ids=None, holder_ids=None, card_ids=None, status=None, after
     - card_ids [list of strings, default None]: card  IDs. ex: ["5656565656565656", "4545454545454545"]
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["approved", "canceled", "denied", "confirmed", "voided"]
     - ids [list of strings, default None]: purchase IDs
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of IssuingPurchase objects with updated attributes
@@ -178,6 +223,9 @@ def page(end_to_end_ids=None, holder_ids=None, card_ids=None, status=None, after
         holder_ids=holder_ids,
         card_ids=card_ids,
         status=status,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -207,6 +255,7 @@ def parse(content, signature, user=None):
     They present IssuingPurchase data that must be analyzed and answered with approval or declination.
     If the provided digital signature does not check out with the StarkInfra public key, a stark.exception.InvalidSignatureException will be raised.
     If the authorization request is not answered within 2 seconds or is not answered with an HTTP status code 200 the IssuingPurchase will go through the pre-configured stand-in validation.
+    To keep within that window, downloading the Stark Infra public key, when it is neither cached nor persisted yet, may take at most 1 second.
     ## Parameters (required):
     - content [string]: response content from request received at user endpoint (not parsed)
     - signature [string]: base-64 digital signature received at response header "Digital-Signature"
@@ -221,6 +270,7 @@ def parse(content, signature, user=None):
         user=user,
         resource=_resource,
         key="",
+        timeout=_public_key_timeout,
     )
 
 
@@ -1,8 +1,10 @@
+from functools import partial
 from starkcore.utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ...utils import rest
 from ..__issuingrestock import _resource as _issuing_restock_resource
+from ...utils.lazy import lazy
 
 
 class Log(Resource):
@@ -18,18 +20,24 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "_restock", "type", "_created")
+
+    restock = lazy(partial(from_api_json, _issuing_restock_resource))
+    created = lazy(check_datetime)
+
     def __init__(self, id, restock, type, created):
         Resource.__init__(self, id=id)
 
-        self.restock = from_api_json(_issuing_restock_resource, restock)
+        self.restock = restock
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingRestockLog"}
 
 
-def query(limit=None, ids=None, after=None, before=None, types=None, restock_ids=None, user=None):
+def query(limit=None, ids=None, after=None, before=None, types=None, restock_ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve issuingrestock.Log
     Receive a generator of issuingrestock.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -39,6 +47,11 @@ def query(limit=None, ids=None, after=None, before=None, types=None, restock_ids
     - types [list of strings, default None]: filter for log event types. ex: ["created", "processing", "confirmed"]
     - restock_ids [list of strings, default None]: list of IssuingRestock ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of issuingrestock.Log objects with updated attributes
@@ -51,11 +64,17 @@ def query(limit=None, ids=None, after=None, before=None, types=None, restock_ids
         before=check_date(before),
         types=types,
         restock_ids=restock_ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, restock_ids=None, user=None):
+def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, restock_ids=None, output=None,
+         raw=False, fields=None, user=None):
     """# Retrieve paged issuingrestock.Log
     Receive a list of up to 100 issuingrestock.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -67,6 +86,9 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "processing", "confirmed"]
     - restock_ids [list of strings, default None]: list of IssuingRestock ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of issuingrestock.Log objects with updated attributes
@@ -81,18 +103,40 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         restock_ids=restock_ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific issuingrestock.Log
     Receive a single issuingrestock.Log object previously created by the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - issuingrestock.Log object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific issuingrestock.Log
+    Receive issuingrestock.Log objects previously created by the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of issuingrestock.Log objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
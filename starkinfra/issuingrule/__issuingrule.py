@@ -3,6 +3,7 @@ from starkcore.utils.resource import Resource
 from starkinfra.cardmethod.__cardmethod import _resource as _method_resource, CardMethod
 from starkinfra.merchantcountry.__merchantcountry import _resource as _country_resource, MerchantCountry
 from starkinfra.merchantcategory.__merchantcategory import _resource as _category_resource, MerchantCategory
+from ..utils.lazy import lazy
 
 
 class IssuingRule(Resource):
@@ -24,6 +25,15 @@ class IssuingRule(Resource):
     - currency_name [string]: currency name. ex: "Brazilian Real"
     """
 
+    __slots__ = (
+        "id", "name", "amount", "interval", "currency_code", "_categories", "_countries", "_methods", "counter_amount",
+        "currency_symbol", "currency_name",
+    )
+
+    categories = lazy(lambda categories: _parse_categories(categories))
+    countries = lazy(lambda countries: _parse_countries(countries))
+    methods = lazy(lambda methods: _parse_methods(methods))
+
     def __init__(self, name, amount, id=None, interval=None, currency_code=None, categories=None, countries=None,
                  methods=None, counter_amount=None, currency_symbol=None, currency_name=None):
         Resource.__init__(self, id=id)
@@ -32,9 +42,9 @@ class IssuingRule(Resource):
         self.amount = amount
         self.interval = interval
         self.currency_code = currency_code
-        self.categories = _parse_categories(categories)
-        self.countries = _parse_countries(countries)
-        self.methods = _parse_methods(methods)
+        self.categories = categories
+        self.countries = countries
+        self.methods = methods
         self.counter_amount = counter_amount
         self.currency_symbol = currency_symbol
         self.currency_name = currency_name
@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__issuingstock import get, query, page
+from .__issuingstock import get, get_many, query, page
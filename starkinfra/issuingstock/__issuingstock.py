@@ -1,6 +1,7 @@
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_date, check_datetime
 from ..utils import rest
+from ..utils.lazy import lazy
 
 
 class IssuingStock(Resource):
@@ -15,21 +16,26 @@ class IssuingStock(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingStock. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "balance", "design_id", "embosser_id", "_created", "_updated")
+
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, balance=None, design_id=None, embosser_id=None, id=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.balance = balance
         self.design_id = design_id
         self.embosser_id = embosser_id
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": IssuingStock, "name": "IssuingStock"}
 
 
 def query(limit=None, after=None, before=None, design_ids=None, embosser_ids=None, ids=None,
-          expand=None, user=None):
+          expand=None, parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingStocks
     Receive a generator of IssuingStock objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -40,6 +46,11 @@ def query(limit=None, after=None, before=None, design_ids=None, embosser_ids=Non
     - embosser_ids [list of strings, default None]: Embosser unique ids. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - expand [list of strings, default None]: fields to expand information. ex: ["balance"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingStock objects with updated attributes
@@ -53,12 +64,17 @@ def query(limit=None, after=None, before=None, design_ids=None, embosser_ids=Non
         embosser_ids=embosser_ids,
         ids=ids,
         expand=expand,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, design_ids=None, embosser_ids=None, 
-         ids=None, expand=None, user=None):
+         ids=None, expand=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingStocks
     Receive a list of up to 100 IssuingStock objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -71,6 +87,9 @@ def page(cursor=None, limit=None, after=None, before=None, design_ids=None, embo
     - embosser_ids [list of strings, default None]: Embosser unique ids. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - expand [list of strings, default None]: fields to expand information. ex: ["balance"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingStock objects with updated attributes
@@ -86,19 +105,42 @@ def page(cursor=None, limit=None, after=None, before=None, design_ids=None, embo
         embosser_ids=embosser_ids,
         ids=ids,
         expand=expand,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def get(id, expand=None, user=None):
+def get(id, expand=None, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingStock
     Receive a single IssuingStock object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
     - expand [list of strings, default None]: fields to expand information. ex: ["balance"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IssuingStock object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, expand=expand, user=user)
+    return rest.get_id(resource=_resource, id=id, expand=expand, raw=raw, fields=fields, user=user)
+
+
+
+def get_many(ids, expand=None, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingStocks
+    Receive IssuingStock objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - expand [list of strings, default None]: fields to expand information. ex: ["balance"]
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IssuingStock objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", expand=expand, raw=raw, fields=fields, user=user)
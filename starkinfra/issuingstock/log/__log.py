@@ -1,8 +1,10 @@
+from functools import partial
 from starkcore.utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ...utils import rest
 from ..__issuingstock import _resource as _issuing_stock_resource
+from ...utils.lazy import lazy
 
 
 class Log(Resource):
@@ -19,19 +21,25 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "_stock", "type", "count", "_created")
+
+    stock = lazy(partial(from_api_json, _issuing_stock_resource))
+    created = lazy(check_datetime)
+
     def __init__(self, id, stock, type, count, created):
         Resource.__init__(self, id=id)
 
-        self.stock = from_api_json(_issuing_stock_resource, stock)
+        self.stock = stock
         self.type = type
         self.count = count
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "IssuingStockLog"}
 
 
-def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, user=None):
+def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve issuingstock.Log
     Receive a generator of issuingstock.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -41,6 +49,11 @@ def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=N
     - types [list of strings, default None]: filter for log event types. ex: ["created", "spent", "restocked", "lost"]
     - stock_ids [list of strings, default None]: list of IssuingStock ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of issuingstock.Log objects with updated attributes
@@ -53,11 +66,17 @@ def query(limit=None, ids=None, after=None, before=None, types=None, stock_ids=N
         before=check_date(before),
         types=types,
         stock_ids=stock_ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, user=None):
+def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None, stock_ids=None, output=None,
+         raw=False, fields=None, user=None):
     """# Retrieve paged issuingstock.Log
     Receive a list of up to 100 issuingstock.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -69,6 +88,9 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
     - types [list of strings, default None]: filter for log event types. ex: ["created", "spent", "restocked", "lost"]
     - stock_ids [list of strings, default None]: list of IssuingStock ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of issuingstock.Log objects with updated attributes
@@ -83,18 +105,40 @@ def page(cursor=None, limit=None, ids=None, after=None, before=None, types=None,
         before=check_date(before),
         types=types,
         stock_ids=stock_ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific issuingstock.Log
     Receive a single issuingstock.Log object previously created by the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - issuingstock.Log object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific issuingstock.Log
+    Receive issuingstock.Log objects previously created by the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of issuingstock.Log objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
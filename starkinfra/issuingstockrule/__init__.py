@@ -1 +1 @@
-from .__issuingstockrule import create, get, query, page, update, cancel
+from .__issuingstockrule import create, get, get_many, query, page, update, cancel
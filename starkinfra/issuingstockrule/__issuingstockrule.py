@@ -1,6 +1,7 @@
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_date, check_datetime
 from ..utils import rest
+from ..utils.lazy import lazy
 
 
 class IssuingStockRule(Resource):
@@ -21,6 +22,11 @@ class IssuingStockRule(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingStockRule. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "minimum_balance", "stock_id", "tags", "emails", "phones", "status", "_updated", "_created")
+
+    updated = lazy(check_datetime)
+    created = lazy(check_datetime)
+
     def __init__(self, minimum_balance, stock_id, tags=None, emails=None, phones=None, id=None,
                  status=None, created=None, updated=None):
         Resource.__init__(self, id=id)
@@ -31,8 +37,8 @@ class IssuingStockRule(Resource):
         self.emails = emails
         self.phones = phones
         self.status = status
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingStockRule, "name": "IssuingStockRule"}
@@ -51,21 +57,39 @@ def create(rules, user=None):
     return rest.post_multi(resource=_resource, entities=rules, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingStockRule
     Receive a single IssuingStockRule object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IssuingStockRule object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingStockRules
+    Receive IssuingStockRule objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IssuingStockRule objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
 def query(limit=None, after=None, before=None, status=None, stock_ids=None, ids=None,
-          tags=None, user=None):
+          tags=None, parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingStockRules
     Receive a generator of IssuingStockRule objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -76,6 +100,11 @@ def query(limit=None, after=None, before=None, status=None, stock_ids=None, ids=
     - stock_ids [list of strings, default None]: list of stock_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["card", "corporate"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingStockRule objects with updated attributes
@@ -89,12 +118,17 @@ def query(limit=None, after=None, before=None, status=None, stock_ids=None, ids=
         stock_ids=stock_ids,
         ids=ids,
         tags=tags,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, stock_ids=None,
-         ids=None, tags=None, user=None):
+         ids=None, tags=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged IssuingStockRules
     Receive a list of up to 100 IssuingStockRule objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -107,6 +141,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, stock_id
     - stock_ids [list of strings, default None]: list of stock_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["card", "corporate"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingStockRule objects with updated attributes
@@ -122,6 +159,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, stock_id
         stock_ids=stock_ids,
         ids=ids,
         tags=tags,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -33,6 +33,12 @@ class IssuingToken(Resource):
     - wallet_instance_id [string]: unique id refered to the wallet app in the current device. ex: "71583be4777eb89aaf0345eebeb82594f096615ed17862d0"
     """
 
+    __slots__ = (
+        "id", "card_id", "wallet_id", "wallet_name", "merchant_id", "external_id", "tags", "status", "updated",
+        "created", "activation_code", "method_code", "device_type", "device_name", "device_serial_number",
+        "device_os_name", "device_os_version", "device_imei", "wallet_instance_id",
+    )
+
     def __init__(self, card_id=None, wallet_id=None, wallet_name=None, merchant_id=None, id=None,
                 external_id=None, tags=None, status=None, updated=None, created=None, activation_code=None,
                 method_code=None, device_type=None, device_name=None, device_serial_number=None, device_os_name=None,
@@ -62,20 +68,39 @@ class IssuingToken(Resource):
 _resource = {"class": IssuingToken, "name": "IssuingToken"}
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingToken
     Receive a single IssuingToken object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - IssuingToken object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingTokens
+    Receive IssuingToken objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - dictionary of IssuingToken objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None, user=None, external_ids=None):
+def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None, parallel=None,
+          progress=None, output=None, raw=False, fields=None, user=None, external_ids=None):
     """# Retrieve IssuingTokens
     Receive a generator of IssuingToken objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -86,6 +111,11 @@ def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=
     - card_ids [list of strings, default None]: list of card_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: list of strings for tagging. ex: ["travel", "food"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     - external_ids [list of strings, default None]: external IDs. ex: ["DSHRMC00002626944b0e3b539d4d459281bdba90c2588791", "DSHRMC00002626941c531164a0b14c66ad9602ee716f1e85"]
     ## Return:
@@ -100,12 +130,18 @@ def query(limit=None, after=None, before=None, status=None, card_ids=None, tags=
         card_ids=card_ids,
         tags=tags,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
         external_ids=external_ids,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None, user=None, external_ids=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids=None, tags=None, ids=None,
+         output=None, raw=False, fields=None, user=None, external_ids=None):
     """# Retrieve paged IssuingTokens
     Receive a list of IssuingToken objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -118,6 +154,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids
     - card_ids [list of strings, default None]: list of card_ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: list of strings for tagging. ex: ["travel", "food"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     - external_ids [list of strings, default None]: external IDs. ex: ["5656565656565656", "4545454545454545"]
     ## Return:
@@ -134,6 +173,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, card_ids
         card_ids=card_ids,
         tags=tags,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
         external_ids=external_ids,
     )
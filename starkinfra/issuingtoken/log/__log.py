@@ -1,9 +1,11 @@
+from functools import partial
 from starkcore.utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ...utils import rest
 from ..__issuingtoken import _resource as _issuing_token_resource
 from starkcore.error import Error
+from ...utils.lazy import lazy
 
 
 class Log(Resource):
@@ -18,10 +20,14 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "_token", "type", "created", "errors")
+
+    token = lazy(partial(from_api_json, _issuing_token_resource))
+
     def __init__(self, id, type, errors, token, created):
         Resource.__init__(self, id=id)
 
-        self.token = from_api_json(_issuing_token_resource, token)
+        self.token = token
         self.type = type
         self.created = created
         self.errors = errors
@@ -30,20 +36,39 @@ class Log(Resource):
 _resource = {"class": Log, "name": "IssuingTokenLog"}
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific issuingtoken.Log
     Receive a single issuingtoken.Log object previously created by the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - issuingtoken.Log object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific issuingtoken.Log
+    Receive issuingtoken.Log objects previously created by the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of issuingtoken.Log objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve issuingtoken.Log
     Receive a generator of issuingtoken.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -53,6 +78,11 @@ def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=N
     - types [list of strings, default None]: filter for log event types. ex: ["active", "blocked", "canceled", "frozen", "pending"]
     - token_ids [list of strings, default None]: list of IssuingToken ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of issuingtoken.Log objects with updated attributes
@@ -65,11 +95,17 @@ def query(limit=None, after=None, before=None, types=None, token_ids=None, ids=N
         types=types,
         token_ids=token_ids,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor = None, ids=None, user=None):
+def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor = None, ids=None, output=None,
+         raw=False, fields=None, user=None):
     """# Retrieve paged issuingtoken.Log
     Receive a list of up to 100 issuingtoken.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -81,6 +117,9 @@ def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor
     - types [list of strings, default None]: filter for log event types. ex: ["active", "blocked", "canceled", "frozen", "pending"]
     - token_ids [list of strings, default None]: list of IssuingToken ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
     - ids [list of strings, default None]: list of ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of issuingtoken.Log objects with updated attributes
@@ -95,5 +134,8 @@ def page(limit=None, after=None, before=None, types=None, token_ids=None, cursor
         token_ids=token_ids,
         cursor=cursor,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
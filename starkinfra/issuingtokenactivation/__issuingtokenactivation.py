@@ -15,6 +15,8 @@ class IssuingTokenActivation(SubResource):
     - activation_method [dictionary]: dictionary object with "type":string and "value":string pairs
     """
 
+    __slots__ = ("card_id", "token_id", "tags", "activation_method")
+
     def __init__(self, card_id=None, token_id=None, tags=None, activation_method=None):
         self.card_id = card_id
         self.token_id = token_id
@@ -1 +1 @@
-from .__issuingtokendesign import get, query, pdf, page
+from .__issuingtokendesign import get, get_many, query, pdf, page
@@ -15,6 +15,8 @@ class IssuingTokenRequest(SubResource):
     - metadata [dictionary]: dictionary object used to store additional information about the IssuingTokenRequest object.
     """
 
+    __slots__ = ("card_id", "wallet_id", "method_code", "content", "signature", "metadata")
+
     def __init__(self, card_id, wallet_id, method_code, content=None, signature=None, metadata=None):
         self.card_id = card_id
         self.wallet_id = wallet_id
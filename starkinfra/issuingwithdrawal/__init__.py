@@ -1 +1 @@
-from .__issuingwithdrawal import create, get, query, page
+from .__issuingwithdrawal import create, get, get_many, query, page
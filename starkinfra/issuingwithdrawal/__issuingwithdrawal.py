@@ -1,6 +1,7 @@
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ..utils import rest
+from ..utils.lazy import lazy
 
 
 class IssuingWithdrawal(Resource):
@@ -21,6 +22,14 @@ class IssuingWithdrawal(Resource):
     - created [datetime.datetime]: creation datetime for the IssuingWithdrawal. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "amount", "external_id", "description", "tags", "transaction_id", "issuing_transaction_id", "_updated",
+        "_created",
+    )
+
+    updated = lazy(check_datetime)
+    created = lazy(check_datetime)
+
     def __init__(self, amount, external_id, description, tags=None, id=None, transaction_id=None,
                  issuing_transaction_id=None, updated=None, created=None):
         Resource.__init__(self, id=id)
@@ -31,8 +40,8 @@ class IssuingWithdrawal(Resource):
         self.tags = tags
         self.transaction_id = transaction_id
         self.issuing_transaction_id = issuing_transaction_id
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": IssuingWithdrawal, "name": "IssuingWithdrawal"}
@@ -51,20 +60,39 @@ def create(withdrawal, user=None):
     return rest.post_single(resource=_resource, entity=withdrawal, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific IssuingWithdrawal
     Receive a single IssuingWithdrawal object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - IssuingWithdrawal object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific IssuingWithdrawals
+    Receive IssuingWithdrawal objects previously created in the Stark Infra API by their ids
+    They are fetched by one request per id, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of IssuingWithdrawal objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter=None, raw=raw, fields=fields, user=user)
 
 
-def query(external_ids=None, after=None, before=None, limit=None, tags=None, user=None):
+def query(external_ids=None, after=None, before=None, limit=None, tags=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve IssuingWithdrawals
     Receive a generator of IssuingWithdrawal objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -73,6 +101,11 @@ def query(external_ids=None, after=None, before=None, limit=None, tags=None, use
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - external_ids [list of strings, default None]: external IDs. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingWithdrawal objects with updated attributes
@@ -84,11 +117,17 @@ def query(external_ids=None, after=None, before=None, limit=None, tags=None, use
         before=check_date(before),
         tags=tags,
         limit=limit,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(external_ids=None, after=None, before=None, limit=None, tags=None, cursor=None, user=None):
+def page(external_ids=None, after=None, before=None, limit=None, tags=None, cursor=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged IssuingWithdrawals
     Receive a list of IssuingWithdrawal objects previously created in the Stark Infra API and the cursor to the next page.
     ## Parameters (optional):
@@ -98,6 +137,9 @@ def page(external_ids=None, after=None, before=None, limit=None, tags=None, curs
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - external_ids [list of strings, default None]: external IDs. ex: ["5656565656565656", "4545454545454545"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of IssuingWithdrawal objects with updated attributes
@@ -111,5 +153,8 @@ def page(external_ids=None, after=None, before=None, limit=None, tags=None, curs
         tags=tags,
         limit=limit,
         cursor=cursor,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,4 +1,4 @@
-from .__ledger import create, get, query, page, update
+from .__ledger import create, get, get_many, query, page, update
 from .log.__log import Log
 from . import log
 from .rule.__rule import Rule
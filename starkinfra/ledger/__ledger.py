@@ -2,6 +2,7 @@ from ..utils import rest
 from .rule.__rule import parse_rules
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class Ledger(Resource):
@@ -20,15 +21,21 @@ class Ledger(Resource):
     - updated [datetime.datetime]: latest update datetime for the Ledger. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = ("id", "external_id", "_rules", "tags", "metadata", "_created", "_updated")
+
+    rules = lazy(parse_rules)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, external_id, id=None, rules=None, tags=None, metadata=None, created=None, updated=None):
         Resource.__init__(self, id=id)
 
         self.external_id = external_id
-        self.rules = parse_rules(rules)
+        self.rules = rules
         self.tags  = tags
         self.metadata = metadata
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": Ledger, "name": "Ledger"}
@@ -47,20 +54,39 @@ def create(ledgers, user=None):
     return rest.post_multi(resource=_resource, entities=ledgers, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific Ledger
     Receive a single Ledger object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - Ledger object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific Ledgers
+    Receive Ledger objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of Ledger objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, ids=None, external_ids=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, ids=None, external_ids=None, tags=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve Ledgers
     Receive a generator of Ledger objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -70,6 +96,11 @@ def query(limit=None, after=None, before=None, ids=None, external_ids=None, tags
     - ids [list of strings, default None]: list of Ledger ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - external_ids [list of strings, default None]: list of Ledger external ids to filter retrieved objects. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["account/123", "savings"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of Ledger objects with updated attributes
@@ -82,11 +113,17 @@ def query(limit=None, after=None, before=None, ids=None, external_ids=None, tags
         ids=ids,
         external_ids=external_ids,
         tags=tags,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(limit=None, after=None, before=None, ids=None, external_ids=None, tags=None, cursor=None, user=None):
+def page(limit=None, after=None, before=None, ids=None, external_ids=None, tags=None, cursor=None, output=None,
+         raw=False, fields=None, user=None):
     """# Retrieve paged Ledgers
     Receive a list of up to 100 Ledger objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -98,6 +135,9 @@ def page(limit=None, after=None, before=None, ids=None, external_ids=None, tags=
     - external_ids [list of strings, default None]: list of Ledger external ids to filter retrieved objects. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["account/123", "savings"]
     - cursor [string, default None]: cursor returned on the previous page function call
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of Ledger objects with updated attributes
@@ -112,6 +152,9 @@ def page(limit=None, after=None, before=None, ids=None, external_ids=None, tags=
         ids=ids,
         external_ids=external_ids,
         tags=tags,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,8 +1,10 @@
+from functools import partial
 from ...utils import rest
 from starkcore.utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ..__ledger import _resource as _ledger_resource
+from ...utils.lazy import lazy
 
 
 class Log(Resource):
@@ -18,31 +20,55 @@ class Log(Resource):
     - ledger [Ledger]: Ledger entity to which the log refers to.
     """
 
+    __slots__ = ("id", "_created", "type", "_ledger")
+
+    created = lazy(check_datetime)
+    ledger = lazy(partial(from_api_json, _ledger_resource))
+
     def __init__(self, id, created, type, ledger):
         Resource.__init__(self, id=id)
 
-        self.created = check_datetime(created)
+        self.created = created
         self.type = type
-        self.ledger = from_api_json(_ledger_resource, ledger)
+        self.ledger = ledger
 
 
 _resource = {"class": Log, "name": "LedgerLog"}
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific ledger.Log
     Receive a single ledger.Log object previously created by the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - ledger.Log object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific ledger.Logs
+    Receive ledger.Log objects previously created by the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - dictionary of ledger.Log objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, ledger_id=None, user=None):
+def query(ids=None, limit=None, after=None, before=None, ledger_id=None, parallel=None, progress=None, output=None,
+          raw=False, fields=None, user=None):
     """# Retrieve ledger.Logs
     Receive a generator of ledger.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +77,11 @@ def query(ids=None, limit=None, after=None, before=None, ledger_id=None, user=No
     - after [datetime.date or string, default None] date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - ledger_id [string, default None]: filter logs by Ledger id. ex: "5656565656565656"
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of ledger.Log objects with updated attributes
@@ -62,11 +93,17 @@ def query(ids=None, limit=None, after=None, before=None, ledger_id=None, user=No
         after=check_date(after),
         before=check_date(before),
         ledger_id=ledger_id,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(ids=None, limit=None, after=None, before=None, ledger_id=None, cursor=None, user=None):
+def page(ids=None, limit=None, after=None, before=None, ledger_id=None, cursor=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged ledger.Logs
     Receive a list of up to 100 ledger.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -77,6 +114,9 @@ def page(ids=None, limit=None, after=None, before=None, ledger_id=None, cursor=N
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - ledger_id [string, default None]: filter logs by Ledger id. ex: "5656565656565656"
     - cursor [string, default None]: cursor returned on the previous page function call
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of ledger.Log objects with updated attributes
@@ -90,5 +130,8 @@ def page(ids=None, limit=None, after=None, before=None, ledger_id=None, cursor=N
         after=check_date(after),
         before=check_date(before),
         ledger_id=ledger_id,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
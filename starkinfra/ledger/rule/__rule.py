@@ -10,6 +10,8 @@ class Rule(SubResource):
     - value [integer]: Value of the rule. ex: 1000
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
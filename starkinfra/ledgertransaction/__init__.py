@@ -1 +1 @@
-from .__ledgertransaction import create, get, query, page
+from .__ledgertransaction import create, get, get_many, query, page
@@ -2,6 +2,7 @@ from ..utils import rest
 from ..ledger.rule.__rule import parse_rules
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class LedgerTransaction(Resource):
@@ -24,6 +25,14 @@ class LedgerTransaction(Resource):
     - created [datetime.datetime]: creation datetime for the LedgerTransaction. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "amount", "ledger_id", "external_id", "source", "balance", "fee", "_rules", "metadata", "tags",
+        "_created",
+    )
+
+    rules = lazy(parse_rules)
+    created = lazy(check_datetime)
+
     def __init__(self, amount, ledger_id, external_id, source, id=None, balance=None, fee=None, rules=None, metadata=None, tags=None, created=None):
         Resource.__init__(self, id=id)
 
@@ -33,10 +42,10 @@ class LedgerTransaction(Resource):
         self.source = source
         self.balance = balance
         self.fee = fee
-        self.rules = parse_rules(rules)
+        self.rules = rules
         self.metadata = metadata
         self.tags = tags
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": LedgerTransaction, "name": "LedgerTransaction"}
@@ -55,21 +64,39 @@ def create(transactions, user=None):
     return rest.post_multi(resource=_resource, entities=transactions, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific LedgerTransaction
     Receive a single LedgerTransaction object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - LedgerTransaction object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific LedgerTransactions
+    Receive LedgerTransaction objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of LedgerTransaction objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
 def query(ledger_id=None, flow=None, tags=None, external_ids=None, after=None, before=None,
-          ids=None, limit=None, user=None):
+          ids=None, limit=None, parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve LedgerTransactions
     Receive a generator of LedgerTransaction objects previously created in the Stark Infra API
     ## Parameters (conditionally-required):
@@ -82,6 +109,11 @@ def query(ledger_id=None, flow=None, tags=None, external_ids=None, after=None, b
     - after [datetime.date or string, default None] date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - limit [integer, default 100, maximum 1000]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of LedgerTransaction objects with updated attributes
@@ -96,12 +128,17 @@ def query(ledger_id=None, flow=None, tags=None, external_ids=None, after=None, b
         before=check_date(before),
         ids=ids,
         limit=limit,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(ledger_id=None, flow=None, tags=None, external_ids=None, after=None, before=None,
-         ids=None, limit=None, cursor=None, user=None):
+         ids=None, limit=None, cursor=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged LedgerTransactions
     Receive a list of LedgerTransaction objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -116,6 +153,9 @@ def page(ledger_id=None, flow=None, tags=None, external_ids=None, after=None, be
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - limit [integer, default 100, maximum 1000]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
     - cursor [string, default None]: cursor returned on the previous page function call
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of LedgerTransaction objects with updated attributes
@@ -132,5 +172,8 @@ def page(ledger_id=None, flow=None, tags=None, external_ids=None, after=None, be
         ids=ids,
         limit=limit,
         cursor=cursor,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -16,6 +16,8 @@ class MerchantCategory(SubResource):
     - number [string]: category's number. ex: "742", "5814"
     """
 
+    __slots__ = ("code", "type", "name", "number")
+
     def __init__(self, code=None, type=None, name=None, number=None):
         self.code = code
         self.type = type
@@ -26,11 +28,14 @@ class MerchantCategory(SubResource):
 _resource = {"class": MerchantCategory, "name": "MerchantCategory"}
 
 
-def query(search=None, user=None):
+def query(search=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve MerchantCategories
     Receive a generator of MerchantCategory objects previously created in the Stark Infra API
     ## Parameters (optional):
     - search [string, default None]: keyword to search for code, type, name or number
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of MerchantCategory objects with updated attributes
@@ -38,6 +43,9 @@ def query(search=None, user=None):
     return rest.get_stream(
         resource=_resource,
         search=search,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
     
\ No newline at end of file
@@ -13,6 +13,8 @@ class MerchantCountry(SubResource):
     - short_code [string]: country's short code. ex: "BR"
     """
 
+    __slots__ = ("code", "name", "number", "short_code")
+
     def __init__(self, code, name=None, number=None, short_code=None):
         self.code = code
         self.name = name
@@ -23,11 +25,14 @@ class MerchantCountry(SubResource):
 _resource = {"class": MerchantCountry, "name": "MerchantCountry"}
 
 
-def query(search=None, user=None):
+def query(search=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve MerchantCountries
     Receive a generator of MerchantCountry objects previously created in the Stark Infra API
     ## Parameters (optional):
     - search [string, default None]: keyword to search for code, name, number or short_code
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of MerchantCountry objects with updated attributes
@@ -35,5 +40,8 @@ def query(search=None, user=None):
     return rest.get_stream(
         resource=_resource,
         search=search,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -1,3 +1,3 @@
-from .__pixchargeback import create, get, query, page, update, cancel
+from .__pixchargeback import create, get, get_many, query, page, update, cancel
 from .log.__log import Log
 from . import log
@@ -41,6 +41,13 @@ class PixChargeback(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixChargeback. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "amount", "reference_id", "reason", "description", "tags", "bacen_id", "analysis", "sender_bank_code",
+        "receiver_bank_code", "rejection_reason", "reversal_reference_id", "result", "flow", "dispute_id",
+        "is_monitoring_required", "reversal_account_number", "reversal_account_type", "reversal_bank_code",
+        "reversal_branch_code", "reversal_tax_id", "status", "created", "updated",
+    )
+
     def __init__(self,  amount, reference_id, reason, description=None, tags=None, id=None, bacen_id=None, analysis=None,
                  sender_bank_code=None, receiver_bank_code=None, rejection_reason=None, reversal_reference_id=None,
                  result=None, flow=None, dispute_id=None, is_monitoring_required=None, reversal_account_number=None,
@@ -89,21 +96,40 @@ def create(chargebacks, user=None):
     return rest.post_multi(resource=_resource, entities=chargebacks, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a PixChargeback object
     Retrieve the PixChargeback object linked to your Workspace in the Stark Infra API using its id.
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixChargeback object that corresponds to the given id.
     """
 
-    return rest.get_id(id=id, resource=_resource, user=user)
+    return rest.get_id(id=id, resource=_resource, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixChargebacks
+    Retrieve the PixChargeback objects linked to your Workspace in the Stark Infra API using its id.
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixChargeback objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(ids=ids, id_filter="ids", resource=_resource, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None, flow=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None, flow=None,
+          tags=None, parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve PixChargebacks
     Receive a generator of PixChargeback objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -116,6 +142,11 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
     - reference_ids [list of strings, default None]: list of end_to_end_ids or return_ids of the reversed transactions to filter retrieved objects. Max = 30. ex: ["E20018183202201201450u34sDjD7334"]
     - flow [string, default None]: direction of the Pix Chargeback. Options: "in" for received chargebacks, "out" for chargebacks you requested
     - tags [list of strings, default None]: filter for tags of retrieved objects. ex: ["travel", "food"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixChargeback objects with updated attributes
@@ -132,11 +163,17 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
         reference_ids=reference_ids,
         flow=flow,
         tags=tags,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None, flow=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None,
+         flow=None, tags=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve PixChargebacks
     Receive a list of up to 100 PixChargeback objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -151,6 +188,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - reference_ids [list of strings, default None]: list of end_to_end_ids or return_ids of the reversed transactions to filter retrieved objects. Max = 30. ex: ["E20018183202201201450u34sDjD7334"]
     - flow [string, default None]: direction of the Pix Chargeback. Options: "in" for received chargebacks, "out" for chargebacks you requested
     - tags [list of strings, default None]: filter for tags of retrieved objects. ex: ["travel", "food"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - cursor to retrieve the next page of PixChargeback objects
@@ -168,6 +208,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         reference_ids=reference_ids,
         flow=flow,
         tags=tags,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class PixClaim(Resource):
@@ -32,12 +33,22 @@ class PixClaim(Resource):
     - updated [datetime.datetime]: update datetime for the PixClaim. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "_account_created", "account_number", "account_type", "branch_code", "name", "tax_id", "key_id", "tags",
+        "bacen_id", "status", "type", "key_type", "flow", "claimer_bank_code", "claimed_bank_code", "_created",
+        "_updated",
+    )
+
+    account_created = lazy(check_datetime)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, account_created, account_number, account_type, branch_code, name, tax_id, key_id, tags=None, id=None,
                  bacen_id=None, status=None, type=None, key_type=None, flow=None, claimer_bank_code=None, claimed_bank_code=None,
                  created=None, updated=None):
         Resource.__init__(self, id=id)
 
-        self.account_created = check_datetime(account_created)
+        self.account_created = account_created
         self.account_number = account_number
         self.account_type = account_type
         self.branch_code = branch_code
@@ -52,8 +63,8 @@ class PixClaim(Resource):
         self.flow = flow
         self.claimer_bank_code = claimer_bank_code
         self.claimed_bank_code = claimed_bank_code
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixClaim, "name": "PixClaim"}
@@ -73,20 +84,40 @@ def create(claim, user=None):
     return rest.post_single(resource=_resource, entity=claim, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a PixClaim object
     Retrieve a PixClaim object linked to your Workspace in the Stark Infra API by its id.
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixClaim object that corresponds to the given id.
     """
-    return rest.get_id(id=id, resource=_resource, user=user)
+    return rest.get_id(id=id, resource=_resource, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixClaims
+    Retrieve a PixClaim objects linked to your Workspace in the Stark Infra API by their ids.
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixClaim objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(ids=ids, id_filter="ids", resource=_resource, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, key_type=None, key_id=None, flow=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, key_type=None,
+          key_id=None, flow=None, tags=None, parallel=None, progress=None, output=None, raw=False, fields=None,
+          user=None):
     """# Retrieve PixClaims
     Receive a generator of PixClaim objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -101,6 +132,11 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
     - key_id [string, default None]: filter PixClaims linked to a specific PixKey id. ex: "+5511989898989"
     - flow [string, default None]: direction of the Pix Claim. Options: "in" if you received the PixClaim or "out" if you created the PixClaim.
     - tags [list of strings, default None]: list of strings to filter retrieved objects. ex: ["travel", "food"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixClaim objects with updated attributes
@@ -119,11 +155,17 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
         key_id=key_id,
         flow=flow,
         tags=tags,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, key_type=None, key_id=None, flow=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None,
+         key_type=None, key_id=None, flow=None, tags=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixClaims
     Receive a list of up to 100 PixClaim objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -140,6 +182,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - key_id [string, default None]: filter PixClaims linked to a specific PixKey id. Example: "+5511989898989"
     - flow [string, default None]: direction of the Pix Claim. Options: "in" if you received the PixClaim or "out" if you created the PixClaim.
     - tags [list of strings, default None]: list of strings to filter retrieved objects. ex: ["travel", "food"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixClaim objects with updated attributes and cursor to retrieve the next page of PixClaim objects
@@ -158,6 +203,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         key_id=key_id,
         flow=flow,
         tags=tags,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -20,6 +20,8 @@ class PixDirector(Resource):
     - status [string]: current PixDirector status. ex: "success"
     """
 
+    __slots__ = ("id", "name", "tax_id", "phone", "email", "password", "team_email", "team_phones", "status")
+
     def __init__(self, name, tax_id, phone, email, password, team_email, team_phones, id=None, status=None):
         Resource.__init__(self, id=id)
 
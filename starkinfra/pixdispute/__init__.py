@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__pixdispute import create, get, query, page, cancel
+from .__pixdispute import create, get, get_many, query, page, cancel
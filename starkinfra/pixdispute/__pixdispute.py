@@ -4,6 +4,7 @@ from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from .transaction.__transaction import Transaction
 from .transaction.__transaction import _sub_resource as _transaction_resource
+from ..utils.lazy import lazy
 
 
 class PixDispute(Resource):
@@ -35,6 +36,16 @@ class PixDispute(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixDispute. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "reference_id", "method", "operator_email", "operator_phone", "description", "tags",
+        "min_transaction_amount", "max_transaction_count", "max_hop_interval", "max_hop_count", "bacen_id", "flow",
+        "status", "_transactions", "_created", "_updated",
+    )
+
+    transactions = lazy(lambda transactions: _parse_transactions(transactions))
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, reference_id, method, operator_email, operator_phone, description=None,
                  tags=None, min_transaction_amount=None, max_transaction_count=None, max_hop_interval=None,
                  max_hop_count=None, bacen_id=None, flow=None, status=None, transactions=None,
@@ -54,9 +65,9 @@ class PixDispute(Resource):
         self.bacen_id = bacen_id
         self.flow = flow
         self.status = status
-        self.transactions = _parse_transactions(transactions)
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.transactions = transactions
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixDispute, "name": "PixDispute"}
@@ -75,20 +86,39 @@ def create(requests, user=None):
     return rest.post_multi(resource=_resource, entities=requests, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific PixDispute
     Receive a single PixDispute object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixDispute object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixDisputes
+    Receive PixDispute objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixDispute objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None, tags=None,
+          parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve PixDisputes
     Receive a generator of PixDispute objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -100,6 +130,11 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
     - bacen_id [string, default None]: Central Bank's unique dispute id to filter retrieved objects. ex: "817fc523-9e9d-40ab-9e53-dacb71454a05"
     - reference_ids [list of strings, default None]: list of end_to_end_ids of the reported transactions to filter retrieved objects. ex: ["E20018183202201201450u34sDjD7334"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixDispute objects with updated attributes
@@ -114,11 +149,17 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
         bacen_id=bacen_id,
         reference_ids=reference_ids,
         tags=tags,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, reference_ids=None,
+         tags=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixDisputes
     Receive a list of up to 100 PixDispute objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -132,6 +173,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - bacen_id [string, default None]: Central Bank's unique dispute id to filter retrieved objects. ex: "817fc523-9e9d-40ab-9e53-dacb71454a05"
     - reference_ids [list of strings, default None]: list of end_to_end_ids of the reported transactions to filter retrieved objects. ex: ["E20018183202201201450u34sDjD7334"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixDispute objects with updated attributes
@@ -148,6 +192,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         bacen_id=bacen_id,
         reference_ids=reference_ids,
         tags=tags,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
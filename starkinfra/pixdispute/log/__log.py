@@ -1,8 +1,10 @@
+from functools import partial
 from ...utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.api import from_api_json
 from starkcore.utils.checks import check_datetime, check_date
 from ..__pixdispute import _resource as _pixdispute_resource
+from ...utils.lazy import lazy
 
 
 class Log(Resource):
@@ -16,32 +18,57 @@ class Log(Resource):
     - errors [list of strings]: list of errors linked to this PixDispute event
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
+
+    __slots__ = ("id", "_dispute", "type", "errors", "_created")
+
+    dispute = lazy(partial(from_api_json, _pixdispute_resource))
+    created = lazy(check_datetime)
+
     def __init__(self, id, dispute, type, errors, created):
         Resource.__init__(self, id=id)
 
-        self.dispute = from_api_json(_pixdispute_resource, dispute)
+        self.dispute = dispute
         self.type = type
         self.errors = errors
-        self.created = check_datetime(created)
+        self.created = created
 
 
 _resource = {"class": Log, "name": "PixDisputeLog"}
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific PixDispute.Log
     Receive a single PixDispute.Log object previously created by the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixDispute.Log object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixDispute.Logs
+    Receive PixDispute.Log objects previously created by the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixDispute.Log objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, ids=None, dispute_ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, ids=None, dispute_ids=None, parallel=None, progress=None,
+          output=None, raw=False, fields=None, user=None):
     """# Retrieve PixDispute.Logs
     Receive a generator of PixDispute.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +78,11 @@ def query(limit=None, after=None, before=None, types=None, ids=None, dispute_ids
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - ids [list of strings, default None]: list of PixDispute.Log ids to filter retrieved objects. ex: ["6767676767676767", "4545454545454545"]
     - dispute_ids [list of strings, default None]: list of PixDispute ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixDispute.Log objects with updated attributes
@@ -63,11 +95,17 @@ def query(limit=None, after=None, before=None, types=None, ids=None, dispute_ids
         types=types,
         ids=ids,
         dispute_ids=dispute_ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, types=None, ids=None, dispute_ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, types=None, ids=None, dispute_ids=None, output=None,
+         raw=False, fields=None, user=None):
     """# Retrieve paged PixDispute.Logs
     Receive a list of up to 100 PixDispute.Log objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -79,6 +117,9 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, ids=None,
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - ids [list of strings, default None]: list of PixDispute.Log ids to filter retrieved objects. ex: ["6767676767676767", "4545454545454545"]
     - dispute_ids [list of strings, default None]: list of PixDispute IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixDispute.Log objects with updated attributes
@@ -93,5 +134,8 @@ def page(cursor=None, limit=None, after=None, before=None, types=None, ids=None,
         types=types,
         ids=ids,
         dispute_ids=dispute_ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
@@ -21,6 +21,12 @@ class Transaction(SubResource):
     - settled [datetime.datetime]: settled datetime of the transaction. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "end_to_end_id", "amount", "nominal_amount", "receiver_type", "receiver_tax_id_created",
+        "receiver_account_created", "receiver_bank_code", "receiver_id", "sender_type", "sender_tax_id_created",
+        "sender_account_created", "sender_bank_code", "sender_id", "settled",
+    )
+
     def __init__(self, end_to_end_id=None, amount=None, nominal_amount=None, receiver_type=None,
                  receiver_tax_id_created=None, receiver_account_created=None, receiver_bank_code=None,
                  receiver_id=None, sender_type=None, sender_tax_id_created=None, sender_account_created=None,
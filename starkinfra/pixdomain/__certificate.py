@@ -8,6 +8,8 @@ class Certificate(SubResource):
     - content [string]: certificate of the Pix participant in PEM format.
     """
 
+    __slots__ = ("content",)
+
     def __init__(self, content=None):
         self.content = content
 
@@ -2,6 +2,7 @@ from ..utils import rest
 from .__certificate import _resource as _certificate_resource
 from starkcore.utils.api import from_api_json
 from starkcore.utils.subresource import SubResource
+from ..utils.lazy import lazy
 
 
 class PixDomain(SubResource):
@@ -13,8 +14,12 @@ class PixDomain(SubResource):
     - name [string]: current active domain (URL) of the Pix participant.
     """
 
+    __slots__ = ("_certificates", "name")
+
+    certificates = lazy(lambda certificates: _parse_certificates(certificates))
+
     def __init__(self, certificates=None, name=None):
-        self.certificates = _parse_certificates(certificates)
+        self.certificates = certificates
         self.name = name
 
 
@@ -25,12 +30,15 @@ def _parse_certificates(certificates):
 _resource = {"class": PixDomain, "name": "PixDomain"}
 
 
-def query(user=None):
+def query(output=None, raw=False, fields=None, user=None):
     """# Retrieve PixDomains
     Receive a generator of PixDomain objects.
     ## Parameters (optional):
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixDomain objects with updated attributes
     """
-    return rest.get_stream(resource=_resource, user=user)
+    return rest.get_stream(resource=_resource, output=output, raw=raw, fields=fields, user=user)
@@ -1,3 +1,3 @@
-from .__pixfraud import create, get, query, page, cancel
+from .__pixfraud import create, get, get_many, query, page, cancel
 from .log.__log import Log
 from . import log
@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class PixFraud(Resource):
@@ -25,6 +26,11 @@ class PixFraud(Resource):
     - updated [string]: latest update datetime for the PixFraud. ex: "2020-03-10 10:30:00.000000+00:00"
     """
 
+    __slots__ = ("id", "external_id", "type", "tax_id", "key_id", "tags", "bacen_id", "status", "_created", "_updated")
+
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self,  external_id, type, tax_id, key_id=None, tags=None, id=None,
                  bacen_id=None, status=None, created=None, updated=None):
         Resource.__init__(self, id=id)
@@ -36,8 +42,8 @@ class PixFraud(Resource):
         self.tags = tags
         self.bacen_id = bacen_id
         self.status = status
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixFraud, "name": "PixFraud"}
@@ -56,20 +62,39 @@ def create(frauds, user=None):
     return rest.post_multi(resource=_resource, entities=frauds, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a PixFraud object
     Retrieve the PixFraud object linked to your Workspace in the Stark Infra API using its id.
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixFraud object that corresponds to the given id.
     """
-    return rest.get_id(id=id, resource=_resource, user=user)
+    return rest.get_id(id=id, resource=_resource, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixFrauds
+    Retrieve the PixFraud objects linked to your Workspace in the Stark Infra API using its id.
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixFraud objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(ids=ids, id_filter="ids", resource=_resource, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, flow=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, flow=None, tags=None,
+          parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve PixFrauds
     Receive a generator of PixFraud objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -81,6 +106,11 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
     - bacen_id [string, default None]: unique transaction id returned from Central Bank. ex: "ccf9bd9c-e99d-999e-bab9-b999ca999f99"
     - type [list of strings, default None]: filter for the type of retrieved PixFrauds. Options: "reversal", "reversalChargeback"
     - tags [list of strings, default None]: list of strings for tagging. ex: ["fraudulent"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixFraud objects with updated attributes
@@ -96,12 +126,18 @@ def query(limit=None, after=None, before=None, status=None, ids=None, bacen_id=N
         type=type,
         flow=flow,
         tags=tags,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None, flow=None, tags=None,
-         user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, bacen_id=None, type=None,
+         flow=None, tags=None,
+         output=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixFraud
     Receive a list of up to 100 PixFraud objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -115,6 +151,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - bacen_id [string, default None]: unique transaction id returned from Central Bank. ex: "ccf9bd9c-e99d-999e-bab9-b999ca999f99"
     - type [list of strings, default None]: filter for the type of retrieved PixFrauds. Options: "reversal", "reversalChargeback"
     - tags [list of strings, default None]: list of strings for tagging. ex: ["fraudulent"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixFraud objects with updated attributes and cursor to retrieve the next page of PixFraud objects
@@ -131,6 +170,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         type=type,
         flow=flow,
         tags=tags,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
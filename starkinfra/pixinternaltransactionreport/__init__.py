@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__pixinternaltransactionreport import create, get, query, page
+from .__pixinternaltransactionreport import create, get, get_many, query, page
@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class PixInternalTransactionReport(Resource):
@@ -36,6 +37,16 @@ class PixInternalTransactionReport(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixInternalTransactionReport. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "amount", "_created", "end_to_end_id", "method", "reference_type", "sender_account_number",
+        "sender_branch_code", "sender_account_type", "sender_bank_code", "sender_tax_id", "receiver_account_number",
+        "receiver_branch_code", "receiver_account_type", "receiver_bank_code", "receiver_tax_id", "receiver_key_id",
+        "return_id", "status", "_updated",
+    )
+
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, amount, created, end_to_end_id, method, reference_type, sender_account_number,
                  sender_branch_code, sender_account_type, sender_bank_code, sender_tax_id, receiver_account_number,
                  receiver_branch_code, receiver_account_type, receiver_bank_code, receiver_tax_id, receiver_key_id=None,
@@ -43,7 +54,7 @@ class PixInternalTransactionReport(Resource):
         Resource.__init__(self, id=id)
 
         self.amount = amount
-        self.created = check_datetime(created)
+        self.created = created
         self.end_to_end_id = end_to_end_id
         self.method = method
         self.reference_type = reference_type
@@ -60,7 +71,7 @@ class PixInternalTransactionReport(Resource):
         self.receiver_key_id = receiver_key_id
         self.return_id = return_id
         self.status = status
-        self.updated = check_datetime(updated)
+        self.updated = updated
 
 
 _resource = {"class": PixInternalTransactionReport, "name": "PixInternalTransactionReport"}
@@ -79,20 +90,39 @@ def create(reports, user=None):
     return rest.post_multi(resource=_resource, entities=reports, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific PixInternalTransactionReport
     Receive a single PixInternalTransactionReport object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixInternalTransactionReport object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixInternalTransactionReports
+    Receive PixInternalTransactionReport objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixInternalTransactionReport objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, user=None):
+def query(limit=None, after=None, before=None, status=None, ids=None, parallel=None, progress=None, output=None,
+          raw=False, fields=None, user=None):
     """# Retrieve PixInternalTransactionReports
     Receive a generator of PixInternalTransactionReport objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -101,6 +131,11 @@ def query(limit=None, after=None, before=None, status=None, ids=None, user=None)
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "processing", "success", "failed"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixInternalTransactionReport objects with updated attributes
@@ -112,11 +147,17 @@ def query(limit=None, after=None, before=None, status=None, ids=None, user=None)
         before=check_date(before),
         status=status,
         ids=ids,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged PixInternalTransactionReports
     Receive a list of up to 100 PixInternalTransactionReport objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -127,6 +168,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "processing", "success", "failed"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixInternalTransactionReport objects with updated attributes
@@ -140,5 +184,8 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, ids=None
         before=check_date(before),
         status=status,
         ids=ids,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
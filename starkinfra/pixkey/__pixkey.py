@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class PixKey(Resource):
@@ -32,25 +33,34 @@ class PixKey(Resource):
     - owner_statistics [list of Statistic objects]: list of objects with data regarding the Pix user statistics.
     """
 
+    __slots__ = (
+        "id", "_account_created", "account_number", "account_type", "branch_code", "name", "tax_id", "tags", "_owned",
+        "owner_type", "status", "bank_code", "bank_name", "type", "_created", "statistics", "owner_statistics",
+    )
+
+    account_created = lazy(check_datetime)
+    owned = lazy(check_datetime)
+    created = lazy(check_datetime)
+
     def __init__(self, account_created, account_number, account_type, branch_code, name, tax_id, id=None, tags=None,
                  owned=None, owner_type=None, status=None, bank_code=None, bank_name=None, type=None, created=None, statistics=None, owner_statistics=None):
         
         Resource.__init__(self, id=id)
 
-        self.account_created = check_datetime(account_created)
+        self.account_created = account_created
         self.account_number = account_number
         self.account_type = account_type
         self.branch_code = branch_code
         self.name = name
         self.tax_id = tax_id
         self.tags = tags
-        self.owned = check_datetime(owned)
+        self.owned = owned
         self.owner_type = owner_type
         self.status = status
         self.bank_code = bank_code
         self.bank_name = bank_name
         self.type = type
-        self.created = check_datetime(created)
+        self.created = created
         self.statistics = statistics
         self.owner_statistics = owner_statistics
 
@@ -71,7 +81,7 @@ def create(key, user=None):
     return rest.post_single(resource=_resource, entity=key, user=user)
 
 
-def get(id, payer_id, end_to_end_id=None, user=None, expand=None):
+def get(id, payer_id, end_to_end_id=None, raw=False, fields=None, user=None, expand=None):
     """# Retrieve a PixKey object
     Retrieve the PixKey object linked to your Workspace in the Stark Infra API by its id.
     ## Parameters (required):
@@ -79,16 +89,46 @@ def get(id, payer_id, end_to_end_id=None, user=None, expand=None):
     - payer_id [string]: tax id (CPF/CNPJ) of the individual or business requesting the PixKey information. This id is used by the Central Bank to limit request rates. ex: "20.018.183/0001-80"
     ## Parameters (optional):
     - end_to_end_id [string, default None]: central bank's unique transaction id. If the request results in the creation of a PixRequest, the same endToEndId should be used. If this parameter is not passed, one endToEndId will be automatically created. Example: "E00002649202201172211u34srod19le"
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     - expand [list of strings, default None]: fields to expand information. ex: ["statistics", "owner_statistics"]
     ## Return:
     - PixKey object that corresponds to the given id.
     """
 
-    return rest.get_id(id=id, payer_id=payer_id, end_to_end_id=end_to_end_id, resource=_resource, user=user, expand=expand)
+    return rest.get_id(id=id, payer_id=payer_id, end_to_end_id=end_to_end_id, resource=_resource, raw=raw, fields=fields, user=user, expand=expand)
+
+
+def get_many(ids, payer_id, raw=False, fields=None, user=None, expand=None):
+    """# Retrieve specific PixKeys
+    Retrieve the PixKey objects linked to your Workspace in the Stark Infra API by their ids.
+    They are fetched by one request per id, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    - payer_id [string]: tax id (CPF/CNPJ) of the individual or business requesting the PixKey information. This id is used by the Central Bank to limit request rates. ex: "20.018.183/0001-80"
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    - expand [list of strings, default None]: fields to expand information. ex: ["statistics", "owner_statistics"]
+    ## Return:
+    - dictionary of PixKey objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(
+        ids=ids,
+        id_filter=None,
+        payer_id=payer_id,
+        resource=_resource,
+        raw=raw,
+        fields=fields,
+        user=user,
+        expand=expand,
+    )
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None, tax_id=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None, tax_id=None,
+          parallel=None, progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve PixKeys
     Receive a generator of PixKey objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -100,6 +140,11 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - type [string, default None]: filter for the type of retrieved PixKeys. Options: "cpf", "cnpj", "phone", "email" and "evp"
     - tax_id [string, default None]: filter for the tax id (CPF/CNPJ) of the holder linked to the retrieved PixKeys. ex: "012.345.678-90"
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixKey objects with updated attributes
@@ -114,12 +159,17 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         ids=ids,
         type=type,
         tax_id=tax_id,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None,
-         tax_id=None, user=None):
+         tax_id=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixKeys
     Receive a generator of PixKey objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -132,6 +182,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - type [string, default None]: filter for the type of retrieved PixKeys. Options: "cpf", "cnpj", "phone", "email" and "evp"
     - tax_id [string, default None]: filter for the tax id (CPF/CNPJ) of the holder linked to the retrieved PixKeys. ex: "012.345.678-90"
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - cursor to retrieve the next page of PixKey objects
@@ -148,6 +201,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         ids=ids,
         type=type,
         tax_id=tax_id,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
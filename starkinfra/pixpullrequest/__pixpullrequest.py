@@ -1,6 +1,7 @@
 from ..utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
+from ..utils.lazy import lazy
 
 
 class PixPullRequest(Resource):
@@ -41,6 +42,17 @@ class PixPullRequest(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixPullRequest.
     """
 
+    __slots__ = (
+        "id", "amount", "_due", "end_to_end_id", "receiver_account_number", "receiver_account_type",
+        "receiver_bank_code", "reconciliation_id", "subscription_id", "attempt_type", "description",
+        "receiver_branch_code", "tags", "status", "flow", "receiver_name", "receiver_tax_id", "sender_bank_code",
+        "sender_final_name", "sender_tax_id", "subscription_bacen_id", "_created", "_updated",
+    )
+
+    due = lazy(check_datetime)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, amount, due, end_to_end_id, receiver_account_number, receiver_account_type,
                  receiver_bank_code, reconciliation_id, subscription_id,
                  attempt_type=None, description=None, receiver_branch_code=None, tags=None,
@@ -50,7 +62,7 @@ class PixPullRequest(Resource):
         Resource.__init__(self, id=id)
 
         self.amount = amount
-        self.due = check_datetime(due)
+        self.due = due
         self.end_to_end_id = end_to_end_id
         self.receiver_account_number = receiver_account_number
         self.receiver_account_type = receiver_account_type
@@ -69,8 +81,8 @@ class PixPullRequest(Resource):
         self.sender_final_name = sender_final_name
         self.sender_tax_id = sender_tax_id
         self.subscription_bacen_id = subscription_bacen_id
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixPullRequest, "name": "PixPullRequest"}
@@ -89,21 +101,40 @@ def create(requests, user=None):
     return rest.post_multi(resource=_resource, entities=requests, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific PixPullRequest
     Receive a single PixPullRequest object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixPullRequest object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixPullRequests
+    Receive PixPullRequest objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixPullRequest objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
 def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
-          subscription_ids=None, flows=None, user=None):
+          subscription_ids=None, flows=None, parallel=None, progress=None, output=None, raw=False, fields=None,
+          user=None):
     """# Retrieve PixPullRequests
     Receive a generator of PixPullRequest objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -115,6 +146,11 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - subscription_ids [list of strings, default None]: filter by parent PixPullSubscription ids. ex: ["5656565656565656", "4545454545454545"]
     - flows [list of strings, default None]: direction of money flow to filter retrieved objects. Options: "in", "out".
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixPullRequest objects with updated attributes
@@ -129,12 +165,17 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         ids=ids,
         subscription_ids=subscription_ids,
         flows=flows,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
 def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None,
-         ids=None, subscription_ids=None, flows=None, user=None):
+         ids=None, subscription_ids=None, flows=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged PixPullRequests
     Receive a list of up to 100 PixPullRequest objects previously created and a cursor for the next page.
     ## Parameters (optional):
@@ -147,6 +188,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - subscription_ids [list of strings, default None]: filter by parent PixPullSubscription ids. ex: ["5656565656565656", "4545454545454545"]
     - flows [list of strings, default None]: direction of money flow to filter retrieved objects. Options: "in", "out".
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixPullRequest objects with updated attributes
@@ -163,6 +207,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         ids=ids,
         subscription_ids=subscription_ids,
         flows=flows,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -2,6 +2,7 @@ from ..utils import rest
 from ..utils.parse import parse_and_verify
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_datetime_or_date, check_date
+from ..utils.lazy import lazy
 
 
 class PixPullSubscription(Resource):
@@ -47,6 +48,20 @@ class PixPullSubscription(Resource):
     - updated [datetime.datetime]: latest update datetime for the PixPullSubscription. ex: datetime.datetime(2026, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "bacen_id", "external_id", "_installment_start", "interval", "receiver_name", "receiver_tax_id",
+        "receiver_bank_code", "reference_code", "sender_account_number", "sender_bank_code", "sender_branch_code",
+        "sender_city_code", "sender_tax_id", "type", "amount", "amount_min_limit", "description", "_due",
+        "_installment_end", "pull_retry_limit", "sender_final_name", "sender_final_tax_id", "tags", "status", "flow",
+        "_created", "_updated",
+    )
+
+    installment_start = lazy(check_datetime)
+    due = lazy(check_datetime_or_date)
+    installment_end = lazy(check_datetime_or_date)
+    created = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, bacen_id, external_id, installment_start, interval, receiver_name, receiver_tax_id,
                  receiver_bank_code, reference_code, sender_account_number, sender_bank_code,
                  sender_branch_code, sender_city_code, sender_tax_id,
@@ -58,7 +73,7 @@ class PixPullSubscription(Resource):
 
         self.bacen_id = bacen_id
         self.external_id = external_id
-        self.installment_start = check_datetime(installment_start)
+        self.installment_start = installment_start
         self.interval = interval
         self.receiver_name = receiver_name
         self.receiver_tax_id = receiver_tax_id
@@ -75,18 +90,18 @@ class PixPullSubscription(Resource):
         self.description = description
         if due == "":
             due = None
-        self.due = check_datetime_or_date(due)
+        self.due = due
         if installment_end == "":
             installment_end = None
-        self.installment_end = check_datetime_or_date(installment_end)
+        self.installment_end = installment_end
         self.pull_retry_limit = pull_retry_limit
         self.sender_final_name = sender_final_name
         self.sender_final_tax_id = sender_final_tax_id
         self.tags = tags
         self.status = status
         self.flow = flow
-        self.created = check_datetime(created)
-        self.updated = check_datetime(updated)
+        self.created = created
+        self.updated = updated
 
 
 _resource = {"class": PixPullSubscription, "name": "PixPullSubscription"}
@@ -105,20 +120,39 @@ def create(subscriptions, user=None):
     return rest.post_multi(resource=_resource, entities=subscriptions, user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific PixPullSubscription
     Receive a single PixPullSubscription object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixPullSubscription object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific PixPullSubscriptions
+    Receive PixPullSubscription objects previously created in the Stark Infra API by their ids
+    They are fetched by queries of up to 100 ids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixPullSubscription objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter="ids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, flows=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, flows=None, parallel=None,
+          progress=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve PixPullSubscriptions
     Receive a generator of PixPullSubscription objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -129,6 +163,11 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - flows [list of strings, default None]: direction of money flow to filter retrieved objects. Options: "in", "out".
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixPullSubscription objects with updated attributes
@@ -142,11 +181,17 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         tags=tags,
         ids=ids,
         flows=flows,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, flows=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, status=None, tags=None, ids=None, flows=None, output=None,
+         raw=False, fields=None, user=None):
     """# Retrieve paged PixPullSubscriptions
     Receive a list of up to 100 PixPullSubscription objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -159,6 +204,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - flows [list of strings, default None]: direction of money flow to filter retrieved objects. Options: "in", "out".
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of PixPullSubscription objects with updated attributes
@@ -174,6 +222,9 @@ def page(cursor=None, limit=None, after=None, before=None, status=None, tags=Non
         tags=tags,
         ids=ids,
         flows=flows,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
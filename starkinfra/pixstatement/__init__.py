@@ -1 +1 @@
-from .__pixstatement import create, get, query, page, csv
+from .__pixstatement import create, get, get_many, query, page, csv
@@ -1,3 +1,3 @@
 from .statistics.__statistics import Statistics
-from .__pixuser import get
+from .__pixuser import get, get_many
 
@@ -3,6 +3,7 @@ from starkcore.utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from .statistics.__statistics import Statistics
 from .statistics.__statistics import _sub_resource as _statistics_resource
+from ..utils.lazy import lazy
 
 
 class PixUser(Resource):
@@ -14,10 +15,14 @@ class PixUser(Resource):
     - statistics [list of PixUser.Statistics, default []]: list of PixUser.Statistics objects. ex: [PixUser.Statistics(after="2023-11-06T18:57:08.325090+00:00", source="pix-key")]
     """
 
+    __slots__ = ("id", "_statistics")
+
+    statistics = lazy(lambda statistics: _parse_statistics(statistics))
+
     def __init__(self, id, statistics=None):
         Resource.__init__(self, id=id)
 
-        self.statistics = _parse_statistics(statistics)
+        self.statistics = statistics
 
 
 PixUser.Statistics = Statistics
@@ -37,15 +42,35 @@ def _parse_statistics(statistics):
     return parsed_statistics
 
 
-def get(id, key_id=None, user=None):
+def get(id, key_id=None, raw=False, fields=None, user=None):
     """# Retrieve a PixUser object
     Receive a single PixUser object information by passing its taxId
     ## Parameters (required):
     - id [string]: user tax ID (CPF or CNPJ) with or without formatting. ex: "01234567890" or "20.018.183/0001-80"
     ## Parameters (optional):
     - key_id [string]: marked PixKey id. ex: "+5511989898989"
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - PixUser object that corresponds to the given id.
     """
-    return rest.get_id(id=id, resource=_resource, key_id=key_id, user=user)
+    return rest.get_id(id=id, resource=_resource, key_id=key_id, raw=raw, fields=fields, user=user)
+
+
+
+def get_many(ids, key_id=None, raw=False, fields=None, user=None):
+    """# Retrieve specific PixUsers
+    Receive PixUser objects information by passing its taxId
+    They are fetched by one request per id, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - key_id [string]: marked PixKey id. ex: "+5511989898989"
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixUser objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(ids=ids, id_filter=None, resource=_resource, key_id=key_id, raw=raw, fields=fields, user=user)
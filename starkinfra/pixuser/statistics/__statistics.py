@@ -1,5 +1,6 @@
 from starkcore.utils.subresource import SubResource
 from starkcore.utils.checks import check_datetime
+from ...utils.lazy import lazy
 
 
 class Statistics(SubResource):
@@ -13,12 +14,17 @@ class Statistics(SubResource):
     - updated [datetime.datetime]: latest update datetime for the statistic. ex: datetime.datetime(2020, 4, 23, 23, 0, 0)
     """
 
+    __slots__ = ("value", "type", "source", "_after", "_updated")
+
+    after = lazy(check_datetime)
+    updated = lazy(check_datetime)
+
     def __init__(self, value=None, type=None, source=None, after=None, updated=None):
         self.value = value
         self.type = type
         self.source = source
-        self.after = check_datetime(after)
-        self.updated = check_datetime(updated)
+        self.after = after
+        self.updated = updated
 
 
 _sub_resource = {"class": Statistics, "name": "Statistics"}
@@ -1 +1 @@
-from .__staticbrcode import create, get, query, page
+from .__staticbrcode import create, get, get_many, query, page
@@ -1,6 +1,7 @@
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ..utils import rest
+from ..utils.lazy import lazy
 
 
 class StaticBrcode(Resource):
@@ -28,6 +29,14 @@ class StaticBrcode(Resource):
     - created [datetime.datetime]: creation datetime for the StaticBrcode. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    __slots__ = (
+        "id", "name", "key_id", "city", "amount", "cashier_bank_code", "reconciliation_id", "description", "tags",
+        "type", "uuid", "url", "_updated", "_created",
+    )
+
+    updated = lazy(check_datetime)
+    created = lazy(check_datetime)
+
     def __init__(self, name, key_id, city, amount=None, cashier_bank_code=None, reconciliation_id=None, tags=None,
                  id=None, description=None, type=None, uuid=None, url=None, updated=None, created=None):
         Resource.__init__(self, id=id)
@@ -43,8 +52,8 @@ class StaticBrcode(Resource):
         self.type = type
         self.uuid = uuid
         self.url = url
-        self.updated = check_datetime(updated)
-        self.created = check_datetime(created)
+        self.updated = updated
+        self.created = created
 
 
 _resource = {"class": StaticBrcode, "name": "StaticBrcode"}
@@ -63,20 +72,39 @@ def create(brcodes, user=None):
     return rest.post_multi(resource=_resource, entities=brcodes, user=user)
 
 
-def get(uuid, user=None):
+def get(uuid, raw=False, fields=None, user=None):
     """# Retrieve a specific StaticBrcode
     Receive a single StaticBrcode object previously created in the Stark Infra API by its uuid
     ## Parameters (required):
     - uuid [string]: object's unique uuid. ex: "97756273400d42ce9086404fe10ea0d6"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - StaticBrcode object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=uuid, user=user)
+    return rest.get_id(resource=_resource, id=uuid, raw=raw, fields=fields, user=user)
+
+
+def get_many(uuids, raw=False, fields=None, user=None):
+    """# Retrieve specific StaticBrcodes
+    Receive StaticBrcode objects previously created in the Stark Infra API by their uuids
+    They are fetched by queries of up to 100 uuids each, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - uuids [list of strings]: objects unique uuids. ex: ["97756273400d42ce9086404fe10ea0d6", "bb2f8ba4a0a54ef79b2c83ab1a9ef35b"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - dictionary of StaticBrcode objects with updated attributes by uuid, in the order of the given uuids. Uuids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=uuids, id_filter="uuids", raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, uuids=None, tags=None, parallel=None, progress=None, output=None,
+          raw=False, fields=None, user=None):
     """# Retrieve StaticBrcodes
     Receive a generator of StaticBrcode objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -85,6 +113,11 @@ def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None)
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["97756273400d42ce9086404fe10ea0d6", "e3da0b6d56fa4045b9b295b2be82436e"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - parallel [integer, default None]: number of date windows between after and before to be fetched concurrently and merged in creation order. Requires after. ex: 4
+    - progress [function, default None]: function called by each window as it advances, with its after and before dates, the number of objects retrieved so far and whether it is finished. ex: lambda after, before, count, finished: print(after, before, count)
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of StaticBrcode objects with updated attributes
@@ -96,11 +129,17 @@ def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None)
         before=check_date(before),
         uuids=uuids,
         tags=tags,
+        parallel=parallel,
+        progress=progress,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None, output=None, raw=False,
+         fields=None, user=None):
     """# Retrieve paged StaticBrcodes
     Receive a list of up to 100 StaticBrcode objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -111,6 +150,9 @@ def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["97756273400d42ce9086404fe10ea0d6", "e3da0b6d56fa4045b9b295b2be82436e"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - list of StaticBrcode objects with updated attributes
@@ -124,5 +166,8 @@ def page(cursor=None, limit=None, after=None, before=None, uuids=None, tags=None
         before=check_date(before),
         uuids=uuids,
         tags=tags,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
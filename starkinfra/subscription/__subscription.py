@@ -1,5 +1,6 @@
 from starkcore.utils.subresource import SubResource
 from starkcore.utils.checks import check_datetime_or_date
+from ..utils.lazy import lazy
 
 
 class Subscription(SubResource):
@@ -26,6 +27,17 @@ class Subscription(SubResource):
     - updated [datetime.datetime]: last update datetime for the subscription. ex: datetime(2020, 3, 10)
     """
 
+    __slots__ = (
+        "amount", "amount_min_limit", "bacen_id", "_created", "description", "_installment_end", "_installment_start",
+        "interval", "pull_retry_limit", "receiver_bank_code", "receiver_name", "receiver_tax_id", "reference_code",
+        "sender_final_name", "sender_final_tax_id", "status", "type", "_updated",
+    )
+
+    created = lazy(check_datetime_or_date)
+    installment_end = lazy(check_datetime_or_date)
+    installment_start = lazy(check_datetime_or_date)
+    updated = lazy(check_datetime_or_date)
+
     def __init__(self, amount, amount_min_limit=None, bacen_id=None, created=None, description=None,
         installment_end=None, installment_start=None, interval=None, pull_retry_limit=None, receiver_bank_code=None,
         receiver_name=None, receiver_tax_id=None, reference_code=None, sender_final_name=None, sender_final_tax_id=None,
@@ -34,10 +46,10 @@ class Subscription(SubResource):
         self.amount = amount
         self.amount_min_limit = amount_min_limit
         self.bacen_id = bacen_id
-        self.created = check_datetime_or_date(created)
+        self.created = created
         self.description = description
-        self.installment_end = check_datetime_or_date(installment_end)
-        self.installment_start = check_datetime_or_date(installment_start)
+        self.installment_end = installment_end
+        self.installment_start = installment_start
         self.interval = interval
         self.pull_retry_limit = pull_retry_limit
         self.receiver_bank_code = receiver_bank_code
@@ -48,7 +60,7 @@ class Subscription(SubResource):
         self.sender_final_tax_id = sender_final_tax_id
         self.status = status
         self.type = type
-        self.updated = check_datetime_or_date(updated)
+        self.updated = updated
 
 
 _resource = {"class": Subscription, "name": "Subscription"}
@@ -0,0 +1,143 @@
+from time import time
+from threading import Lock
+from collections import deque
+from starkcore.utils.checks import check_timedelta
+from ..error import CircuitOpenError
+from .retry import _statuses
+
+
+_closed = "closed"
+_opened = "open"
+_halfOpen = "half-open"
+
+
+class CircuitBreaker:
+    """# CircuitBreaker object
+    The CircuitBreaker object stops sending requests to a resource of a host that keeps failing,
+    so workers fail fast with a CircuitOpenError instead of each waiting out the full timeout.
+    Every host and resource has its own circuit, which opens when too many of its recent requests
+    fail or are slower than the latency threshold. After the cooldown, a single probe request is
+    let through: the circuit closes again if it succeeds, or stays open for another cooldown if not.
+    No circuit breaking is done by default, but you may enable it at the start (See README).
+    ## Parameters (optional):
+    - error_rate [float, default 0.5]: fraction of failed recent requests that opens a circuit. ex: 0.3
+    - latency [integer, float or datetime.timedelta, default None]: seconds past which a response counts as a failure. Only errors count if None. ex: 5
+    - window [integer, default 20]: number of recent requests considered for each circuit. ex: 50
+    - min_requests [integer, default 10]: number of recent requests needed before a circuit may open. ex: 20
+    - cooldown [integer, float or datetime.timedelta, default 30]: seconds an open circuit waits before sending a probe. ex: 10
+    ## Attributes (return-only):
+    - opens [integer]: number of times a circuit opened so far. ex: 2
+    - rejections [integer]: number of requests refused by open circuits so far. ex: 150
+    """
+
+    def __init__(self, error_rate=0.5, latency=None, window=20, min_requests=10, cooldown=30):
+        self.error_rate = error_rate
+        self.latency = check_timedelta(latency).total_seconds() if latency is not None else None
+        self.window = window
+        self.min_requests = min_requests
+        self.cooldown = check_timedelta(cooldown).total_seconds()
+        self.opens = 0
+        self.rejections = 0
+        self._circuits = {}
+        self._lock = Lock()
+
+    def enter(self, scope):
+        """# Admit a request
+        Let a request through the scope's circuit, or raise a CircuitOpenError if the circuit is open.
+        A half-open circuit lets a single probe through at a time.
+        ## Parameters (required):
+        - scope [string]: host and resource of the request. ex: "sandbox.api.starkinfra.com pix-key"
+        """
+        now = time()
+        with self._lock:
+            circuit = self._circuit(scope)
+            if circuit.state == _closed:
+                return
+            if circuit.state == _opened and now - circuit.changed >= self.cooldown:
+                circuit.state = _halfOpen
+                circuit.probing = 0
+            if circuit.state == _halfOpen and now - circuit.probing >= self.cooldown:
+                circuit.probing = now
+                return
+            self.rejections += 1
+            since = circuit.changed if circuit.state == _opened else circuit.probing
+            retry_in = max(self.cooldown - (now - since), 0)
+        raise CircuitOpenError(scope=scope, state=circuit.state, retry_in=retry_in)
+
+    def record(self, scope, status, seconds):
+        """# Record a response
+        Count the outcome of a request in the scope's circuit, opening or closing it accordingly.
+        ## Parameters (required):
+        - scope [string]: host and resource of the request. ex: "sandbox.api.starkinfra.com pix-key"
+        - status [integer]: HTTP status of the response, 0 for network errors and timeouts. ex: 503
+        - seconds [float]: time between sending the request and receiving its response. ex: 0.12
+        """
+        failed = status in _statuses or (self.latency is not None and seconds > self.latency)
+        now = time()
+        with self._lock:
+            circuit = self._circuit(scope)
+            if circuit.state == _opened:
+                return
+            if circuit.state == _halfOpen:
+                if failed:
+                    self._trip(circuit, now)
+                    return
+                circuit.state = _closed
+                circuit.changed = now
+                circuit.outcomes.clear()
+                return
+            circuit.outcomes.append(failed)
+            if len(circuit.outcomes) >= self.min_requests and \
+                    sum(circuit.outcomes) >= self.error_rate * len(circuit.outcomes):
+                self._trip(circuit, now)
+
+    def state(self, scope):
+        """# Retrieve a circuit state
+        ## Parameters (required):
+        - scope [string]: host and resource of the circuit. ex: "sandbox.api.starkinfra.com pix-key"
+        ## Return:
+        - state of the circuit [string]. Options: "closed", "open", "half-open"
+        """
+        return self.states().get(scope, _closed)
+
+    def states(self):
+        """# Retrieve all circuit states
+        Return the state of every circuit that has seen a request, to be exported to your dashboards.
+        ## Return:
+        - dictionary of circuit states by scope [dictionary]. ex: {"api.starkinfra.com pix-key": "open"}
+        """
+        now = time()
+        with self._lock:
+            return {scope: self._state(circuit, now) for scope, circuit in self._circuits.items()}
+
+    def _circuit(self, scope):
+        circuit = self._circuits.get(scope)
+        if circuit is None:
+            circuit = self._circuits[scope] = _Circuit(window=self.window)
+        return circuit
+
+    def _state(self, circuit, now):
+        if circuit.state == _opened and now - circuit.changed >= self.cooldown:
+            return _halfOpen
+        return circuit.state
+
+    def _trip(self, circuit, now):
+        circuit.state = _opened
+        circuit.changed = now
+        circuit.outcomes.clear()
+        self.opens += 1
+
+
+class _Circuit:
+
+    __slots__ = ("state", "changed", "probing", "outcomes")
+
+    def __init__(self, window):
+        self.state = _closed
+        self.changed = time()
+        self.probing = 0
+        self.outcomes = deque(maxlen=window)
+
+
+def scope(url, path):
+    return "{host} {resource}".format(host=url.split("/")[2], resource=path.strip("/").split("/")[0])
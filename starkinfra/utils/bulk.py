@@ -0,0 +1,72 @@
+from itertools import islice
+from ..error import BulkError, ChunkError
+
+
+def chunks(entities, size):
+    """# Split entities into chunks
+    Split a list or any other iterable of entities into lists of up to size entities,
+    consuming generators lazily.
+    ## Parameters (required):
+    - entities [iterable]: entities to be split. ex: [PixRequest(...), PixRequest(...)]
+    - size [integer]: maximum number of entities in each chunk. ex: 100
+    ## Return:
+    - generator of lists of entities
+    """
+    iterator = iter(entities)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def merge(chunks, results):
+    """# Merge the results of chunked requests
+    Join the entities returned by each chunk in input order, raising a BulkError
+    that reports every failed chunk if any of them failed.
+    ## Parameters (required):
+    - chunks [list of lists]: entities sent in each chunk.
+    - results [list of tuples]: (entities, exception) returned by each chunk, in the same order.
+    ## Return:
+    - list of created entities
+    """
+    entities = []
+    errors = []
+    offset = 0
+    for chunk, (created, exception) in zip(chunks, results):
+        if exception is not None:
+            errors.append(ChunkError(offset=offset, entities=chunk, error=exception))
+            created = [None] * len(chunk)
+        entities.extend(created)
+        offset += len(chunk)
+
+    if errors:
+        raise BulkError(entities=entities, errors=errors)
+    return entities
+
+
+def index(ids, chunks, results):
+    """# Index the results of chunked retrievals
+    Key the entities found by each chunk by id in input order, with None for ids that
+    were not found, raising a BulkError that reports every failed chunk if any of them failed.
+    ## Parameters (required):
+    - ids [list of strings]: ids requested, without repetitions.
+    - chunks [list of lists]: ids requested in each chunk.
+    - results [list of tuples]: (dictionary of entities by id, exception) returned by each chunk, in the same order.
+    ## Return:
+    - dictionary of entities by id
+    """
+    entities = dict.fromkeys(ids)
+    errors = []
+    offset = 0
+    for chunk, (found, exception) in zip(chunks, results):
+        if exception is not None:
+            errors.append(ChunkError(offset=offset, entities=chunk, error=exception))
+        else:
+            for id in chunk:
+                entities[id] = found.get(id)
+        offset += len(chunk)
+
+    if errors:
+        raise BulkError(entities=entities, errors=errors)
+    return entities
@@ -0,0 +1,88 @@
+import starkinfra
+from types import FunctionType, ModuleType
+from .pool import Pool
+from .keycache import PublicKeyCache
+from .mirror import mirror
+from .relay import set_relay
+
+
+class Client:
+    """# Client object
+    The Client object carries its own user and settings, along with its own connection pool
+    and public key cache, instead of reading them from the starkinfra module globals. Its
+    attributes mirror the resource packages, so client.pixrequest.create(...) works just like
+    starkinfra.pixrequest.create(...), but on behalf of the client's user. This allows a single
+    process to serve many workspaces from different threads without passing the user on every
+    call or changing the module globals.
+    ## Parameters (required):
+    - user [Organization/Project object]: user on whose behalf the requests will be made. ex: starkinfra.Project(...)
+    ## Parameters (optional):
+    - language [string, default "en-US"]: language of the error messages. Options: "en-US", "pt-BR"
+    - timeout [integer, default 15]: seconds to wait for each response. ex: 10
+    - pool [Pool or Http2Pool object, default new Pool]: connection pool used by the client's requests. ex: starkinfra.Pool(size=20)
+    - retries [Retry object, default None]: retry policy of the client's requests. The default policy is used if None. ex: starkinfra.Retry(attempts=5)
+    - hedge [Hedge object, default None]: hedging policy of the client's reads. No read is hedged if None. ex: starkinfra.Hedge(percentile=99)
+    - rate_limiter [RateLimiter object, default None]: rate limiter shared by the client's requests. No request is held if None. ex: starkinfra.RateLimiter(rate=50)
+    - circuit_breaker [CircuitBreaker object, default None]: circuit breaker shared by the client's requests. No request is refused if None. ex: starkinfra.CircuitBreaker(latency=5)
+    - hooks [list of functions, default []]: functions called with a RequestRecord after each of the client's HTTP calls. ex: [starkinfra.Histogram()]
+    - prefetch [integer, default 0]: number of query pages fetched ahead of the consumer. ex: 2
+    - stream [bool, default False]: True to decode query responses incrementally, yielding each object as soon as it arrives. ex: True
+    - concurrency [integer, default 4]: maximum number of concurrent chunk requests on bulk creations. ex: 8
+    - public_key_cache [PublicKeyCache object, default new PublicKeyCache]: cache of the Stark Infra public key used by parse methods. ex: starkinfra.PublicKeyCache(path="public-key.pem")
+    - compression [string, default None]: encoding of the client's large request bodies. Bodies are sent uncompressed if None. ex: "gzip"
+    - signer [Signer object, default None]: signer of the client's requests and verifier of its parsed signatures. The default signer is used if None. ex: starkinfra.CoincurveSigner()
+    """
+
+    def __init__(self, user, language="en-US", timeout=15, pool=None, retries=None, hedge=None,
+                 rate_limiter=None, circuit_breaker=None, hooks=None, prefetch=0, stream=False, concurrency=4,
+                 public_key_cache=None, compression=None, signer=None):
+        from . import rest, parse
+
+        self.user = user
+        self.language = language
+        self.timeout = timeout
+        self.pool = pool or Pool()
+        self.retries = retries
+        self.hedge = hedge
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hooks = hooks or []
+        self.prefetch = prefetch
+        self.stream = stream
+        self.concurrency = concurrency
+        self.public_key_cache = public_key_cache or PublicKeyCache()
+        self.compression = compression
+        self.signer = signer
+        self._replacements = {
+            "rest": _bind(rest, settings=self),
+            "parse": _bind(parse, settings=self),
+        }
+        self._replacements["parse_and_verify"] = self._replacements["parse"].parse_and_verify
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in starkinfra._packages:
+            raise AttributeError("'Client' object has no attribute {name!r}".format(name=name))
+        package = mirror(
+            getattr(starkinfra, name),
+            name="starkinfra.client.{package}".format(package=name),
+            **self._replacements
+        )
+        setattr(self, name, package)
+        return package
+
+    def __dir__(self):
+        return sorted(set(vars(self)) | set(vars(Client)) | set(starkinfra._packages))
+
+    def close(self):
+        """# Close all connections
+        Close every connection kept alive by the client's pool.
+        """
+        self.pool.close()
+
+
+def _bind(module, settings):
+    namespace = ModuleType(module.__name__)
+    for name, function in vars(module).items():
+        if isinstance(function, FunctionType) and name.startswith("_") and hasattr(module, name[1:]):
+            setattr(namespace, name[1:], set_relay(function, settings=settings))
+    return namespace
@@ -0,0 +1,100 @@
+from re import compile
+from array import array
+from calendar import timegm
+from starkcore.utils.api import from_api_json
+from starkcore.utils.case import camel_to_snake, snake_to_camel
+
+
+_outputs = [None, "columns"]
+_strings = (type(""), type(u""))
+_datetime = compile(r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})?$")
+
+try:
+    array("q")
+    _integer = "q"
+except ValueError:
+    _integer = "l"
+
+
+def decode(resource, entities, output=None, raw=False, fields=None):
+    """# Decode a list of entities
+    Turn the JSON entities of an API response into resource objects or, if requested, into columns.
+    ## Parameters (required):
+    - resource [dict]: resource of the entities. ex: {"class": PixRequest, "name": "PixRequest"}
+    - entities [list of dicts]: entities as returned by the API.
+    ## Parameters (optional):
+    - output [string, default None]: "columns" to return a dict of columns instead of a list of objects.
+    - raw [bool, default False]: True to return the entities unchanged instead of a list of objects.
+    - fields [list of strings, default None]: fields to be kept, all others are discarded before decoding. ex: ["id", "status", "amount"]
+    ## Return:
+    - list of resource objects, list of dicts or dict of columns keyed by field name
+    """
+    if output not in _outputs:
+        raise ValueError("output must be one of {outputs}".format(outputs=", ".join(str(option) for option in _outputs)))
+    if raw and output:
+        raise ValueError("raw and output cannot be used together")
+    if fields is not None:
+        entities = project(entities, fields)
+    if raw:
+        return entities
+    if output == "columns":
+        return columns(entities)
+    return [from_api_json(resource, entity) for entity in entities]
+
+
+def project(entities, fields):
+    """# Keep only some fields of entities
+    Discard every field of a list of JSON entities that was not requested, so no time or memory
+    is spent decoding them. Discarded fields are set to None on the decoded objects.
+    ## Parameters (required):
+    - entities [list of dicts]: entities as returned by the API.
+    - fields [list of strings]: snake case names of the fields to be kept. ex: ["id", "status", "amount"]
+    ## Return:
+    - list of dicts with the requested fields only
+    """
+    keys = set(snake_to_camel(field) for field in fields)
+    return [{key: value for key, value in entity.items() if key in keys} for entity in entities]
+
+
+def columns(entities):
+    """# Convert entities into columns
+    Gather the values of each field of a list of JSON entities into a column. Columns of
+    integers and floats become typed arrays, columns of datetimes become arrays of epoch
+    timestamps in microseconds and every other column becomes a list.
+    ## Parameters (required):
+    - entities [list of dicts]: entities as returned by the API.
+    ## Return:
+    - dict of columns keyed by snake case field name. ex: {"amount": array("q", [100, 200]), "status": ["success", "failed"]}
+    """
+    keys = []
+    seen = set()
+    for entity in entities:
+        for key in entity:
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+    return {camel_to_snake(key): _column([entity.get(key) for entity in entities]) for key in keys}
+
+
+def _column(values):
+    if all(type(value) is int for value in values):
+        return array(_integer, values)
+    if all(type(value) in (int, float) for value in values):
+        return array("d", values)
+    if all(isinstance(value, _strings) for value in values):
+        timestamps = [_timestamp(value) for value in values]
+        if None not in timestamps:
+            return array(_integer, timestamps)
+    return values
+
+
+def _timestamp(value):
+    match = _datetime.match(value)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    seconds = timegm((int(year), int(month), int(day), int(hour), int(minute), int(second)))
+    if offset and offset != "Z":
+        sign = -1 if offset[0] == "-" else 1
+        seconds -= sign * (int(offset[1:3]) * 3600 + int(offset[4:6]) * 60)
+    return seconds * 1000000 + int((fraction or "0").ljust(6, "0"))
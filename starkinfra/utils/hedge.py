@@ -0,0 +1,100 @@
+from math import ceil
+from threading import Lock
+from collections import deque
+from starkcore.utils.checks import check_timedelta
+
+
+class Hedge:
+    """# Hedge object
+    The Hedge object cuts the tail latency of reads by sending a duplicate request when the first
+    one takes longer than a percentile of the recent response times of the same endpoint, keeping
+    whichever response arrives first. Hedges are only sent while they stay under a fraction of all
+    hedgeable requests, so a slow API never doubles your traffic. Only reads are hedged.
+    No hedging is done by default, but you may enable it at the start (See README).
+    ## Parameters (optional):
+    - percentile [integer or float, default 95]: percentile of the recent response times after which a duplicate is sent. ex: 99
+    - budget [float, default 0.05]: maximum fraction of the hedgeable requests that may be duplicated. ex: 0.02
+    - delay [integer, float or datetime.timedelta, default 0.5]: seconds to wait before hedging while an endpoint has too few samples. ex: 1
+    - samples [integer, default 200]: number of recent response times kept for each endpoint. ex: 1000
+    - workers [integer, default 32]: maximum number of threads sending duplicate requests at the same time. ex: 64
+    ## Attributes (return-only):
+    - requests [integer]: number of hedgeable requests sent so far. ex: 1000
+    - hedges [integer]: number of duplicate requests sent so far. ex: 40
+    - wins [integer]: number of duplicate requests that answered before the original one. ex: 25
+    """
+
+    def __init__(self, percentile=95, budget=0.05, delay=0.5, samples=200, workers=32):
+        self.percentile = percentile
+        self.budget = budget
+        self.delay = check_timedelta(delay).total_seconds()
+        self.samples = samples
+        self.workers = workers
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self._latencies = {}
+        self._lock = Lock()
+        self._executor = None
+
+    def wait(self, endpoint):
+        """# Retrieve the hedging delay
+        Count a hedgeable request and return how long to wait for it before sending a duplicate.
+        ## Parameters (required):
+        - endpoint [string]: method and endpoint of the request. ex: "GET pix-key"
+        ## Return:
+        - seconds to wait before hedging [float]
+        """
+        with self._lock:
+            self.requests += 1
+            latencies = sorted(self._latencies.get(endpoint, ()))
+        if len(latencies) < min(20, self.samples):
+            return self.delay
+        return latencies[min(len(latencies), int(ceil(len(latencies) * self.percentile / 100.0))) - 1]
+
+    def allow(self):
+        """# Reserve a hedge
+        Check whether one more duplicate request fits in the budget, counting it if it does.
+        ## Return:
+        - True if the duplicate may be sent, False otherwise [boolean]
+        """
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def observe(self, endpoint, seconds):
+        """# Record a response time
+        Keep the response time of a single request to compute the hedging delay of its endpoint.
+        ## Parameters (required):
+        - endpoint [string]: method and endpoint of the request. ex: "GET pix-key"
+        - seconds [float]: time between sending the request and receiving its response. ex: 0.12
+        """
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.samples)
+            latencies.append(seconds)
+
+    def won(self):
+        """# Count a winning hedge
+        Count a duplicate request that answered before the original one.
+        """
+        with self._lock:
+            self.wins += 1
+
+    def executor(self):
+        """# Retrieve the thread pool
+        Return the thread pool used to send duplicate requests on synchronous code, creating it on the first call.
+        ## Return:
+        - concurrent.futures.ThreadPoolExecutor object
+        """
+        with self._lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+
+def endpoint(method, path):
+    return "{method} {endpoint}".format(method=method, endpoint=path.strip("/").split("/")[0])
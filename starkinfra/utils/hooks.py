@@ -0,0 +1,191 @@
+from time import time
+from math import log
+from threading import Lock
+
+
+class RequestRecord:
+    """# RequestRecord object
+    The RequestRecord object describes a single HTTP call made by the SDK, including each retry and
+    hedge, and is passed to every function in starkinfra.hooks once the call's response is decoded.
+    ## Attributes (return-only):
+    - resource [string]: resource of the call, taken from its path. ex: "pix-key"
+    - method [string]: HTTP method of the call. ex: "GET"
+    - path [string]: path of the call, without the query string. ex: "pix-key/+5511989898989"
+    - status [integer]: HTTP status of the response, 0 for network errors and timeouts. ex: 200
+    - attempt [integer]: number of times the request had been sent, including this call. ex: 1
+    - start [float]: epoch time at which the call started. ex: 1700000000.0
+    - bytes_sent [integer]: size of the request body as sent, after compression. ex: 1024
+    - bytes_received [integer]: size of the response body as received. ex: 4096
+    - queue_wait [float]: seconds the call waited for the rate limiter or a free connection. ex: 0.01
+    - signing [float]: seconds spent serializing, signing and compressing the request. ex: 0.002
+    - network [float]: seconds between sending the request and receiving the response. ex: 0.12
+    - decode [float]: seconds spent parsing the response into SDK objects. Objects of query pages are built by the consumer, so only their parsing is counted. ex: 0.001
+    - total [float]: sum of queue_wait, signing, network and decode. ex: 0.133
+    """
+
+    __slots__ = ("resource", "method", "path", "status", "attempt", "start", "bytes_sent", "bytes_received",
+                 "queue_wait", "signing", "network", "decode", "_hooks")
+
+    def __init__(self, method, path, attempt, hooks):
+        self.resource = path.strip("/").split("/")[0]
+        self.method = method
+        self.path = path
+        self.status = None
+        self.attempt = attempt
+        self.start = time()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.queue_wait = 0.0
+        self.signing = 0.0
+        self.network = 0.0
+        self.decode = 0.0
+        self._hooks = hooks
+
+    @property
+    def total(self):
+        return self.queue_wait + self.signing + self.network + self.decode
+
+    @property
+    def endpoint(self):
+        return "{method} {resource}".format(method=self.method, resource=self.resource)
+
+    def __repr__(self):
+        return "RequestRecord({endpoint}, status={status}, total={total:.6f})".format(
+            endpoint=self.endpoint,
+            status=self.status,
+            total=self.total,
+        )
+
+
+class Histogram:
+    """# Histogram object
+    The Histogram object is a hook that aggregates the durations of the SDK's HTTP calls by endpoint
+    in memory, using logarithmic buckets, so percentiles can be exported to your metrics at any time.
+    Add it to starkinfra.hooks to start collecting (See README).
+    ## Parameters (optional):
+    - field [string, default "total"]: RequestRecord attribute aggregated. ex: "network"
+    - precision [float, default 0.02]: maximum relative error of the reported percentiles. ex: 0.01
+    """
+
+    def __init__(self, field="total", precision=0.02):
+        self.field = field
+        self.precision = precision
+        self._base = log(1 + 2 * precision)
+        self._endpoints = {}
+        self._lock = Lock()
+
+    def __call__(self, record):
+        seconds = getattr(record, self.field)
+        bucket = int(log(max(seconds, 1e-6) / 1e-6) / self._base)
+        with self._lock:
+            stats = self._endpoints.get(record.endpoint)
+            if stats is None:
+                stats = self._endpoints[record.endpoint] = {"count": 0, "sum": 0.0, "max": 0.0, "buckets": {}}
+            stats["count"] += 1
+            stats["sum"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["buckets"][bucket] = stats["buckets"].get(bucket, 0) + 1
+
+    def percentile(self, endpoint, percentile):
+        """# Retrieve a percentile
+        ## Parameters (required):
+        - endpoint [string]: method and resource of the calls. ex: "GET pix-key"
+        - percentile [integer or float]: percentile to be estimated, from 0 to 100. ex: 99
+        ## Return:
+        - estimated duration in seconds [float] or None if the endpoint has no calls
+        """
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if not stats:
+                return None
+            return self._percentile(stats, percentile)
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """# Retrieve the summary of every endpoint
+        ## Parameters (optional):
+        - percentiles [list of integers or floats, default (50, 90, 99)]: percentiles to be estimated. ex: [50, 99.9]
+        ## Return:
+        - dictionary of statistics by endpoint [dictionary]. ex: {"GET pix-key": {"count": 10, "mean": 0.1, "max": 0.3, "p50": 0.09, "p90": 0.2, "p99": 0.3}}
+        """
+        with self._lock:
+            summary = {}
+            for endpoint, stats in self._endpoints.items():
+                summary[endpoint] = {
+                    "count": stats["count"],
+                    "mean": stats["sum"] / stats["count"],
+                    "max": stats["max"],
+                }
+                for percentile in percentiles:
+                    name = "p{percentile:g}".format(percentile=percentile)
+                    summary[endpoint][name] = self._percentile(stats, percentile)
+            return summary
+
+    def reset(self):
+        """# Clear all collected durations"""
+        with self._lock:
+            self._endpoints = {}
+
+    def _percentile(self, stats, percentile):
+        rank = percentile / 100.0 * stats["count"]
+        seen = 0
+        for bucket in sorted(stats["buckets"]):
+            seen += stats["buckets"][bucket]
+            if seen >= rank:
+                return min(1e-6 * (1 + self.precision) * (1 + 2 * self.precision) ** bucket, stats["max"])
+        return stats["max"]
+
+
+class Spans:
+    """# Spans object
+    The Spans object is a hook that turns each HTTP call of the SDK into a tracing span, with its
+    phases and sizes as attributes. It works with OpenTelemetry tracers, or any tracer whose
+    start_span(name, start_time, attributes) returns a span with an end(end_time) method.
+    Add it to starkinfra.hooks to start tracing (See README).
+    ## Parameters (optional):
+    - tracer [tracer object, default None]: tracer used to create the spans. If None, the OpenTelemetry tracer named "starkinfra" is used, which requires the opentelemetry-api package. ex: trace.get_tracer("my-service")
+    """
+
+    def __init__(self, tracer=None):
+        if tracer is None:
+            from opentelemetry import trace
+            tracer = trace.get_tracer("starkinfra")
+        self.tracer = tracer
+
+    def __call__(self, record):
+        span = self.tracer.start_span(
+            name="starkinfra {endpoint}".format(endpoint=record.endpoint),
+            start_time=int(record.start * 1e9),
+            attributes={
+                "http.method": record.method,
+                "http.status_code": record.status,
+                "starkinfra.resource": record.resource,
+                "starkinfra.path": record.path,
+                "starkinfra.attempt": record.attempt,
+                "starkinfra.bytes_sent": record.bytes_sent,
+                "starkinfra.bytes_received": record.bytes_received,
+                "starkinfra.queue_wait": record.queue_wait,
+                "starkinfra.signing": record.signing,
+                "starkinfra.network": record.network,
+                "starkinfra.decode": record.decode,
+            },
+        )
+        span.end(end_time=int((record.start + record.total) * 1e9))
+
+
+def emit(response, decoding=None):
+    record = getattr(response, "record", None)
+    if record is None or record._hooks is None:
+        return
+    hooks, record._hooks = record._hooks, None
+    if decoding is not None:
+        record.decode = time() - decoding
+    for hook in hooks:
+        hook(record)
+
+
+def size(content):
+    if content is None:
+        return 0
+    if isinstance(content, bytes):
+        return len(content)
+    return len(content.encode("utf-8"))
@@ -0,0 +1,136 @@
+from threading import BoundedSemaphore, Lock, Thread
+from .pool import Pool
+
+
+class Http2Pool(Pool):
+    """# Http2Pool object
+    The Http2Pool object sends requests over HTTP/2, multiplexing concurrent calls made by the same
+    user as streams of a few shared connections instead of opening one connection per call, so
+    thousands of parallel requests don't need thousands of TCP and TLS sessions. Calls beyond the
+    stream limit wait for a free stream. The connections are driven by a background thread, which
+    the calling threads hand their requests to. It requires the httpx library with HTTP/2 support
+    (pip install starkinfra[http2]) and falls back to HTTP/1.1 if the server doesn't offer HTTP/2,
+    in which case each user may open up to connections * streams connections, one per concurrent call.
+    The asyncio functions under starkinfra.aio also use HTTP/2 over the same number of connections.
+    ## Parameters (optional):
+    - connections [integer, default 2]: maximum number of HTTP/2 connections kept open for each user. ex: 4
+    - streams [integer, default 100]: maximum number of concurrent requests multiplexed over each connection. ex: 50
+    - idle_timeout [integer or datetime.timedelta, default 60]: seconds a user's connections may stay unused before being closed. ex: 30
+    """
+
+    def __init__(self, connections=2, streams=100, idle_timeout=60):
+        try:
+            import h2
+            import httpx
+        except ImportError:
+            raise ImportError("Http2Pool requires the httpx library with HTTP/2 support (pip install httpx[http2])")
+        Pool.__init__(self, size=connections * streams, idle_timeout=idle_timeout)
+        self.connections = connections
+        self.streams = streams
+        self._httpx = httpx
+        self._loop = None
+        self._loop_lock = Lock()
+
+    def _open(self):
+        return _Session(
+            client=self._httpx.AsyncClient(transport=self._transport()),
+            loop=self._event_loop(),
+            streams=self.size,
+        )
+
+    def close(self):
+        """# Close all connections
+        Close every connection currently kept open by the pool and stop its background thread.
+        """
+        Pool.close(self)
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    def _transport(self):
+        # httpx multiplexes all HTTP/2 calls to a host over one connection, so the connection limit
+        # only binds when the server answers over HTTP/1.1, which needs a connection per call
+        return self._httpx.AsyncHTTPTransport(http2=True, limits=self._httpx.Limits(
+            max_connections=self.size,
+            max_keepalive_connections=self.size,
+            keepalive_expiry=self.idle_timeout,
+        ))
+
+    def _event_loop(self):
+        with self._loop_lock:
+            if self._loop is None:
+                from asyncio import new_event_loop
+                self._loop = new_event_loop()
+                Thread(target=_serve, args=(self._loop,), daemon=True).start()
+            return self._loop
+
+
+def _serve(loop):
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+class _Session:
+
+    def __init__(self, client, loop, streams):
+        self._client = client
+        self._loop = loop
+        self._streams = BoundedSemaphore(streams)
+
+    def request(self, method, url, data=None, headers=None, timeout=None, stream=False):
+        self._streams.acquire()
+        try:
+            request = self._client.build_request(method, url, content=data or None, headers=headers, timeout=timeout)
+            response = self._run(self._client.send(request, stream=stream))
+        except:
+            self._streams.release()
+            raise
+        response = _Response(response, run=self._run, release=self._streams.release)
+        if not stream:
+            response.close()
+        return response
+
+    def close(self):
+        self._run(self._client.aclose())
+
+    def _run(self, coroutine):
+        from asyncio import run_coroutine_threadsafe
+        return run_coroutine_threadsafe(coroutine, self._loop).result()
+
+
+class _Response:
+
+    def __init__(self, response, run, release):
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self._response = response
+        self._run = run
+        self._release = release
+
+    @property
+    def content(self):
+        return self._run(self._response.aread())
+
+    def iter_content(self, chunk_size):
+        chunks = self._response.aiter_bytes(chunk_size=chunk_size)
+        while True:
+            chunk = self._run(_next(chunks))
+            if chunk is None:
+                return
+            yield chunk
+
+    def close(self):
+        release, self._release = self._release, None
+        if release:
+            self._run(self._response.aclose())
+            release()
+
+
+async def _next(chunks):
+    try:
+        return await chunks.__anext__()
+    except StopAsyncIteration:
+        return None
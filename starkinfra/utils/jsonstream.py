@@ -0,0 +1,112 @@
+from codecs import getincrementaldecoder
+from json import JSONDecoder
+
+
+_decoder = JSONDecoder()
+_whitespace = " \t\n\r"
+_delimiters = _whitespace + ",:]}"
+
+
+def items(chunks, key):
+    """# Decode a JSON object incrementally
+    Decode a JSON object from an iterable of byte chunks, yielding each element of the list under
+    the given key as soon as its last byte arrives, so only one element is kept in memory at a time.
+    ## Parameters (required):
+    - chunks [iterable of bytes]: body of a response, in the order it is received. ex: response.iter_content(16384)
+    - key [string]: key of the list to be streamed. ex: "requests"
+    ## Return:
+    - generator of the list elements, returning a dict with the other keys of the object when exhausted
+    """
+    reader = _Reader(chunks)
+    others = {}
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return others
+
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.separator("]") == "]":
+                        break
+        else:
+            others[name] = reader.value()
+        if reader.separator("}") == "}":
+            return others
+
+
+class _Reader:
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.position = 0
+        self.finished = False
+
+    def peek(self):
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in _whitespace:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ""
+
+    def expect(self, character):
+        found = self.peek()
+        if found != character:
+            raise ValueError("expected {expected!r} at JSON position {position}, found {found!r}".format(
+                expected=character,
+                position=self.position,
+                found=found,
+            ))
+        self.position += 1
+
+    def separator(self, closing):
+        found = self.peek()
+        if found not in (",", closing):
+            self.expect(closing)
+        self.position += 1
+        return found
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.position)
+            except ValueError:
+                if not self._grow():
+                    raise
+                continue
+            if (end == len(self.buffer) or self.buffer[end] not in _delimiters) and self._grow():
+                continue
+            self.position = end
+            return value
+
+    def _grow(self):
+        target = 2 * max(len(self.buffer) - self.position, 1)
+        grown = False
+        while len(self.buffer) - self.position < target and self._fill():
+            grown = True
+        return grown
+
+    def _fill(self):
+        if self.finished:
+            return False
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.finished = True
+            chunk = b""
+        text = self.decoder.decode(chunk, final=self.finished)
+        self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+        return bool(text) or not self.finished
@@ -0,0 +1,150 @@
+from os import path as _path, fdopen, remove, replace
+from tempfile import mkstemp
+from time import time
+from threading import Lock, Thread
+from starkcore.utils.checks import check_timedelta
+
+
+_cooldown = 60
+_refetch_interval = 10
+
+
+class PublicKeyCache:
+    """# PublicKeyCache object
+    The PublicKeyCache object keeps the Stark Infra public key used to verify webhooks and
+    authorization requests. When the key gets close to its expiration it is refreshed on a
+    background thread while the current key keeps being served, so parsing a payload only
+    waits on the network if no key was ever downloaded. If a path is given, the key is also
+    saved to that file and read from it on the first parse, so a freshly started worker can
+    verify its first payload without network access. If a signature does not match the cached
+    key, the key is downloaded again on the calling thread before the payload is rejected.
+    A default cache for each environment is used when none is set, but you may define your own at the start (See README).
+    ## Parameters (optional):
+    - ttl [integer or datetime.timedelta, default 3600]: seconds the key is considered fresh after being downloaded. ex: 600
+    - margin [integer or datetime.timedelta, default 300]: seconds before expiration at which the background refresh starts. ex: 60
+    - path [string, default None]: file where the key is persisted between runs. ex: "/var/cache/starkinfra/public-key.pem"
+    """
+
+    def __init__(self, ttl=3600, margin=300, path=None):
+        self.ttl = check_timedelta(ttl).total_seconds()
+        self.margin = check_timedelta(margin).total_seconds()
+        self.path = path
+        self._entry = None
+        self._attempted = 0
+        self._refreshing = False
+        self._lock = Lock()
+        self._fetch_lock = Lock()
+
+    def get(self, fetch):
+        """# Retrieve the public key
+        Return the cached key, starting a background refresh if it is about to expire or
+        has already expired. The key is only downloaded on the calling thread if it is
+        neither in memory nor in the persisted file.
+        ## Parameters (required):
+        - fetch [function]: function without arguments that downloads the public key and returns its PEM.
+        ## Return:
+        - public key PEM [string]
+        """
+        entry = self._entry or self._load()
+        if entry is None:
+            with self._fetch_lock:
+                entry = self._entry or self._store(fetch())
+        pem, fetched = entry
+        if time() - fetched >= self.ttl - self.margin:
+            self.revalidate(fetch)
+        return pem
+
+    def revalidate(self, fetch):
+        """# Refresh the public key in the background
+        Start downloading the key on a background thread, for example after a signature did
+        not match the cached key. Nothing is done if a download is already running or was
+        started less than a minute ago.
+        ## Parameters (required):
+        - fetch [function]: function without arguments that downloads the public key and returns its PEM.
+        """
+        with self._lock:
+            if self._refreshing or time() - self._attempted < _cooldown:
+                return
+            self._refreshing = True
+            self._attempted = time()
+        thread = Thread(target=self._refresh, args=(fetch,))
+        thread.daemon = True
+        thread.start()
+
+    def refetch(self, fetch, pem):
+        """# Download the public key again
+        Replace a key that did not match a signature, waiting for the new key to be downloaded.
+        Concurrent calls share a single download, and nothing is downloaded if the key was
+        downloaded less than 10 seconds ago.
+        ## Parameters (required):
+        - fetch [function]: function without arguments that downloads the public key and returns its PEM.
+        - pem [string]: public key PEM that did not match the signature.
+        ## Return:
+        - new public key PEM [string] or None if no other key is available
+        """
+        with self._fetch_lock:
+            entry = self._entry
+            if entry is None or entry[0] == pem:
+                if time() - self._attempted < _refetch_interval:
+                    return None
+                self._attempted = time()
+                entry = self._store(fetch())
+        if entry[0] == pem:
+            return None
+        return entry[0]
+
+    def _refresh(self, fetch):
+        try:
+            self._store(fetch())
+        except Exception:
+            pass
+        finally:
+            self._refreshing = False
+
+    def _store(self, pem):
+        self._attempted = time()
+        self._entry = (pem, self._attempted)
+        if self.path:
+            _save(self.path, pem)
+        return self._entry
+
+    def _load(self):
+        if not self.path:
+            return None
+        try:
+            with open(self.path) as file:
+                pem = file.read()
+            fetched = _path.getmtime(self.path)
+        except (IOError, OSError):
+            return None
+        if not pem:
+            return None
+        self._entry = (pem, fetched)
+        return self._entry
+
+
+def _save(path, pem):
+    try:
+        descriptor, temporary = mkstemp(dir=_path.dirname(path) or None)
+    except (IOError, OSError):
+        return
+    try:
+        with fdopen(descriptor, "w") as file:
+            file.write(pem)
+        replace(temporary, path)
+    except (IOError, OSError):
+        try:
+            remove(temporary)
+        except (IOError, OSError):
+            pass
+
+
+_defaults = {}
+_defaults_lock = Lock()
+
+
+def default(environment):
+    with _defaults_lock:
+        if environment not in _defaults:
+            _defaults[environment] = PublicKeyCache()
+        return _defaults[environment]
@@ -0,0 +1,45 @@
+class _Raw:
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __reduce__(self):
+        return _Raw, (self.value,)
+
+
+class _LazyAttribute:
+
+    def __init__(self, parse):
+        self.parse = parse
+        self.slot = None
+
+    def __set_name__(self, owner, name):
+        self.slot = getattr(owner, "_" + name)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if type(value) is _Raw:
+            value = None if value.value is None else self.parse(value.value)
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, _Raw(value))
+
+
+def lazy(parse):
+    """# Lazy attribute
+    Declare a resource attribute whose value is only converted when it is first read. The value
+    received by the constructor is kept as is in the "_" prefixed slot of the same name and the
+    result of the conversion replaces it on the first read, so objects listed in bulk don't pay
+    for datetimes and sub-resources that are never used. None values are kept without conversion.
+    ## Parameters (required):
+    - parse [function]: function receiving the assigned value and returning the attribute value. ex: check_datetime
+    ## Return:
+    - descriptor to be assigned in the class body. ex: created = lazy(check_datetime)
+    """
+    return _LazyAttribute(parse)
@@ -0,0 +1,43 @@
+from types import FunctionType, ModuleType
+
+
+def mirror(package, name, **replacements):
+    """# Mirror a resource package
+    Rebuild every function of a resource package, and of its sub-packages, with some of
+    its module globals replaced, so the same resource code can run against a different
+    rest layer. Classes and functions that don't use the replaced globals are kept as they are.
+    ## Parameters (required):
+    - package [module]: resource package to be mirrored. ex: starkinfra.pixrequest
+    - name [string]: name of the mirrored namespace. ex: "starkinfra.aio.pixrequest"
+    ## Parameters (optional):
+    - replacements [keyword arguments]: module globals to be replaced. ex: rest=starkinfra.aio.rest
+    ## Return:
+    - module with the mirrored functions
+    """
+    namespace = ModuleType(name, package.__doc__)
+    rebuilt_globals = {}
+    for attribute, value in vars(package).items():
+        if attribute.startswith("__"):
+            continue
+        if isinstance(value, ModuleType) and value.__name__.startswith(package.__name__ + "."):
+            value = mirror(value, name="{name}.{attribute}".format(name=name, attribute=attribute), **replacements)
+        elif isinstance(value, FunctionType) and set(value.__code__.co_names) & set(replacements):
+            value = _rebuild(value, rebuilt_globals, replacements)
+        setattr(namespace, attribute, value)
+    return namespace
+
+
+def _rebuild(function, rebuilt_globals, replacements):
+    key = id(function.__globals__)
+    if key not in rebuilt_globals:
+        rebuilt_globals[key] = dict(function.__globals__, **replacements)
+
+    rebuilt = FunctionType(
+        function.__code__,
+        rebuilt_globals[key],
+        function.__name__,
+        function.__defaults__,
+        function.__closure__,
+    )
+    rebuilt.__doc__ = function.__doc__
+    return rebuilt
@@ -0,0 +1,357 @@
+"""# Operations
+Single-request operations shared by the blocking and the asyncio REST layers. Each operation is a
+generator that yields the keyword arguments of the HTTP call it needs, receives the response back
+and returns its decoded result, so the request building and the response decoding are written once
+while each layer sends the request with its own fetch function.
+"""
+from time import time
+from .decode import decode
+from .hooks import emit
+from starkcore.utils.api import endpoint, last_name, last_name_plural, api_json, from_api_json, cast_json_to_api_format
+
+
+def get_page(sdk_version, host, api_version, user, resource, language, timeout, transport=None, output=None, raw=False,
+             fields=None, **query):
+    entities, cursor = yield from get_json_page(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        **query
+    )
+    return decode(resource, entities, output=output, raw=raw, fields=fields), cursor
+
+
+def get_json_page(sdk_version, host, api_version, user, resource, language, timeout, transport=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=endpoint(resource),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    decoding = time()
+    json = response.json()
+    emit(response, decoding=decoding)
+    return json[last_name_plural(resource)], json.get("cursor")
+
+
+def get_id(sdk_version, host, api_version, user, resource, id, language, timeout, transport=None, raw=False,
+           fields=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    decoding = time()
+    json = response.json()
+    entity = decode(resource, [json[last_name(resource)]], raw=raw, fields=fields)[0]
+    emit(response, decoding=decoding)
+    return entity
+
+
+def get_content(sdk_version, host, api_version, user, resource, id, sub_resource_name, language, timeout,
+                transport=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource_name}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource_name=sub_resource_name,
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    emit(response)
+    return response.content
+
+
+def get_sub_resource(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout,
+                     transport=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    decoding = time()
+    entity = response.json()[last_name(sub_resource)]
+    entity = from_api_json(sub_resource, entity)
+    emit(response, decoding=decoding)
+    return entity
+
+
+def get_sub_resources(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout,
+                      transport=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    decoding = time()
+    entities = response.json()[last_name_plural(sub_resource)]
+    entities = [from_api_json(sub_resource, entity) for entity in entities]
+    emit(response, decoding=decoding)
+    return entities
+
+
+def post_chunk(sdk_version, host, api_version, user, resource, entities, language, timeout, transport=None, read=False,
+               **query):
+    payloads = [api_json(entity) for entity in entities]
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload={last_name_plural(resource): payloads},
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        idempotent=read or idempotent(payloads),
+        read=read,
+    )
+    decoding = time()
+    json = response.json()
+    entities = json[last_name_plural(resource)]
+    entities = [from_api_json(resource, entity) for entity in entities]
+    emit(response, decoding=decoding)
+    return entities
+
+
+def post_single(sdk_version, host, api_version, user, resource, entity, language, timeout, transport=None, **query):
+    payload = api_json(entity)
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        idempotent=idempotent([payload]),
+    )
+    decoding = time()
+    json = response.json()
+    entity_json = json[last_name(resource)]
+    entity = from_api_json(resource, entity_json)
+    emit(response, decoding=decoding)
+    return entity
+
+
+def idempotent(payloads):
+    return bool(payloads) and all(payload.get("externalId") for payload in payloads)
+
+
+def delete_id(sdk_version, host, api_version, user, resource, id, language, timeout, transport=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="DELETE",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    decoding = time()
+    json = response.json()
+    entity = json[last_name(resource)]
+    entity = from_api_json(resource, entity)
+    emit(response, decoding=decoding)
+    return entity
+
+
+def patch_id(sdk_version, host, api_version, user, resource, id, payload, language, timeout, transport=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="PATCH",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        payload=cast_json_to_api_format(payload),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    decoding = time()
+    json = response.json()
+    entity = json[last_name(resource)]
+    entity = from_api_json(resource, entity)
+    emit(response, decoding=decoding)
+    return entity
+
+
+def put_multi(sdk_version, host, api_version, user, resource, entities, language, timeout, transport=None, **query):
+    response = yield dict(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="PUT",
+        path=endpoint(resource),
+        payload={last_name_plural(resource): [api_json(entity) for entity in entities]},
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    decoding = time()
+    json = response.json()
+    entities = json[last_name_plural(resource)]
+    entities = [from_api_json(resource, entity) for entity in entities]
+    emit(response, decoding=decoding)
+    return entities
+
+
+def get_raw(sdk_version, host, api_version, path, user, language, timeout, transport=None, prefix=None,
+            raiseException=True, query=None):
+    return (yield from _raw(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=path,
+        query=query,
+        api_version=api_version,
+        prefix=prefix,
+        language=language,
+        timeout=timeout,
+        raiseException=raiseException,
+        transport=transport,
+    ))
+
+
+def post_raw(sdk_version, host, api_version, path, payload, user, language, timeout, transport=None, prefix=None,
+             raiseException=True, query=None):
+    return (yield from _raw(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        prefix=prefix,
+        language=language,
+        timeout=timeout,
+        raiseException=raiseException,
+        transport=transport,
+    ))
+
+
+def patch_raw(sdk_version, host, api_version, path, payload, user, language, timeout, transport=None, prefix=None,
+              raiseException=True, query=None):
+    return (yield from _raw(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="PATCH",
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        prefix=prefix,
+        language=language,
+        timeout=timeout,
+        raiseException=raiseException,
+        transport=transport,
+    ))
+
+
+def put_raw(sdk_version, host, api_version, path, payload, user, language, timeout, transport=None, prefix=None,
+            raiseException=True, query=None):
+    return (yield from _raw(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="PUT",
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        prefix=prefix,
+        language=language,
+        timeout=timeout,
+        raiseException=raiseException,
+        transport=transport,
+    ))
+
+
+def delete_raw(sdk_version, host, api_version, path, user, language, timeout, transport=None, prefix=None,
+               payload=None, raiseException=True, query=None):
+    return (yield from _raw(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="DELETE",
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        prefix=prefix,
+        language=language,
+        timeout=timeout,
+        raiseException=raiseException,
+        transport=transport,
+    ))
+
+
+def _raw(**request):
+    response = yield request
+    emit(response)
+    return response
@@ -1,6 +1,90 @@
+from json import loads, dumps
+from ellipticcurve import Signature
+from starkcore.error import InvalidSignatureError
+from starkcore.utils.api import from_api_json
+from starkcore.utils.checks import check_user
 from .relay import set_relay
-from starkcore.utils import parse
+from .rest import _get_raw
+from . import signer as _signer
+from . import keycache as _keycache
+from .retry import Retry
+from .transport import Transport
 
 
-parse_and_verify = set_relay(parse.parse_and_verify)
-verify = set_relay(parse.verify)
+_retries = Retry(attempts=1)
+
+
+def _parse_and_verify(content, signature, sdk_version, api_version, host, resource, user, language, timeout,
+                      transport=None, public_key_cache=None, key=None):
+    content = _verify(content, signature, sdk_version, api_version, host, user, language, timeout, transport,
+                      public_key_cache)
+    json = loads(content, strict=False)
+    if key:
+        json = json[key]
+    return from_api_json(resource=resource, json=json)
+
+
+def _verify(content, signature, sdk_version, api_version, host, user, language, timeout, transport=None,
+            public_key_cache=None):
+    try:
+        signature = Signature.fromBase64(signature)
+    except:
+        raise InvalidSignatureError("The provided signature is not valid")
+
+    public_key_cache = public_key_cache or _keycache.default(check_user(user).environment)
+    fetch = _public_key_fetcher(
+        sdk_version=sdk_version,
+        host=host,
+        api_version=api_version,
+        user=user,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+    signer = (transport and transport.signer) or _signer.default
+    public_key = public_key_cache.get(fetch)
+    if _is_signature_valid(content=content, signature=signature, public_key=public_key, signer=signer):
+        return content
+
+    public_key = public_key_cache.refetch(fetch, pem=public_key)
+    if public_key and _is_signature_valid(content=content, signature=signature, public_key=public_key, signer=signer):
+        return content
+    raise InvalidSignatureError("The provided signature and content do not match the public key")
+
+
+def _is_signature_valid(content, signature, public_key, signer):
+    if signer.verify(message=content, signature=signature, pem=public_key):
+        return True
+
+    try:
+        normalized = dumps(loads(content), sort_keys=True)
+    except:
+        return False
+
+    if signer.verify(message=normalized, signature=signature, pem=public_key):
+        return True
+    return False
+
+
+def _public_key_fetcher(sdk_version, host, api_version, user, language, timeout, transport=None):
+    def fetch():
+        return _get_raw(
+            sdk_version=sdk_version,
+            host=host,
+            api_version=api_version,
+            path="/public-key",
+            user=user,
+            language=language,
+            timeout=timeout,
+            transport=Transport(
+                pool=transport.pool if transport else None,
+                signer=transport.signer if transport else None,
+                retries=_retries,
+            ),
+            query={"limit": 1},
+        ).json()["publicKeys"][0]["content"]
+    return fetch
+
+
+parse_and_verify = set_relay(_parse_and_verify)
+verify = set_relay(_verify)
@@ -0,0 +1,42 @@
+from datetime import date, datetime, time, timedelta
+
+
+def windows(after, before, count):
+    """# Split a date range into windows
+    Split the range between after and before into up to count consecutive windows of about
+    the same size, from the most recent to the oldest one. Date bounds are whole days, both
+    inclusive, so each window ends the day before the next one starts. Datetime bounds are
+    exact instants, so each window starts at the instant the previous one ends and the most
+    recent window keeps the original before, which leaves it open if before is None.
+    ## Parameters (required):
+    - after [datetime.date or datetime.datetime]: start of the range. ex: datetime.date(2020, 3, 1)
+    - before [datetime.date, datetime.datetime or None]: end of the range. Today, or open ended for datetimes, if None. ex: datetime.date(2020, 3, 31)
+    - count [integer]: maximum number of windows. ex: 4
+    ## Return:
+    - list of (after, before) tuples of datetime.date or datetime.datetime
+    """
+    if isinstance(after, datetime) or isinstance(before, datetime):
+        return _instant_windows(after=_instant(after), before=before and _instant(before, end=True), count=count)
+
+    before = before or date.today()
+    days = (before - after).days + 1
+    if days < 1:
+        return [(after, before)]
+    count = max(min(count, days), 1)
+    edges = [after + timedelta(days=days * i // count) for i in range(count + 1)]
+    return [(edges[i], edges[i + 1] - timedelta(days=1)) for i in reversed(range(count))]
+
+
+def _instant_windows(after, before, count):
+    end = before or datetime.now(after.tzinfo)
+    if end <= after:
+        return [(after, before)]
+    span = end - after
+    edges = [after + span * i // count for i in range(count)] + [before]
+    return [(edges[i], edges[i + 1]) for i in reversed(range(count))]
+
+
+def _instant(value, end=False):
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value + timedelta(days=1) if end else value, time())
@@ -0,0 +1,97 @@
+from time import time
+from threading import Lock
+from starkcore.utils.checks import check_timedelta
+
+
+class Pool:
+    """# Pool object
+    The Pool object keeps HTTP connections alive between requests, so consecutive calls
+    made by the same user reuse the same TCP and TLS sessions instead of opening a new
+    connection on each call. Each user gets its own set of connections, which are closed
+    after staying unused for longer than the idle timeout.
+    A default pool is used when none is set, but you may define your own at the start (See README).
+    ## Parameters (optional):
+    - size [integer, default 10]: maximum number of connections kept alive for each user. ex: 20
+    - idle_timeout [integer or datetime.timedelta, default 60]: seconds a user's connections may stay unused before being closed. ex: 30
+    """
+
+    def __init__(self, size=10, idle_timeout=60):
+        self.size = size
+        self.idle_timeout = check_timedelta(idle_timeout).total_seconds()
+        self._sessions = {}
+        self._lock = Lock()
+
+    def session(self, user):
+        """# Retrieve the keep-alive session of a user
+        Return the requests.Session holding the user's connections, creating it if needed
+        and closing the sessions of any user that has been idle for too long. The session
+        counts as in use until release is called for the same user, and a session in use
+        is never closed for being idle.
+        ## Parameters (required):
+        - user [Organization/Project object]: user whose session will be returned.
+        ## Return:
+        - requests.Session object
+        """
+        key = _key(user)
+        now = time()
+        with self._lock:
+            for idle_key, (session, last_used, in_use) in list(self._sessions.items()):
+                if not in_use and now - last_used >= self.idle_timeout:
+                    del self._sessions[idle_key]
+                    session.close()
+
+            session, _, in_use = self._sessions.get(key) or (self._open(), now, 0)
+            self._sessions[key] = (session, now, in_use + 1)
+        return session
+
+    def release(self, user):
+        """# Release the keep-alive session of a user
+        Mark a request made with the session returned by session as finished, so the
+        idle timeout of the user's connections counts from the end of their last request.
+        ## Parameters (required):
+        - user [Organization/Project object]: user whose request finished.
+        """
+        key = _key(user)
+        with self._lock:
+            if key in self._sessions:
+                session, _, in_use = self._sessions[key]
+                self._sessions[key] = (session, time(), max(in_use - 1, 0))
+
+    def close(self):
+        """# Close all connections
+        Close every connection currently kept alive by the pool.
+        """
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session, _, _ in sessions.values():
+            session.close()
+
+    def _open(self):
+        return _session(self.size)
+
+    def _transport(self):
+        from httpx import AsyncHTTPTransport, Limits
+        return AsyncHTTPTransport(limits=Limits(
+            max_connections=self.size,
+            max_keepalive_connections=self.size,
+            keepalive_expiry=self.idle_timeout,
+        ))
+
+
+def _key(user):
+    access_id = user.access_id() if hasattr(user, "access_id") else None
+    return "{environment}:{access_id}".format(environment=user.environment, access_id=access_id)
+
+
+def _session(size):
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+default = Pool()
@@ -0,0 +1,63 @@
+from threading import Event, Thread
+
+try:
+    from queue import Queue, Full
+except ImportError:
+    from Queue import Queue, Full
+
+
+_end = object()
+
+
+def prefetch(iterator, size, stop=None):
+    """# Prefetch an iterator on a background thread
+    Start consuming the iterator on a worker thread, keeping up to size items buffered
+    ahead of the caller, so the time spent producing the next items overlaps with the
+    time spent processing the current ones. Errors raised by the iterator are re-raised
+    to the caller when reached and the worker stops as soon as the caller stops iterating.
+    ## Parameters (required):
+    - iterator [iterator]: iterator to be consumed in the background. ex: pages of a query
+    - size [integer]: maximum number of items buffered ahead of the caller, or 0 for no limit. ex: 2
+    ## Parameters (optional):
+    - stop [threading.Event, default None]: event that also stops the worker when set, even if the returned generator was never iterated.
+    ## Return:
+    - generator with the same items as the iterator
+    """
+    queue = Queue(maxsize=size)
+    done = Event()
+
+    def put(item):
+        while not done.is_set() and not (stop and stop.is_set()):
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def work():
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+            put((_end, None))
+        except Exception as exception:
+            put((None, exception))
+
+    worker = Thread(target=work)
+    worker.daemon = True
+    worker.start()
+    return _consume(queue, done)
+
+
+def _consume(queue, done):
+    try:
+        while True:
+            item, exception = queue.get()
+            if exception is not None:
+                raise exception
+            if item is _end:
+                return
+            yield item
+    finally:
+        done.set()
@@ -0,0 +1,114 @@
+from time import time
+from threading import Lock
+from email.utils import parsedate_tz, mktime_tz
+from .pool import _key
+
+
+class RateLimiter:
+    """# RateLimiter object
+    The RateLimiter object paces requests with one token bucket per user and endpoint, shared by
+    every thread or task that uses it, so concurrent workers split a single budget instead of all
+    being throttled and backing off together. Each bucket adapts its rate to the API: it is halved
+    whenever a 429 response arrives, paused for as long as the Retry-After header asks, and grows
+    again little by little while requests succeed.
+    No rate limiting is done by default, but you may enable it at the start (See README).
+    ## Parameters (optional):
+    - rate [integer or float, default 10]: initial number of requests per second on each endpoint. ex: 50
+    - burst [integer, default None]: maximum number of requests sent at once after an idle period. Defaults to the current rate. ex: 20
+    - min_rate [integer or float, default 1]: lowest rate reached after consecutive 429 responses. ex: 0.5
+    - max_rate [integer or float, default None]: highest rate reached while requests succeed. Unlimited if None. ex: 200
+    - increase [integer or float, default 1]: requests per second added to the rate after each second of successful requests. ex: 5
+    ## Attributes (return-only):
+    - throttles [integer]: number of 429 responses received so far. ex: 3
+    - waited [float]: total seconds requests were held before being sent. ex: 12.5
+    """
+
+    def __init__(self, rate=10, burst=None, min_rate=1, max_rate=None, increase=1):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.throttles = 0
+        self.waited = 0.0
+        self._buckets = {}
+        self._lock = Lock()
+
+    def acquire(self, key):
+        """# Reserve a request
+        Take a token from the key's bucket, reserving a future one if it is empty.
+        ## Parameters (required):
+        - key [string]: user and endpoint of the request. ex: "sandbox:project/1111111111111111 pix-key"
+        ## Return:
+        - seconds to wait before sending the request [float]
+        """
+        now = time()
+        with self._lock:
+            bucket = self._bucket(key, now)
+            bucket.refill(now, burst=self.burst)
+            bucket.tokens -= 1
+            delay = max(bucket.paused_until - now, 0) + max(-bucket.tokens / bucket.rate, 0)
+            self.waited += delay
+            return delay
+
+    def update(self, key, status, retry_after=None):
+        """# Adapt a bucket to a response
+        Halve the rate of the key's bucket on 429 responses, pausing it for the Retry-After seconds,
+        or slowly raise it on other responses.
+        ## Parameters (required):
+        - key [string]: user and endpoint of the request. ex: "sandbox:project/1111111111111111 pix-key"
+        - status [integer]: HTTP status of the response. ex: 429
+        ## Parameters (optional):
+        - retry_after [float, default None]: seconds the API asked to wait before the next request. ex: 2
+        """
+        now = time()
+        with self._lock:
+            bucket = self._bucket(key, now)
+            if status == 429:
+                self.throttles += 1
+                bucket.refill(now, burst=self.burst)
+                bucket.rate = max(self.min_rate, bucket.rate / 2.0)
+                bucket.tokens = min(bucket.tokens, 0)
+                if retry_after:
+                    bucket.paused_until = max(bucket.paused_until, now + retry_after)
+                return
+            rate = bucket.rate + self.increase / bucket.rate
+            bucket.rate = rate if self.max_rate is None else min(self.max_rate, rate)
+
+    def _bucket(self, key, now):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(rate=self.rate, tokens=self.burst or self.rate, now=now)
+        return bucket
+
+
+class _Bucket:
+
+    __slots__ = ("rate", "tokens", "updated", "paused_until")
+
+    def __init__(self, rate, tokens, now):
+        self.rate = rate
+        self.tokens = tokens
+        self.updated = now
+        self.paused_until = 0
+
+    def refill(self, now, burst):
+        start = max(self.updated, self.paused_until)
+        if now > start:
+            self.tokens = min(burst or self.rate, self.tokens + (now - start) * self.rate)
+        self.updated = max(now, self.updated)
+
+
+def key(user, path):
+    return "{user} {resource}".format(user=_key(user), resource=path.strip("/").split("/")[0])
+
+
+def retry_after(headers):
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        date = parsedate_tz(value)
+        return max(mktime_tz(date) - time(), 0) if date else None
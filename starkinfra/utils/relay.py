@@ -1,19 +1,33 @@
 import starkinfra
 from starkcore.utils.host import StarkHost
+from .transport import Transport
 
 
 _api_version = "v2"
+_transport = ["pool", "retries", "hedge", "rate_limiter", "circuit_breaker", "hooks", "compression", "signer"]
+_settings = ["prefetch", "stream", "concurrency", "public_key_cache"]
 
 
-def set_relay(func):
+def set_relay(func, settings=None):
+    code = getattr(func, "__wrapped__", func).__code__
+    parameters = code.co_varnames[:code.co_argcount]
+
     def wrapper(*args, **kwargs):
+        config = settings or starkinfra
         kwargs.update({
             "sdk_version": starkinfra.version,
             "host": StarkHost.infra,
             "api_version": kwargs.get("version") or _api_version,
-            "user": kwargs.get("user") or starkinfra.user,
-            "language": kwargs.get("language") or starkinfra.language,
-            "timeout": kwargs.get("timeout") or starkinfra.timeout,
+            "user": kwargs.get("user") or config.user,
+            "language": kwargs.get("language") or config.language,
+            "timeout": kwargs.get("timeout") or config.timeout,
         })
+        if "transport" in parameters and not kwargs.get("transport"):
+            kwargs["transport"] = Transport(**{
+                name: kwargs.pop(name, None) or getattr(config, name) for name in _transport
+            })
+        for name in _settings:
+            if name in parameters:
+                kwargs[name] = kwargs.get(name) or getattr(config, name)
         return func(*args, **kwargs)
     return wrapper
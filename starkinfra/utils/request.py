@@ -0,0 +1,397 @@
+from time import sleep, time
+from json import dumps
+from gzip import compress as _gzip
+from zlib import compress as _deflate
+from sys import version_info as python_version
+from starkcore.environment import Environment
+from starkcore.error import InternalServerError, InputErrors, UnknownError
+from starkcore.utils.host import StarkHost
+from starkcore.utils.url import urlencode
+from starkcore.utils.request import Response
+from starkcore.utils.checks import check_user, check_language
+from starkcore.user import PublicUser
+from . import pool as _pool
+from . import signer as _signer
+from . import retry as _retry
+from . import ratelimit as _ratelimit
+from . import breaker as _breaker
+from . import hooks as _hooks
+from . import transport as _transport
+from .hedge import endpoint as _endpoint
+
+
+_chunk_size = 16384
+_compression_threshold = 1024
+_compressors = {"gzip": _gzip, "deflate": _deflate}
+
+
+def fetch(host, sdk_version, user, method, path, payload=None, query=None, prefix="", api_version="v2",
+          language="en-US", timeout=15, raiseException=True, transport=None, idempotent=None, read=None):
+    _, response = _send(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method=method,
+        path=path,
+        payload=payload,
+        query=query,
+        prefix=prefix,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        idempotent=idempotent,
+        read=read,
+    )
+    if raiseException and response.status != 200:
+        _hooks.emit(response)
+    return respond(response=response, raiseException=raiseException)
+
+
+def fetch_stream(host, sdk_version, user, method, path, payload=None, query=None, prefix="", api_version="v2",
+                 language="en-US", timeout=15, transport=None, idempotent=None):
+    request, response = _send(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method=method,
+        path=path,
+        payload=payload,
+        query=query,
+        prefix=prefix,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        idempotent=idempotent,
+        stream=True,
+    )
+    if response.status != 200:
+        _hooks.emit(response)
+        respond(response=response)
+    return _chunks(request, response=response, release=lambda: _pool_of(transport).release(user))
+
+
+def _send(host, sdk_version, user, method, path, payload, query, prefix, api_version, language, timeout, transport,
+          idempotent, read=None, stream=False):
+    return _drive(policy(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method=method,
+        path=path,
+        payload=payload,
+        query=query,
+        prefix=prefix,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        idempotent=idempotent,
+        read=read,
+        stream=stream,
+    ))
+
+
+def _drive(steps):
+    result = None
+    while True:
+        try:
+            step, argument = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+        if step == "sleep":
+            result = sleep(argument)
+        elif step == "exchange":
+            result = _exchange(**argument)
+        else:
+            send = argument["send"]
+            result = _hedged(
+                send=lambda sent=None: _drive(send(sent=sent)),
+                hedge=argument["hedge"],
+                endpoint=argument["endpoint"],
+            )
+
+
+def policy(host, sdk_version, user, method, path, payload, query, prefix, api_version, language, timeout, transport,
+           idempotent, read=None, stream=False):
+    """# Policy loop
+    Apply the transport policies to a call, shared by the blocking and the asyncio layers. Each step
+    that waits is yielded for the layer to run and its result is sent back: ("sleep", seconds),
+    ("exchange", keyword arguments of the layer's _exchange) or ("hedge", send generator function,
+    hedge and endpoint). Returns the (raw response, Response) tuple of the last attempt.
+    """
+    transport = transport or _transport.default
+    pool = transport.pool or _pool.default
+    retries = transport.retries or _retry.default
+    hedge = transport.hedge
+    rate_limiter = transport.rate_limiter
+    circuit_breaker = transport.circuit_breaker
+    hooks = transport.hooks
+    if read is None:
+        read = method == "GET"
+    if idempotent is None:
+        idempotent = read
+    if not read or stream:
+        hedge = None
+    if rate_limiter:
+        limit = _ratelimit.key(user=check_user(user), path=path)
+    if circuit_breaker:
+        circuit = _breaker.scope(url=base_url(host, check_user(user), api_version), path=path)
+
+    def send(sent=None):
+        record = _hooks.RequestRecord(method=method, path=path, attempt=attempt, hooks=hooks) if hooks else None
+        waited = 0.0
+        if rate_limiter:
+            waited = rate_limiter.acquire(limit)
+            yield "sleep", waited
+        signing = time()
+        url, body, headers = prepare(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            path=path,
+            payload=payload,
+            query=query,
+            prefix=prefix,
+            api_version=api_version,
+            language=language,
+            compression=transport.compression,
+            signer=transport.signer,
+        )
+        if sent:
+            sent()
+        sending = time()
+        request, response = yield "exchange", dict(
+            pool=pool,
+            user=user,
+            method=method,
+            url=url,
+            body=body,
+            headers=headers,
+            timeout=timeout,
+            stream=stream,
+        )
+        if rate_limiter:
+            rate_limiter.update(limit, status=response.status, retry_after=_ratelimit.retry_after(response.headers))
+        if circuit_breaker:
+            circuit_breaker.record(circuit, status=response.status, seconds=time() - sending)
+        if record:
+            record.queue_wait = waited
+            record.signing = sending - signing
+            record.network = time() - sending
+            record.status = response.status
+            record.bytes_sent = _hooks.size(body)
+            record.bytes_received = 0 if stream and response.status == 200 else _received(response)
+            response.record = record
+        return request, response
+
+    start = time()
+    attempt = 0
+    while True:
+        attempt += 1
+        if circuit_breaker:
+            circuit_breaker.enter(circuit)
+        if hedge:
+            request, response = yield "hedge", dict(send=send, hedge=hedge, endpoint=_endpoint(method=method, path=path))
+        else:
+            request, response = yield from send()
+
+        delay = retries.delay(
+            attempt=attempt,
+            start=start,
+            status=response.status,
+            idempotent=idempotent,
+            retry_after=_ratelimit.retry_after(response.headers),
+        )
+        if delay is None:
+            break
+        _hooks.emit(response)
+        yield "sleep", delay
+
+    if response.status == 200:
+        retries.succeeded(attempt)
+    return request, response
+
+
+def _exchange(pool, user, method, url, body, headers, timeout, stream):
+    options = {"stream": True} if stream else {}
+    session = pool.session(user)
+    request = None
+    try:
+        request = session.request(
+            method=method,
+            url=url,
+            data=body,
+            headers=headers,
+            timeout=timeout,
+            **options
+        )
+        content = None if stream and request.status_code == 200 else request.content
+        response = Response(status=request.status_code, content=content, headers=request.headers)
+    except Exception as exception:
+        response = _failure(exception)
+    if not stream or response.status != 200:
+        pool.release(user)
+    return request, response
+
+
+def _hedged(send, hedge, endpoint):
+    from threading import Event, Thread
+    from concurrent.futures import Future, as_completed, wait
+
+    sent = Event()
+    original = Future()
+    Thread(target=_run, args=(original, send, hedge, endpoint, sent.set), daemon=True).start()
+    sent.wait()
+    done, _ = wait([original], timeout=hedge.wait(endpoint))
+    if done or not hedge.allow():
+        return original.result()
+
+    duplicate = hedge.executor().submit(_timed, send=send, hedge=hedge, endpoint=endpoint)
+    for future in as_completed([original, duplicate]):
+        request, response = future.result()
+        if response.status not in _retry._statuses:
+            if future is duplicate:
+                hedge.won()
+            break
+    for other in (original, duplicate):
+        if other is not future:
+            other.add_done_callback(lambda done: _hooks.emit(done.result()[1]))
+    return request, response
+
+
+def _run(future, send, hedge, endpoint, sent):
+    try:
+        future.set_result(_timed(send=send, hedge=hedge, endpoint=endpoint, sent=sent))
+    except BaseException as exception:
+        future.set_exception(exception)
+    finally:
+        sent()
+
+
+def _timed(send, hedge, endpoint, sent=None):
+    started = []
+
+    def start():
+        started.append(time())
+        if sent:
+            sent()
+
+    result = send(sent=start)
+    hedge.observe(endpoint=endpoint, seconds=time() - started[0])
+    return result
+
+
+def _chunks(request, response, release):
+    record = getattr(response, "record", None)
+    try:
+        for chunk in request.iter_content(chunk_size=_chunk_size):
+            if record:
+                record.bytes_received += len(chunk)
+            yield chunk
+    except Exception as exception:
+        respond(response=_failure(exception))
+    finally:
+        request.close()
+        release()
+        if record:
+            record.network = time() - record.start - record.queue_wait - record.signing
+            _hooks.emit(response)
+
+
+def _pool_of(transport):
+    return (transport or _transport.default).pool or _pool.default
+
+
+def _received(response):
+    length = response.headers.get("Content-Length")
+    if length and length.isdigit():
+        return int(length)
+    return _hooks.size(response.content)
+
+
+def _failure(exception):
+    error = "{}: {}".format(exception.__class__.__name__, str(exception.__context__ or exception))
+    return Response(status=0, content=error, headers={})
+
+
+def prepare(host, sdk_version, user, path, payload, query, prefix, api_version, language, compression=None,
+            signer=None):
+    user = check_user(user)
+    language = check_language(language)
+
+    url = "{base_url}/{path}{query}".format(base_url=base_url(host, user, api_version), path=path, query=urlencode(query))
+
+    body = dumps(payload) if payload else ""
+    headers = {
+        "User-Agent": _agent(prefix=prefix, host=host, sdk_version=sdk_version),
+        "Accept-Language": language,
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+    }
+    headers.update(_authentication_headers(user=user, body=body, signer=signer))
+    body, encoding = _compress(body, compression=compression)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return url, body, headers
+
+
+def respond(response, raiseException=True):
+    if not raiseException:
+        return response
+
+    if response.status == 500:
+        raise InternalServerError()
+    if response.status == 400:
+        raise InputErrors(response.json()["errors"])
+    if response.status != 200:
+        raise UnknownError(response.content)
+    return response
+
+
+def base_url(host, user, api_version):
+    service = {
+        StarkHost.infra: "starkinfra",
+        StarkHost.bank: "starkbank",
+        StarkHost.sign: "starksign",
+    }[host]
+
+    return {
+        Environment.production: "https://api.{service}.com/",
+        Environment.sandbox: "https://sandbox.api.{service}.com/",
+    }[user.environment].format(service=service) + api_version
+
+
+def _agent(prefix, host, sdk_version):
+    return "{prefix}Python-{major}.{minor}.{micro}-SDK-{host}-{sdk_version}".format(
+        prefix=prefix + "-" if prefix else "",
+        major=python_version.major,
+        minor=python_version.minor,
+        micro=python_version.micro,
+        host=host,
+        sdk_version=sdk_version,
+    )
+
+
+def _compress(body, compression):
+    if not compression or len(body) < _compression_threshold:
+        return body, None
+    if compression not in _compressors:
+        raise ValueError("compression must be one of {options}".format(options=", ".join(sorted(_compressors))))
+    return _compressors[compression](body.encode("utf-8")), compression
+
+
+def _authentication_headers(user, body, signer=None):
+    if isinstance(user, PublicUser):
+        return {}
+
+    access_time = str(time())
+    message = "{access_id}:{access_time}:{body}".format(access_id=user.access_id(), access_time=access_time, body=body)
+    signature = (signer or _signer.default).sign(message=message, pem=user.pem)
+
+    return {
+        "Access-Id": user.access_id(),
+        "Access-Time": access_time,
+        "Access-Signature": signature,
+    }
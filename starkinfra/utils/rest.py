@@ -1,20 +1,353 @@
+from functools import wraps
+from threading import Event
+from . import bulk
+from . import operation
 from .relay import set_relay
-from starkcore.utils import rest
-
-
-get_page = set_relay(rest.get_page)
-get_stream = set_relay(rest.get_stream)
-get_id = set_relay(rest.get_id)
-get_content = set_relay(rest.get_content)
-get_sub_resource = set_relay(rest.get_sub_resource)
-get_sub_resources = set_relay(rest.get_sub_resources)
-post_multi = set_relay(rest.post_multi)
-put_multi = set_relay(rest.put_multi)
-post_single = set_relay(rest.post_single)
-delete_id = set_relay(rest.delete_id)
-patch_id = set_relay(rest.patch_id)
-get_raw = set_relay(rest.get_raw)
-post_raw = set_relay(rest.post_raw)
-put_raw = set_relay(rest.put_raw)
-patch_raw = set_relay(rest.patch_raw)
-delete_raw = set_relay(rest.delete_raw)
\ No newline at end of file
+from .decode import decode
+from .request import fetch, fetch_stream
+from .jsonstream import items
+from .prefetch import prefetch as _prefetch
+from .partition import windows
+from starkcore.error import InputErrors
+from starkcore.utils.api import endpoint, last_name_plural
+
+
+_window_buffer = 10
+_chunk_size = 100
+
+
+def _blocking(function):
+    @wraps(function)
+    def run(*args, **kwargs):
+        steps = function(*args, **kwargs)
+        response = None
+        while True:
+            try:
+                request = steps.send(response)
+            except StopIteration as stop:
+                return stop.value
+            response = fetch(**request)
+    return run
+
+
+_get_page = _blocking(operation.get_page)
+_get_json_page = _blocking(operation.get_json_page)
+_get_id = _blocking(operation.get_id)
+_get_content = _blocking(operation.get_content)
+_get_sub_resource = _blocking(operation.get_sub_resource)
+_get_sub_resources = _blocking(operation.get_sub_resources)
+_post_chunk = _blocking(operation.post_chunk)
+_post_single = _blocking(operation.post_single)
+_delete_id = _blocking(operation.delete_id)
+_patch_id = _blocking(operation.patch_id)
+_put_multi = _blocking(operation.put_multi)
+_get_raw = _blocking(operation.get_raw)
+_post_raw = _blocking(operation.post_raw)
+_patch_raw = _blocking(operation.patch_raw)
+_put_raw = _blocking(operation.put_raw)
+_delete_raw = _blocking(operation.delete_raw)
+
+
+def _get_stream(sdk_version, host, api_version, user, resource, language, timeout, transport=None, prefetch=None,
+                stream=None, parallel=None, progress=None, output=None, raw=False, fields=None, limit=None, **query):
+    if stream and not prefetch and not output and not (parallel and query.get("after")):
+        entities = _get_entities(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            limit=limit,
+            **query
+        )
+        for entity in entities:
+            yield decode(resource, [entity], raw=raw, fields=fields)[0]
+        return
+
+    if parallel and query.get("after"):
+        pages = _get_window_pages(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            parallel=parallel,
+            progress=progress,
+            limit=limit,
+            **query
+        )
+    else:
+        pages = _get_pages(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            limit=limit,
+            **query
+        )
+        if prefetch:
+            pages = _prefetch(pages, size=prefetch)
+
+    for entities in pages:
+        batch = decode(resource, entities, output=output, raw=raw, fields=fields)
+        if output:
+            yield batch
+            continue
+        for entity in batch:
+            yield entity
+
+
+def _get_window_pages(sdk_version, host, api_version, user, resource, language, timeout, transport, parallel,
+                      progress, limit=None, after=None, before=None, **query):
+    stop = Event()
+    try:
+        streams = []
+        ranges = windows(after=after, before=before, count=parallel)
+        fetched = [0] * len(ranges)
+        reported = [Event() for _ in ranges]
+        for index, (window_after, window_before) in enumerate(ranges):
+            pages = _get_pages(
+                host=host,
+                sdk_version=sdk_version,
+                user=user,
+                resource=resource,
+                api_version=api_version,
+                language=language,
+                timeout=timeout,
+                transport=transport,
+                limit=limit,
+                after=window_after,
+                before=window_before,
+                **query
+            )
+            if limit is not None:
+                pages = _cap(pages, limit=limit, fetched=fetched, reported=reported, index=index, stop=stop)
+            if progress:
+                pages = _track(pages, after=window_after, before=window_before, progress=progress)
+            streams.append(_prefetch(pages, size=0 if index else _window_buffer, stop=stop))
+
+        for pages in streams:
+            for entities in pages:
+                if limit is not None:
+                    entities = entities[:limit]
+                    limit -= len(entities)
+                yield entities
+                if limit is not None and limit <= 0:
+                    return
+    finally:
+        stop.set()
+
+
+def _cap(pages, limit, fetched, reported, index, stop):
+    try:
+        for entities in pages:
+            fetched[index] += len(entities)
+            reported[index].set()
+            yield entities
+            for event in reported[:index]:
+                while not event.wait(0.1) and not stop.is_set():
+                    pass
+            if sum(fetched[:index + 1]) >= limit:
+                return
+    finally:
+        reported[index].set()
+
+
+def _track(pages, after, before, progress):
+    count = 0
+    for entities in pages:
+        count += len(entities)
+        progress(after=after, before=before, count=count, finished=False)
+        yield entities
+    progress(after=after, before=before, count=count, finished=True)
+
+
+def _get_pages(sdk_version, host, api_version, user, resource, language, timeout, transport=None, limit=None, **query):
+    limit_query = {"limit": min(limit, 100) if limit else limit}
+    limit_query.update(query)
+
+    while True:
+        entities, cursor = _get_json_page(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            **limit_query
+        )
+        yield entities
+
+        if limit:
+            limit -= 100
+            limit_query["limit"] = min(limit, 100)
+
+        limit_query["cursor"] = cursor
+        if not cursor or (limit is not None and limit <= 0):
+            break
+
+
+def _get_entities(sdk_version, host, api_version, user, resource, language, timeout, transport=None, limit=None,
+                  **query):
+    limit_query = {"limit": min(limit, 100) if limit else limit}
+    limit_query.update(query)
+
+    while True:
+        chunks = fetch_stream(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            method="GET",
+            path=endpoint(resource),
+            query=limit_query,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+        )
+        others = yield from items(chunks, key=last_name_plural(resource))
+        cursor = others.get("cursor")
+
+        if limit:
+            limit -= 100
+            limit_query["limit"] = min(limit, 100)
+
+        limit_query["cursor"] = cursor
+        if not cursor or (limit is not None and limit <= 0):
+            break
+
+
+def _get_many(sdk_version, host, api_version, user, resource, ids, language, timeout, transport=None, concurrency=None,
+              id_filter=None, raw=False, fields=None, **query):
+    ids = list(dict.fromkeys(ids))
+    chunks = list(bulk.chunks(ids, size=_chunk_size if id_filter else 1))
+
+    def batch(chunk):
+        pages = _get_pages(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            **dict(query, **{id_filter: chunk})
+        )
+        entities = [entity for page in pages for entity in page]
+        decoded = decode(resource, entities, raw=raw, fields=fields)
+        return {entity[id_filter[:-1]]: value for entity, value in zip(entities, decoded)}
+
+    def get(chunk):
+        try:
+            if id_filter:
+                return batch(chunk), None
+            return {chunk[0]: _get_id(
+                host=host,
+                sdk_version=sdk_version,
+                user=user,
+                resource=resource,
+                id=chunk[0],
+                api_version=api_version,
+                language=language,
+                timeout=timeout,
+                transport=transport,
+                raw=raw,
+                fields=fields,
+                **query
+            )}, None
+        except InputErrors as exception:
+            if id_filter:
+                return None, exception
+            return {}, None
+        except Exception as exception:
+            return None, exception
+
+    if len(chunks) < 2:
+        return bulk.index(ids, chunks, [get(chunk) for chunk in chunks])
+
+    from multiprocessing.pool import ThreadPool
+
+    workers = ThreadPool(min(concurrency or 1, len(chunks)))
+    try:
+        results = workers.map(get, chunks)
+    finally:
+        workers.close()
+    return bulk.index(ids, chunks, results)
+
+
+def _post_multi(sdk_version, host, api_version, user, resource, entities, language, timeout, transport=None, read=False,
+                concurrency=None, **query):
+    chunks = list(bulk.chunks(entities, size=_chunk_size))
+    if len(chunks) < 2:
+        return _post_chunk(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            entities=chunks[0] if chunks else [],
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            read=read,
+            **query
+        )
+
+    def post(chunk):
+        try:
+            return _post_chunk(
+                host=host,
+                sdk_version=sdk_version,
+                user=user,
+                resource=resource,
+                entities=chunk,
+                api_version=api_version,
+                language=language,
+                timeout=timeout,
+                transport=transport,
+                read=read,
+                **query
+            ), None
+        except Exception as exception:
+            return None, exception
+
+    from multiprocessing.pool import ThreadPool
+
+    workers = ThreadPool(min(concurrency or 1, len(chunks)))
+    try:
+        results = workers.map(post, chunks)
+    finally:
+        workers.close()
+    return bulk.merge(chunks, results)
+
+
+get_page = set_relay(_get_page)
+get_stream = set_relay(_get_stream)
+get_id = set_relay(_get_id)
+get_many = set_relay(_get_many)
+get_content = set_relay(_get_content)
+get_sub_resource = set_relay(_get_sub_resource)
+get_sub_resources = set_relay(_get_sub_resources)
+post_multi = set_relay(_post_multi)
+put_multi = set_relay(_put_multi)
+post_single = set_relay(_post_single)
+delete_id = set_relay(_delete_id)
+patch_id = set_relay(_patch_id)
+get_raw = set_relay(_get_raw)
+post_raw = set_relay(_post_raw)
+put_raw = set_relay(_put_raw)
+patch_raw = set_relay(_patch_raw)
+delete_raw = set_relay(_delete_raw)
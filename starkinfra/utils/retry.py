@@ -0,0 +1,84 @@
+from time import time
+from random import uniform
+from threading import Lock
+from starkcore.utils.checks import check_timedelta
+
+
+_statuses = (0, 500, 502, 503, 504)
+
+
+class Retry:
+    """# Retry object
+    The Retry object defines how requests that fail with a network error, a timeout or a 5xx
+    response are sent again. Each new attempt waits a random time of up to backoff * 2 ** retry
+    seconds (capped by max_backoff), so workers hit by the same outage don't retry in lockstep.
+    Reads are always retried, while creations are only retried when every entity carries an
+    external_id, which makes the API reject duplicates. Updates and deletions are never retried,
+    except after a 429 response, since throttled requests are not processed. In that case, the
+    next attempt also waits for the seconds asked by the Retry-After header.
+    The object also counts its retries, so they can be exported to your metrics.
+    A default policy is used when none is set, but you may define your own at the start (See README).
+    ## Parameters (optional):
+    - attempts [integer, default 3]: maximum number of times a request is sent, including the first one. Use 1 to disable retries. ex: 5
+    - backoff [integer, float or datetime.timedelta, default 0.25]: base waiting time in seconds before the first retry. ex: 0.5
+    - max_backoff [integer, float or datetime.timedelta, default 4]: maximum waiting time in seconds between two attempts. ex: 10
+    - deadline [integer, float or datetime.timedelta, default None]: seconds after the first attempt past which no retry is started. Unlimited if None. ex: 30
+    ## Attributes (return-only):
+    - retries [integer]: number of retries sent so far. ex: 12
+    - recoveries [integer]: number of requests that succeeded after being retried. ex: 10
+    - exhaustions [integer]: number of requests that still failed after all their attempts or deadline. ex: 2
+    """
+
+    def __init__(self, attempts=3, backoff=0.25, max_backoff=4, deadline=None):
+        self.attempts = attempts
+        self.backoff = _seconds(backoff)
+        self.max_backoff = _seconds(max_backoff)
+        self.deadline = _seconds(deadline) if deadline is not None else None
+        self.retries = 0
+        self.recoveries = 0
+        self.exhaustions = 0
+        self._lock = Lock()
+
+    def delay(self, attempt, start, status, idempotent, retry_after=None):
+        """# Decide whether a failed request is retried
+        Return how long to wait before sending a failed request again, counting the retry, or
+        None if it must not be retried, counting the exhaustion if retries were possible.
+        ## Parameters (required):
+        - attempt [integer]: number of times the request has been sent. ex: 1
+        - start [float]: epoch time of the first attempt. ex: 1700000000.0
+        - status [integer]: HTTP status of the last response, 0 for network errors and timeouts. ex: 503
+        - idempotent [bool]: whether sending the request twice is harmless. ex: True
+        ## Parameters (optional):
+        - retry_after [float, default None]: seconds the API asked to wait before the next attempt. ex: 2
+        ## Return:
+        - seconds to wait before the next attempt [float] or None
+        """
+        if status != 429 and (not idempotent or status not in _statuses):
+            return None
+        delay = max(uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))), retry_after or 0)
+        if attempt >= self.attempts or (self.deadline is not None and time() + delay - start > self.deadline):
+            if self.attempts > 1:
+                self._count("exhaustions")
+            return None
+        self._count("retries")
+        return delay
+
+    def succeeded(self, attempt):
+        """# Count a successful request
+        Count a request that succeeded after being retried.
+        ## Parameters (required):
+        - attempt [integer]: number of times the request has been sent. ex: 2
+        """
+        if attempt > 1:
+            self._count("recoveries")
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+def _seconds(value):
+    return check_timedelta(value).total_seconds()
+
+
+default = Retry()
@@ -0,0 +1,31 @@
+class Transport:
+    """# Transport object
+    The Transport object bundles the connection pool and the policies applied to each HTTP call,
+    so they reach the request layer as a single argument. It is built on every call from the
+    settings of the starkinfra module or of a Client, with any per-call overrides applied.
+    ## Parameters (optional):
+    - pool [Pool object, default None]: connection pool used by the requests. The default pool is used if None.
+    - retries [Retry object, default None]: retry policy of the requests. The default policy is used if None.
+    - hedge [Hedge object, default None]: hedging policy of the reads. No read is hedged if None.
+    - rate_limiter [RateLimiter object, default None]: rate limiter holding the requests. No request is held if None.
+    - circuit_breaker [CircuitBreaker object, default None]: circuit breaker refusing requests to failing resources. No request is refused if None.
+    - hooks [list of functions, default None]: functions called with a RequestRecord after each HTTP call.
+    - compression [string, default None]: encoding of the large request bodies. ex: "gzip" or "deflate". Bodies are sent uncompressed if None.
+    - signer [Signer object, default None]: signer of the requests and verifier of the webhook signatures. The default signer is used if None.
+    """
+
+    __slots__ = ("pool", "retries", "hedge", "rate_limiter", "circuit_breaker", "hooks", "compression", "signer")
+
+    def __init__(self, pool=None, retries=None, hedge=None, rate_limiter=None, circuit_breaker=None, hooks=None,
+                 compression=None, signer=None):
+        self.pool = pool
+        self.retries = retries
+        self.hedge = hedge
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hooks = hooks
+        self.compression = compression
+        self.signer = signer
+
+
+default = Transport()
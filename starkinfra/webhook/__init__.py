@@ -1 +1 @@
-from .__webhook import get, delete, query, page, create
+from .__webhook import get, get_many, delete, query, page, create
@@ -13,6 +13,8 @@ class Webhook(Resource):
     - id [string]: unique id returned when the webhook is created. ex: "5656565656565656"
     """
 
+    __slots__ = ("id", "url", "subscriptions")
+
     def __init__(self, url, subscriptions, id=None):
         Resource.__init__(self, id=id)
 
@@ -37,38 +39,62 @@ def create(url, subscriptions, user=None):
     return rest.post_single(resource=_resource, entity=Webhook(url=url, subscriptions=subscriptions), user=user)
 
 
-def get(id, user=None):
+def get(id, raw=False, fields=None, user=None):
     """# Retrieve a specific Webhook subscription
     Receive a single Webhook subscription object previously created in the Stark Infra API by its id
     ## Parameters (required):
     - id [string]: object unique id. ex: "5656565656565656"
     ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - Webhook object with updated attributes
     """
-    return rest.get_id(resource=_resource, id=id, user=user)
+    return rest.get_id(resource=_resource, id=id, raw=raw, fields=fields, user=user)
+
+
+def get_many(ids, raw=False, fields=None, user=None):
+    """# Retrieve specific Webhook subscriptions
+    Receive Webhook subscription objects previously created in the Stark Infra API by their ids
+    They are fetched by one request per id, sent concurrently by up to starkinfra.concurrency workers
+    ## Parameters (required):
+    - ids [list of strings]: objects unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - raw [bool, default False]: True to receive a dict, exactly as returned by the API, instead of an object. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of Webhook subscription objects with updated attributes by id, in the order of the given ids. Ids that were not found are mapped to None
+    """
+    return rest.get_many(resource=_resource, ids=ids, id_filter=None, raw=raw, fields=fields, user=user)
 
 
-def query(limit=None, user=None):
+def query(limit=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve Webhook subscriptions
     Receive a generator of Webhook subscription objects previously created in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - output [string, default None]: "columns" to receive a generator of column batches, one per page, instead of objects. Each batch is a dict keyed by field name where numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a generator of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of Webhook objects with updated attributes
     """
-    return rest.get_stream(resource=_resource, limit=limit, user=user)
+    return rest.get_stream(resource=_resource, limit=limit, output=output, raw=raw, fields=fields, user=user)
 
 
-def page(cursor=None, limit=None, user=None):
+def page(cursor=None, limit=None, output=None, raw=False, fields=None, user=None):
     """# Retrieve paged Webhooks subscriptions
     Receive a list of up to 100 Webhook subscription objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
     ## Parameters (optional):
     - cursor [string, default None]: cursor returned on the previous page function call
     - limit [integer, default 100]: maximum number of objects to be retrieved. It must be an integer between 1 and 100. ex: 50
+    - output [string, default None]: "columns" to receive the page as a dict of columns keyed by field name instead of a list of objects. Numbers come in typed arrays and datetimes in epoch microseconds. ex: "columns"
+    - raw [bool, default False]: True to receive a list of dicts, exactly as returned by the API, instead of objects. ex: True
+    - fields [list of strings, default None]: fields to be decoded, all others are discarded and set to None. ex: ["id", "status", "amount"]
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of Webhook objects with updated attributes
@@ -78,6 +104,9 @@ def page(cursor=None, limit=None, user=None):
         resource=_resource,
         cursor=cursor,
         limit=limit,
+        output=output,
+        raw=raw,
+        fields=fields,
         user=user,
     )
 
@@ -0,0 +1,147 @@
+import starkinfra
+from time import time
+from json import dumps
+from threading import Thread
+from unittest import TestCase, main
+from starkinfra.pixrequest.__pixrequest import _resource
+from tests.utils.server import ApiServer
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+def _client(server, **settings):
+    records = []
+    client = starkinfra.Client(user=project, pool=server.pool(), hooks=[records.append], **settings)
+    return client, records
+
+
+def _percentile(values, percentile):
+    values = sorted(values)
+    return values[min(int(percentile / 100.0 * len(values)), len(values) - 1)]
+
+
+def _report(name, n, elapsed, records=(), unit="requests"):
+    print("{name}: {rate:.0f} {unit}/s".format(name=name, rate=n / elapsed, unit=unit), end="")
+    if records:
+        totals = [record.total for record in records]
+        overheads = [record.signing + record.decode for record in records]
+        print(", p50 {p50:.2f} ms, p99 {p99:.2f} ms, sdk overhead {overhead:.2f} ms/request".format(
+            p50=_percentile(totals, 50) * 1000,
+            p99=_percentile(totals, 99) * 1000,
+            overhead=sum(overheads) / len(overheads) * 1000,
+        ), end="")
+    print()
+    return n / elapsed
+
+
+def _event(request):
+    return dumps({"event": {
+        "id": "5000000000000000",
+        "subscription": "pix-request.in",
+        "created": "2024-01-01T00:00:00.000000+00:00",
+        "workspaceId": "1111111111111111",
+        "log": {
+            "id": "5000000000000001",
+            "type": "created",
+            "created": "2024-01-01T00:00:00.000000+00:00",
+            "errors": [],
+            "request": request,
+        },
+    }})
+
+
+class TestApiBenchmark(TestCase):
+
+    def setUp(self):
+        self.server = ApiServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_create(self):
+        n = 200
+        client, records = _client(self.server)
+        client.pixrequest.create(generateFakePixRequests(1))
+        del records[:]
+        start = time()
+        for _ in range(n):
+            client.pixrequest.create(generateFakePixRequests(1))
+        _report("create", n=n, elapsed=time() - start, records=records)
+        self.assertEqual(self.server.requests["POST pix-request"], n + 1)
+        self.assertLess(_percentile([record.total for record in records], 50), 0.05)
+
+    def test_get(self):
+        n = 500
+        ids = [request["id"] for request in self.server.seed(_resource, generateFakePixRequests(100))]
+        client, records = _client(self.server)
+        start = time()
+        for i in range(n):
+            client.pixrequest.get(ids[i % len(ids)])
+        _report("get", n=n, elapsed=time() - start, records=records)
+
+        del records[:]
+        workers = [Thread(target=lambda: [client.pixrequest.get(id) for id in ids]) for _ in range(4)]
+        start = time()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        _report("get, 4 threads", n=len(ids) * 4, elapsed=time() - start, records=records)
+        self.assertEqual(len(records), len(ids) * 4)
+        self.assertLess(_percentile([record.total for record in records], 50), 0.05)
+        self.assertLess(sum(record.signing + record.decode for record in records) / len(records), 0.005)
+
+    def test_get_many(self):
+        n = 1000
+        ids = [request["id"] for request in self.server.seed(_resource, generateFakePixRequests(n))]
+        for concurrency in [1, 4]:
+            client, records = _client(self.server, concurrency=concurrency)
+            start = time()
+            requests = client.pixrequest.get_many(ids)
+            _report("get_many, concurrency {}".format(concurrency), n=n, elapsed=time() - start, unit="entities")
+            self.assertEqual([request.id for request in requests.values()], ids)
+            self.assertEqual(len(records), n // 100)
+
+    def test_query(self):
+        n = 5000
+        self.server.seed(_resource, generateFakePixRequests(n))
+        rates = {}
+        for name, settings in [("pages", {}), ("stream", {"stream": True}), ("prefetch", {"prefetch": 2})]:
+            client, records = _client(self.server, **settings)
+            start = time()
+            amounts = [request.amount for request in client.pixrequest.query()]
+            rates[name] = _report("query " + name, n=n, elapsed=time() - start, unit="entities")
+            self.assertEqual(len(amounts), n)
+            self.assertEqual(len(records), n // 100)
+        self.assertGreater(min(rates.values()), 1000)
+
+    def test_bulk(self):
+        n = 2000
+        for concurrency in [1, 4]:
+            client, records = _client(self.server, concurrency=concurrency)
+            start = time()
+            requests = client.pixrequest.create(generateFakePixRequests(n))
+            _report("bulk create, concurrency {}".format(concurrency), n=n, elapsed=time() - start, unit="entities")
+            self.assertEqual(len(set(request.id for request in requests)), n)
+            self.assertEqual(len(records), n // 100)
+
+    def test_parse(self):
+        n = 500
+        request = self.server.seed(_resource, generateFakePixRequests(1))[0]
+        content = _event(request)
+        signature = self.server.sign(content)
+        signers = [("python", starkinfra.Signer)]
+        if starkinfra.utils.signer.coincurve:
+            signers.append(("coincurve", starkinfra.CoincurveSigner))
+        for i, (name, signer) in enumerate(signers):
+            client, _ = _client(self.server, public_key_cache=starkinfra.PublicKeyCache(), signer=signer())
+            start = time()
+            for _ in range(n):
+                event = client.event.parse(content=content, signature=signature)
+            _report("parse and verify, " + name, n=n, elapsed=time() - start, unit="events")
+            self.assertEqual(event.log.request.id, request["id"])
+            self.assertEqual(self.server.requests["GET public-key"], i + 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import starkinfra
+from time import sleep, time
+from json import dumps, loads
+from gzip import compress, decompress
+from threading import Thread
+from unittest import TestCase, main
+from starkcore.utils.api import api_json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tests.utils.server import LocalPool
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+_chunk = 16 * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        entities = [dict(entity, id=str(i)) for i, entity in enumerate(self.server.page)]
+        self._respond({"requests": entities, "cursor": None})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received += len(body)
+        sleep(len(body) / self.server.bandwidth)
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = decompress(body)
+        entities = loads(body.decode("utf-8"))["requests"]
+        self._respond({"requests": [dict(entity, id=str(i)) for i, entity in enumerate(entities)]})
+
+    def _respond(self, json):
+        content = dumps(json).encode("utf-8")
+        self.send_response(200)
+        if self.server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            content = compress(content)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.server.sent += len(content)
+        for start in range(0, len(content), _chunk):
+            part = content[start:start + _chunk]
+            self.wfile.write(part)
+            sleep(len(part) / self.server.bandwidth)
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.page = [api_json(request) for request in generateFakePixRequests(100)]
+    server.compress = False
+    server.bandwidth = None
+    server.sent = 0
+    server.received = 0
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(server, client, bandwidth, compression, compress_responses, n):
+    client.compression = compression
+    server.bandwidth = bandwidth
+    server.compress = compress_responses
+    server.sent = server.received = 0
+    start = time()
+    for _ in range(n):
+        client.pixrequest.page()
+        client.pixrequest.create(generateFakePixRequests(100))
+    elapsed = time() - start
+    return elapsed / n, server.received / n, server.sent / n
+
+
+class TestCompressionBenchmark(TestCase):
+
+    def test_transfer(self):
+        server = _serve()
+        client = starkinfra.Client(user=project, pool=LocalPool(port=server.server_address[1]), concurrency=1)
+        results = {}
+        try:
+            for megabytes in [1, 10, 100]:
+                bandwidth = megabytes * 1024 * 1024
+                for name, compression in [("plain", None), ("gzip", "gzip")]:
+                    results[megabytes, name] = _measure(
+                        server=server,
+                        client=client,
+                        bandwidth=bandwidth,
+                        compression=compression,
+                        compress_responses=bool(compression),
+                        n=5,
+                    )
+        finally:
+            client.close()
+            server.shutdown()
+
+        for (megabytes, name), (elapsed, received, sent) in sorted(results.items()):
+            print("{megabytes} MB/s {name}: {elapsed:.1f} ms per page and create, {received:.0f} bytes up, "
+                  "{sent:.0f} bytes down".format(
+                megabytes=megabytes,
+                name=name,
+                elapsed=elapsed * 1000,
+                received=received,
+                sent=sent,
+            ))
+        plain, compressed = results[1, "plain"], results[1, "gzip"]
+        self.assertLess(compressed[1], plain[1] / 3)
+        self.assertLess(compressed[2], plain[2] / 3)
+        self.assertLess(compressed[0], plain[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import starkinfra
+from time import time
+from multiprocessing.pool import ThreadPool
+from unittest import TestCase, main
+from starkinfra.issuingcard.__issuingcard import _resource
+from tests.utils.server import ApiServer, LocalPool, LocalHttp2Pool
+from tests.utils.fakeUser import project
+
+
+def _card(i):
+    return {"holderName": "Tony Stark {i}".format(i=i), "holderTaxId": "012.345.678-90", "holderExternalId": str(i)}
+
+
+def _benchmark(server, pool, ids, workers):
+    records = []
+    client = starkinfra.Client(user=project, pool=pool, hooks=[records.append])
+    threads = ThreadPool(workers)
+    threads.map(client.issuingcard.get, ids[:workers])
+    del records[:]
+    server.max_in_flight = 0
+    start = time()
+    cards = threads.map(client.issuingcard.get, ids)
+    elapsed = time() - start
+    threads.close()
+    client.close()
+    totals = sorted(record.total for record in records)
+    return len(cards) / elapsed, totals[len(totals) // 2], totals[int(len(totals) * 0.99)]
+
+
+class TestHttp2Benchmark(TestCase):
+
+    def test_parallel_gets(self):
+        n = 1000
+        workers = 32
+        results = {}
+        for name, http2, pool in [
+            ("HTTP/1.1 pool", False, lambda port: LocalPool(port=port, size=workers)),
+            ("HTTP/2, 1 connection", True, lambda port: LocalHttp2Pool(port=port, connections=1, streams=workers)),
+            ("HTTP/2, 8 streams", True, lambda port: LocalHttp2Pool(port=port, connections=1, streams=8)),
+        ]:
+            server = ApiServer(latency=0.05, http2=http2, streams=workers)
+            try:
+                ids = [card["id"] for card in server.seed(_resource, [_card(i) for i in range(100)])]
+                rate, p50, p99 = _benchmark(server, pool(server.port), ids=ids * (n // len(ids)), workers=workers)
+                results[name] = (rate, server.connections, server.max_in_flight)
+            finally:
+                server.close()
+            print("{name}: {rate:.0f} requests/s, p50 {p50:.1f} ms, p99 {p99:.1f} ms, {connections} connections, "
+                  "{streams} concurrent requests".format(
+                name=name,
+                rate=rate,
+                p50=p50 * 1000,
+                p99=p99 * 1000,
+                connections=server.connections,
+                streams=server.max_in_flight,
+            ))
+
+        http1, http2, limited = results["HTTP/1.1 pool"], results["HTTP/2, 1 connection"], results["HTTP/2, 8 streams"]
+        self.assertGreater(http1[1], workers / 2)
+        self.assertEqual(http2[1], 1)
+        self.assertGreater(http2[0], http1[0] / 2)
+        self.assertLessEqual(limited[2], 8)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import sys
+from subprocess import check_output
+from unittest import TestCase, main
+
+
+_lazy = "import starkinfra"
+_webhook = "import starkinfra; starkinfra.issuingpurchase.parse"
+_eager = "import starkinfra; [getattr(starkinfra, name) for name in starkinfra._packages + list(starkinfra._classes)]"
+
+
+def _benchmark(statement, n):
+    script = "from time import time; start = time(); {statement}; print(time() - start)".format(statement=statement)
+    timings = [float(check_output([sys.executable, "-c", script])) for _ in range(n)]
+    return min(timings)
+
+
+class TestImportBenchmark(TestCase):
+
+    def test_import_time(self):
+        lazy = _benchmark(_lazy, n=5)
+        webhook = _benchmark(_webhook, n=5)
+        eager = _benchmark(_eager, n=5)
+        print("import starkinfra: {:.1f} ms".format(lazy * 1000))
+        print("import starkinfra and load issuingpurchase: {:.1f} ms".format(webhook * 1000))
+        print("import starkinfra and load every resource: {:.1f} ms".format(eager * 1000))
+        self.assertLess(lazy, eager)
+        self.assertLess(webhook, eager)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+import sys
+import starkinfra
+from time import time
+from resource import getrusage, RUSAGE_SELF
+from unittest import TestCase, main
+from starkcore.utils.api import from_api_json
+from starkinfra.pixrequest.__pixrequest import _resource
+from tests.utils.fakePixRequest import fakePixRequestJson
+
+
+def _peak_memory():
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class TestMemoryBenchmark(TestCase):
+
+    def test_pix_requests(self):
+        n = 1000000
+        before = _peak_memory()
+        start = time()
+        requests = [from_api_json(_resource, dict(fakePixRequestJson, id=str(i))) for i in range(n)]
+        elapsed = time() - start
+        memory = _peak_memory() - before
+        print("{} PixRequests: {:.0f} MB, {:.0f} bytes/object, deserialized in {:.1f} s".format(
+            n, memory / 2 ** 20, memory / n, elapsed,
+        ))
+        self.assertEqual(len(requests), n)
+        self.assertLess(memory / n, 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import starkinfra
+from time import time
+from unittest import TestCase, main
+from starkinfra.pixrequest.__pixrequest import _resource
+from tests.utils.server import ApiServer, LocalPool
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+def _benchmark(server, pool, n):
+    client = starkinfra.Client(user=project, pool=pool)
+    client.pixrequest.page(limit=1)
+    server.connections = 0
+    start = time()
+    for _ in range(n):
+        client.pixrequest.page(limit=1)
+    elapsed = time() - start
+    client.close()
+    return elapsed / n, server.connections
+
+
+class TestPoolBenchmark(TestCase):
+
+    def setUp(self):
+        self.server = ApiServer()
+        self.server.seed(_resource, generateFakePixRequests(1))
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_keep_alive(self):
+        n = 200
+        pooled, pooled_connections = _benchmark(self.server, pool=LocalPool(port=self.server.port, size=1), n=n)
+        fresh, fresh_connections = _benchmark(
+            self.server,
+            pool=LocalPool(port=self.server.port, size=1, idle_timeout=0),
+            n=n,
+        )
+        print("keep-alive: {:.2f} ms/request over {} connections".format(pooled * 1000, pooled_connections))
+        print("new connection: {:.2f} ms/request over {} connections".format(fresh * 1000, fresh_connections))
+        print("connection setup removed: {:.2f} ms/request".format((fresh - pooled) * 1000))
+        self.assertEqual(pooled_connections, 0)
+        self.assertEqual(fresh_connections, n)
+        self.assertLess(pooled, fresh)
+
+
+if __name__ == '__main__':
+    main()
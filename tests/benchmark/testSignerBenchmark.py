@@ -0,0 +1,34 @@
+import starkinfra
+from time import time
+from unittest import TestCase, main
+from starkinfra.utils.request import _authentication_headers
+from starkinfra.utils.signer import Signer, CoincurveSigner
+
+
+_private_key, _ = starkinfra.key.create()
+_users = {
+    "project": starkinfra.Project(environment="sandbox", id="1234", private_key=_private_key),
+    "organization": starkinfra.Organization(environment="sandbox", id="5678", private_key=_private_key, workspace_id="1234"),
+}
+
+
+def _benchmark(signer, user, n):
+    _authentication_headers(user=user, body="{}", signer=signer)
+    start = time()
+    for _ in range(n):
+        _authentication_headers(user=user, body="{}", signer=signer)
+    return n / (time() - start)
+
+
+class TestSignerBenchmark(TestCase):
+
+    def test_signatures_per_second(self):
+        for name, user in _users.items():
+            python = _benchmark(signer=Signer(), user=user, n=200)
+            coincurve = _benchmark(signer=CoincurveSigner(), user=user, n=2000)
+            print("{}: {:.0f} signatures/s pure-Python, {:.0f} signatures/s coincurve".format(name, python, coincurve))
+            self.assertLess(python, coincurve)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import starkinfra
+from time import time
+from unittest import TestCase, main
+from ellipticcurve import Ecdsa, PrivateKey, PublicKey, Signature
+
+
+_private_key = PrivateKey()
+_pem = _private_key.publicKey().toPem()
+_content = '{"acquirerId": "236090", "amount": 100, "cardId": "5671893688385536", "holderId": "5917814565109760", "merchantName": "COMPANY 123", "purpose": "purchase"}'
+_signature = Ecdsa.sign(_content, _private_key).toBase64()
+
+
+def _benchmark(verify, n):
+    verify()
+    start = time()
+    for _ in range(n):
+        verify()
+    return n / (time() - start)
+
+
+def _parse():
+    return starkinfra.issuingpurchase.parse(content=_content, signature=_signature)
+
+
+class TestVerifyBenchmark(TestCase):
+
+    def setUp(self):
+        starkinfra.public_key_cache = starkinfra.PublicKeyCache()
+        starkinfra.public_key_cache.get(lambda: _pem)
+
+    def tearDown(self):
+        starkinfra.public_key_cache = None
+        starkinfra.signer = None
+
+    def test_verifications_per_second(self):
+        decoded = _benchmark(lambda: Ecdsa.verify(_content, Signature.fromBase64(_signature), PublicKey.fromPem(_pem)), n=200)
+        starkinfra.signer = starkinfra.Signer()
+        python = _benchmark(_parse, n=200)
+        starkinfra.signer = starkinfra.CoincurveSigner()
+        coincurve = _benchmark(_parse, n=2000)
+        print("key decoded on every call: {:.0f} verifications/s".format(decoded))
+        print("cached key and point tables: {:.0f} parses/s".format(python))
+        print("coincurve: {:.0f} parses/s".format(coincurve))
+        self.assertLess(python, coincurve)
+        self.assertLess(1 / python, 2)
+
+
+if __name__ == '__main__':
+    main()
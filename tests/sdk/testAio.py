@@ -0,0 +1,52 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import gather, run
+from unittest import TestCase, main
+from tests.utils.user import exampleProject
+
+
+starkinfra.user = exampleProject
+
+
+async def _query(limit):
+    return [request async for request in starkinfra.aio.pixrequest.query(limit=limit)]
+
+
+async def _get(ids):
+    return await gather(*[starkinfra.aio.pixrequest.get(id) for id in ids])
+
+
+class TestAioQuery(TestCase):
+
+    def test_success(self):
+        pix_requests = run(_query(limit=10))
+        self.assertEqual(len(pix_requests), 10)
+
+
+class TestAioPage(TestCase):
+
+    def test_success(self):
+        pix_requests, cursor = run(starkinfra.aio.pixrequest.page(limit=2))
+        self.assertEqual(len(pix_requests), 2)
+        self.assertIsNotNone(cursor)
+
+
+class TestAioGet(TestCase):
+
+    def test_success(self):
+        ids = [pix_request.id for pix_request in run(_query(limit=5))]
+        pix_requests = run(_get(ids))
+        self.assertEqual([pix_request.id for pix_request in pix_requests], ids)
+
+    def test_success_many(self):
+        ids = [pix_request.id for pix_request in run(_query(limit=5))]
+        pix_requests = run(starkinfra.aio.pixrequest.get_many(ids))
+        self.assertEqual([pix_request.id for pix_request in pix_requests.values()], ids)
+
+    def test_success_next(self):
+        balance = run(starkinfra.aio.pixbalance.get())
+        self.assertIsNotNone(balance.id)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+import starkinfra
+from time import sleep
+from unittest import TestCase, main
+from starkcore.error import UnknownError
+from starkinfra.error import CircuitOpenError
+from starkinfra.utils.breaker import scope
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project
+
+
+_json = {"request": {"id": "1"}, "key": {"id": "+5511989898989"}}
+
+
+class TestCircuitBreakerPolicy(TestCase):
+
+    def test_success_error_rate(self):
+        breaker = starkinfra.CircuitBreaker(error_rate=0.5, min_requests=4)
+        for status in [200, 503, 200]:
+            breaker.enter("pix-key")
+            breaker.record("pix-key", status=status, seconds=0.1)
+        self.assertEqual(breaker.state("pix-key"), "closed")
+        breaker.record("pix-key", status=0, seconds=0.1)
+        self.assertEqual(breaker.state("pix-key"), "open")
+        with self.assertRaises(CircuitOpenError) as context:
+            breaker.enter("pix-key")
+        self.assertEqual(context.exception.state, "open")
+        self.assertGreater(context.exception.retry_in, 29)
+        self.assertEqual((breaker.opens, breaker.rejections), (1, 1))
+
+    def test_success_client_errors(self):
+        breaker = starkinfra.CircuitBreaker(min_requests=2)
+        for status in [400, 404, 429, 400]:
+            breaker.record("pix-key", status=status, seconds=0.1)
+        self.assertEqual(breaker.state("pix-key"), "closed")
+
+    def test_success_latency(self):
+        breaker = starkinfra.CircuitBreaker(latency=1, min_requests=2)
+        breaker.record("pix-key", status=200, seconds=2)
+        breaker.record("pix-key", status=200, seconds=0.1)
+        self.assertEqual(breaker.state("pix-key"), "open")
+        self.assertEqual(breaker.state("pix-request"), "closed")
+
+    def test_success_probe(self):
+        breaker = starkinfra.CircuitBreaker(min_requests=1, cooldown=0.1)
+        breaker.record("pix-key", status=503, seconds=0.1)
+        sleep(0.1)
+        self.assertEqual(breaker.states(), {"pix-key": "half-open"})
+        breaker.enter("pix-key")
+        with self.assertRaises(CircuitOpenError):
+            breaker.enter("pix-key")
+        breaker.record("pix-key", status=200, seconds=0.1)
+        self.assertEqual(breaker.state("pix-key"), "closed")
+        breaker.enter("pix-key")
+
+    def test_fail_probe(self):
+        breaker = starkinfra.CircuitBreaker(min_requests=1, cooldown=0.1)
+        breaker.record("pix-key", status=503, seconds=0.1)
+        sleep(0.1)
+        breaker.enter("pix-key")
+        breaker.record("pix-key", status=503, seconds=0.1)
+        self.assertEqual(breaker.state("pix-key"), "open")
+        self.assertEqual(breaker.opens, 2)
+
+    def test_success_scope(self):
+        self.assertEqual(
+            scope(url="https://sandbox.api.starkinfra.com/v2", path="pix-key/+5511989898989"),
+            "sandbox.api.starkinfra.com pix-key",
+        )
+
+
+class TestCircuitBreakerRequest(TestCase):
+
+    def test_success_fail_fast(self):
+        breaker = starkinfra.CircuitBreaker(min_requests=3)
+        pool = FakePool([503] * 3, json=_json)
+        client = starkinfra.Client(
+            user=project,
+            pool=pool,
+            retries=starkinfra.Retry(attempts=1),
+            circuit_breaker=breaker,
+        )
+        for _ in range(3):
+            with self.assertRaises(UnknownError):
+                client.pixrequest.get("1")
+        with self.assertRaises(CircuitOpenError):
+            client.pixrequest.get("1")
+        self.assertEqual(len(pool.requests), 3)
+        self.assertEqual(breaker.states(), {"sandbox.api.starkinfra.com pix-request": "open"})
+
+        client.pixkey.get("+5511989898989", payer_id="012.345.678-90")
+        self.assertEqual(len(pool.requests), 4)
+
+    def test_success_retries_stop(self):
+        breaker = starkinfra.CircuitBreaker(min_requests=2)
+        pool = FakePool([503] * 5, json=_json)
+        client = starkinfra.Client(
+            user=project,
+            pool=pool,
+            retries=starkinfra.Retry(attempts=5, backoff=0),
+            circuit_breaker=breaker,
+        )
+        with self.assertRaises(CircuitOpenError):
+            client.pixrequest.get("1")
+        self.assertEqual(len(pool.requests), 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import starkinfra
+from unittest import TestCase, main
+from starkinfra.utils.bulk import chunks, merge, index
+
+
+class TestBulkChunks(TestCase):
+
+    def test_success(self):
+        self.assertEqual(list(chunks(range(250), size=100)), [list(range(100)), list(range(100, 200)), list(range(200, 250))])
+
+    def test_success_generator(self):
+        self.assertEqual([len(chunk) for chunk in chunks((i for i in range(201)), size=100)], [100, 100, 1])
+
+    def test_success_empty(self):
+        self.assertEqual(list(chunks([], size=100)), [])
+
+
+class TestBulkMerge(TestCase):
+
+    def test_success(self):
+        entities = merge([[1, 2], [3]], [(["a", "b"], None), (["c"], None)])
+        self.assertEqual(entities, ["a", "b", "c"])
+
+    def test_fail(self):
+        error = ValueError("rejected")
+        with self.assertRaises(starkinfra.error.BulkError) as context:
+            merge([[1, 2], [3], [4]], [(["a", "b"], None), (None, error), (["d"], None)])
+        self.assertEqual(context.exception.entities, ["a", "b", None, "d"])
+        self.assertEqual(len(context.exception.errors), 1)
+        self.assertEqual(context.exception.errors[0].offset, 2)
+        self.assertEqual(context.exception.errors[0].entities, [3])
+        self.assertIs(context.exception.errors[0].error, error)
+
+
+class TestBulkIndex(TestCase):
+
+    def test_success(self):
+        entities = index(["3", "1", "2"], [["3", "1"], ["2"]], [({"1": "a", "3": "c"}, None), ({}, None)])
+        self.assertEqual(list(entities.items()), [("3", "c"), ("1", "a"), ("2", None)])
+
+    def test_fail(self):
+        error = ValueError("rejected")
+        with self.assertRaises(starkinfra.error.BulkError) as context:
+            index(["1", "2", "3"], [["1", "2"], ["3"]], [(None, error), ({"3": "c"}, None)])
+        self.assertEqual(context.exception.entities, {"1": None, "2": None, "3": "c"})
+        self.assertEqual(context.exception.errors[0].offset, 0)
+        self.assertEqual(context.exception.errors[0].entities, ["1", "2"])
+
+
+if __name__ == '__main__':
+    main()
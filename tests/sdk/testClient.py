@@ -0,0 +1,88 @@
+import starkinfra
+from json import dumps
+from threading import Thread
+from unittest import TestCase, main
+from ellipticcurve import Ecdsa, PrivateKey
+from starkcore.error import InvalidSignatureError
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project, secondProject
+
+
+_json = {"webhooks": [], "cursor": None}
+
+
+class TestClientSettings(TestCase):
+
+    def test_success(self):
+        user = starkinfra.user
+        pool = FakePool(json=_json)
+        client = starkinfra.Client(user=project, language="pt-BR", timeout=7, pool=pool)
+        self.assertEqual(list(client.webhook.query()), [])
+
+        request = pool.requests[0]
+        self.assertEqual(request["headers"]["Access-Id"], "project/1111111111111111")
+        self.assertEqual(request["headers"]["Accept-Language"], "pt-BR")
+        self.assertEqual(request["timeout"], 7)
+        self.assertIs(starkinfra.user, user)
+
+    def test_success_user_override(self):
+        pool = FakePool(json=_json)
+        client = starkinfra.Client(user=project, pool=pool)
+        client.webhook.page(user=secondProject)
+        self.assertEqual(pool.requests[0]["headers"]["Access-Id"], "project/2222222222222222")
+
+    def test_success_signer(self):
+        messages = []
+
+        class RecordingSigner(starkinfra.Signer):
+            def sign(self, message, pem):
+                messages.append(message)
+                return starkinfra.Signer.sign(self, message, pem)
+
+        pool = FakePool(json=_json)
+        starkinfra.Client(user=project, pool=pool, signer=RecordingSigner()).webhook.page()
+        starkinfra.Client(user=project, pool=pool).webhook.page()
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(messages[0].startswith("project/1111111111111111:"))
+
+    def test_success_threads(self):
+        clients = [starkinfra.Client(user=user, pool=FakePool(json=_json)) for user in [project, secondProject] * 4]
+        threads = [Thread(target=lambda client=client: [client.webhook.page() for _ in range(10)]) for client in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for client in clients:
+            access_ids = set(request["headers"]["Access-Id"] for request in client.pool.requests)
+            self.assertEqual(access_ids, {"project/" + client.user.id})
+
+    def test_success_mirror(self):
+        client = starkinfra.Client(user=project)
+        self.assertEqual(client.pixrequest.create.__doc__, starkinfra.pixrequest.create.__doc__)
+        self.assertIs(client.pixrequest.Log, starkinfra.pixrequest.Log)
+        self.assertIs(client.pixrequest, client.pixrequest)
+        with self.assertRaises(AttributeError):
+            client.PixRequest
+
+
+class TestClientParse(TestCase):
+
+    def test_success(self):
+        private_key = PrivateKey()
+        content = dumps({"event": {"id": "1", "subscription": "unknown", "created": "2020-01-01T00:00:00.000000+00:00",
+                                   "isDelivered": False, "workspaceId": "1", "log": {}}})
+        signature = Ecdsa.sign(content, private_key).toBase64()
+
+        client = starkinfra.Client(user=project)
+        client.public_key_cache.get(lambda: private_key.publicKey().toPem())
+        event = client.event.parse(content=content, signature=signature)
+        self.assertEqual(event.id, "1")
+
+        other = starkinfra.Client(user=project)
+        other.public_key_cache.get(lambda: PrivateKey().publicKey().toPem())
+        with self.assertRaises(InvalidSignatureError):
+            other.event.parse(content=content, signature=signature)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+import starkinfra
+import starkinfra.aio
+from json import dumps, loads
+from gzip import compress, decompress
+from zlib import compress as deflate, decompress as inflate, compressobj, MAX_WBITS
+from asyncio import run
+from unittest import TestCase, main
+from httpx import MockTransport, Response as HttpxResponse
+from ellipticcurve import Ecdsa, PrivateKey, Signature
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import privateKey, project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+_json = {"requests": [], "cursor": None}
+
+
+class TestCompressionRequest(TestCase):
+
+    def test_success_gzip(self):
+        pool = FakePool(json=_json)
+        starkinfra.Client(user=project, pool=pool, compression="gzip").pixrequest.create(generateFakePixRequests(20))
+        request = pool.requests[0]
+        self.assertEqual(request["headers"]["Content-Encoding"], "gzip")
+        body = decompress(request["data"]).decode("utf-8")
+        self.assertEqual(len(loads(body)["requests"]), 20)
+        self.assertLess(len(request["data"]), len(body) / 2)
+
+        headers = request["headers"]
+        message = "{access_id}:{access_time}:{body}".format(
+            access_id=headers["Access-Id"],
+            access_time=headers["Access-Time"],
+            body=body,
+        )
+        signature = Signature.fromBase64(headers["Access-Signature"])
+        self.assertTrue(Ecdsa.verify(message, signature, PrivateKey.fromPem(privateKey).publicKey()))
+
+    def test_success_deflate(self):
+        pool = FakePool(json=_json)
+        starkinfra.Client(user=project, pool=pool, compression="deflate").pixrequest.create(generateFakePixRequests(20))
+        request = pool.requests[0]
+        self.assertEqual(request["headers"]["Content-Encoding"], "deflate")
+        self.assertEqual(len(loads(inflate(request["data"]))["requests"]), 20)
+
+    def test_success_small_body(self):
+        pool = FakePool(json=_json)
+        client = starkinfra.Client(user=project, pool=pool, compression="gzip")
+        list(client.pixrequest.query(limit=1))
+        request = pool.requests[0]
+        self.assertNotIn("Content-Encoding", request["headers"])
+        self.assertEqual(request["headers"]["Accept-Encoding"], "gzip, deflate")
+
+    def test_success_disabled(self):
+        pool = FakePool(json=_json)
+        starkinfra.Client(user=project, pool=pool).pixrequest.create(generateFakePixRequests(20))
+        self.assertNotIn("Content-Encoding", pool.requests[0]["headers"])
+        self.assertEqual(len(loads(pool.requests[0]["data"])["requests"]), 20)
+
+    def test_success_global(self):
+        pool = FakePool(json=_json)
+        starkinfra.pool, starkinfra.compression = pool, "gzip"
+        try:
+            starkinfra.pixrequest.create(generateFakePixRequests(20), user=project)
+            starkinfra.Client(user=project, pool=pool).pixrequest.create(generateFakePixRequests(20))
+        finally:
+            starkinfra.pool, starkinfra.compression = None, None
+        self.assertEqual(pool.requests[0]["headers"]["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Encoding", pool.requests[1]["headers"])
+
+    def test_fail_invalid(self):
+        with self.assertRaises(ValueError):
+            starkinfra.Client(user=project, pool=FakePool(json=_json), compression="brotli").pixrequest.create(generateFakePixRequests(20))
+
+
+class _EncodedPool(starkinfra.Pool):
+
+    def __init__(self, content, encoding):
+        starkinfra.Pool.__init__(self)
+        self.content = content
+        self.encoding = encoding
+
+    def _transport(self):
+        headers = {"Content-Encoding": self.encoding} if self.encoding else {}
+        return MockTransport(lambda request: HttpxResponse(200, content=self.content, headers=headers))
+
+
+class TestCompressionResponse(TestCase):
+
+    def tearDown(self):
+        starkinfra.pool = None
+
+    def test_success_async(self):
+        content = dumps({"requests": [{"id": "1"}], "cursor": "next"}).encode("utf-8")
+        raw = compressobj(wbits=-MAX_WBITS)
+        for body, encoding in [
+            (compress(content), "gzip"),
+            (deflate(content), "deflate"),
+            (raw.compress(content) + raw.flush(), "Deflate"),
+            (content, None),
+        ]:
+            starkinfra.pool = _EncodedPool(content=body, encoding=encoding)
+            requests, cursor = run(starkinfra.aio.pixrequest.page(user=project, raw=True))
+            self.assertEqual(requests, [{"id": "1"}])
+            self.assertEqual(cursor, "next")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import starkinfra
+from array import array
+from unittest import TestCase, main
+from starkcore.utils.api import api_json
+from starkinfra.utils.decode import columns, decode
+from starkinfra.pixrequest.log.__log import _resource as _log_resource
+from starkinfra.creditnote.__creditnote import _resource as _credit_note_resource
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project
+
+_requests = [
+    {
+        "id": "1",
+        "amount": 1000,
+        "fee": 0.5,
+        "status": "success",
+        "created": "2024-01-02T03:04:05.123456+00:00",
+        "tags": ["a"],
+    },
+    {
+        "id": "2",
+        "amount": 2500,
+        "fee": 1,
+        "status": "failed",
+        "created": "2024-01-02T03:04:05+00:00",
+        "tags": [],
+    },
+]
+
+
+def _pool(pages):
+    return FakePool([
+        {"json": {"request": entities} if cursor is False else {"requests": entities, "cursor": cursor}}
+        for entities, cursor in pages
+    ])
+
+
+class TestDecodeColumns(TestCase):
+
+    def test_success(self):
+        batch = columns(_requests)
+        self.assertEqual(list(batch), ["id", "amount", "fee", "status", "created", "tags"])
+        self.assertEqual(batch["id"], ["1", "2"])
+        self.assertIsInstance(batch["amount"], array)
+        self.assertEqual(list(batch["amount"]), [1000, 2500])
+        self.assertEqual(batch["fee"].typecode, "d")
+        self.assertEqual(list(batch["fee"]), [0.5, 1.0])
+        self.assertEqual(batch["status"], ["success", "failed"])
+        self.assertEqual(list(batch["created"]), [1704164645123456, 1704164645000000])
+        self.assertEqual(batch["tags"], [["a"], []])
+
+    def test_success_missing_field(self):
+        batch = columns([{"amount": 1}, {"amount": 2, "endToEndId": "E123"}])
+        self.assertEqual(list(batch["amount"]), [1, 2])
+        self.assertEqual(batch["end_to_end_id"], [None, "E123"])
+
+    def test_success_offset(self):
+        batch = columns([{"created": "2024-01-02T00:04:05-03:00"}, {"created": "2024-01-02T03:04:05.5Z"}])
+        self.assertEqual(list(batch["created"]), [1704164645000000, 1704164645500000])
+
+    def test_success_not_datetime(self):
+        batch = columns([{"created": "2024-01-02T03:04:05+00:00"}, {"created": "yesterday"}])
+        self.assertEqual(batch["created"], ["2024-01-02T03:04:05+00:00", "yesterday"])
+
+    def test_success_empty(self):
+        self.assertEqual(columns([]), {})
+
+    def test_fail_invalid_output(self):
+        with self.assertRaises(ValueError):
+            decode(resource=None, entities=[], output="rows")
+
+
+class TestDecodeQuery(TestCase):
+
+    def test_success_query(self):
+        pool = _pool([(_requests, "next"), (_requests[:1], None)])
+        client = starkinfra.Client(user=project, pool=pool)
+        batches = list(client.pixrequest.query(output="columns"))
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(list(batches[0]["amount"]), [1000, 2500])
+        self.assertEqual(list(batches[1]["amount"]), [1000])
+
+    def test_success_page(self):
+        pool = _pool([(_requests, "next")])
+        client = starkinfra.Client(user=project, pool=pool)
+        batch, cursor = client.pixrequest.page(output="columns")
+        self.assertEqual(cursor, "next")
+        self.assertEqual(batch["status"], ["success", "failed"])
+
+    def test_success_objects(self):
+        pool = _pool([(_requests, None)])
+        client = starkinfra.Client(user=project, pool=pool)
+        requests = list(client.pixrequest.query())
+        self.assertEqual([request.amount for request in requests], [1000, 2500])
+
+
+class TestDecodeRaw(TestCase):
+
+    def test_success_query(self):
+        pool = _pool([(_requests, "next"), (_requests[:1], None)])
+        client = starkinfra.Client(user=project, pool=pool)
+        requests = list(client.pixrequest.query(raw=True))
+        self.assertEqual(requests, _requests + _requests[:1])
+
+    def test_success_page(self):
+        pool = _pool([(_requests, None)])
+        client = starkinfra.Client(user=project, pool=pool)
+        requests, cursor = client.pixrequest.page(raw=True)
+        self.assertEqual(requests, _requests)
+        self.assertIsNone(cursor)
+
+    def test_success_get(self):
+        pool = _pool([(_requests[0], False)])
+        client = starkinfra.Client(user=project, pool=pool)
+        self.assertEqual(client.pixrequest.get("1", raw=True), _requests[0])
+
+    def test_fail_with_output(self):
+        with self.assertRaises(ValueError):
+            decode(resource=None, entities=[], output="columns", raw=True)
+
+
+class TestDecodeFields(TestCase):
+
+    def test_success_query(self):
+        pool = _pool([(_requests, None)])
+        client = starkinfra.Client(user=project, pool=pool)
+        requests = list(client.pixrequest.query(fields=["id", "amount"]))
+        self.assertEqual([(request.id, request.amount) for request in requests], [("1", 1000), ("2", 2500)])
+        self.assertIsNone(requests[0].status)
+        self.assertIsNone(requests[0].created)
+
+    def test_success_raw(self):
+        pool = _pool([(_requests, None)])
+        client = starkinfra.Client(user=project, pool=pool)
+        requests, _ = client.pixrequest.page(raw=True, fields=["id", "status"])
+        self.assertEqual(requests, [{"id": "1", "status": "success"}, {"id": "2", "status": "failed"}])
+
+    def test_success_columns(self):
+        pool = _pool([(_requests, None)])
+        client = starkinfra.Client(user=project, pool=pool)
+        batch, _ = client.pixrequest.page(output="columns", fields=["amount"])
+        self.assertEqual(list(batch), ["amount"])
+
+    def test_success_get(self):
+        pool = _pool([(dict(_requests[0], endToEndId="E123"), False)])
+        client = starkinfra.Client(user=project, pool=pool)
+        request = client.pixrequest.get("1", fields=["end_to_end_id"])
+        self.assertEqual(request.end_to_end_id, "E123")
+        self.assertIsNone(request.amount)
+
+    def test_success_log(self):
+        logs = decode(resource=_log_resource, entities=[{"id": "3", "type": "created", "request": _requests[0]}],
+                      fields=["id", "type"])
+        self.assertEqual((logs[0].id, logs[0].type), ("3", "created"))
+        self.assertIsNone(logs[0].request)
+        self.assertIsNone(logs[0].created)
+        self.assertIn("created", str(logs[0]))
+        self.assertEqual(api_json(logs[0]), {"id": "3", "type": "created"})
+
+    def test_success_credit_note(self):
+        notes = decode(resource=_credit_note_resource, entities=[{"id": "4", "status": "success", "amount": 100,
+                                                                  "paymentType": "transfer"}],
+                       fields=["id", "status"])
+        self.assertEqual((notes[0].id, notes[0].status), ("4", "success"))
+        self.assertIsNone(notes[0].payment)
+        self.assertIsNone(notes[0].invoices)
+        self.assertIsNone(notes[0].amount)
+
+
+if __name__ == "__main__":
+    main()
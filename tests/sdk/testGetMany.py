@@ -0,0 +1,68 @@
+import starkinfra
+from unittest import TestCase, main
+from starkinfra.pixrequest.__pixrequest import _resource
+from starkinfra.pixrequest.log.__log import _resource as _logResource
+from tests.utils.server import ApiServer
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+class TestGetMany(TestCase):
+
+    def setUp(self):
+        self.server = ApiServer()
+        self.ids = [request["id"] for request in self.server.seed(_resource, generateFakePixRequests(250))]
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_success(self):
+        client = starkinfra.Client(user=project, pool=self.server.pool(), concurrency=4)
+        ids = ["1"] + self.ids[::-1] + self.ids[:10]
+        requests = client.pixrequest.get_many(ids)
+        self.assertEqual(list(requests), ["1"] + self.ids[::-1])
+        self.assertIsNone(requests["1"])
+        self.assertEqual([request.id for request in list(requests.values())[1:]], self.ids[::-1])
+        self.assertEqual(self.server.requests["GET pix-request"], 3)
+
+    def test_success_raw(self):
+        client = starkinfra.Client(user=project, pool=self.server.pool())
+        requests = client.pixrequest.get_many(self.ids[:2], raw=True)
+        self.assertEqual([request["id"] for request in requests.values()], self.ids[:2])
+
+    def test_success_empty(self):
+        client = starkinfra.Client(user=project, pool=self.server.pool())
+        self.assertEqual(client.pixrequest.get_many([]), {})
+        self.assertEqual(self.server.requests, {})
+
+    def test_success_fallback(self):
+        logs = self.server.seed(_logResource, [{"type": "created"} for _ in range(5)])
+        client = starkinfra.Client(user=project, pool=self.server.pool(), concurrency=2)
+        ids = [log["id"] for log in logs] + ["1"]
+        found = client.pixrequest.log.get_many(ids)
+        self.assertEqual(list(found), ids)
+        self.assertEqual([log.id for log in list(found.values())[:5]], ids[:5])
+        self.assertIsNone(found["1"])
+        self.assertEqual(self.server.requests["GET pix-request/log"], 6)
+
+    def test_fail(self):
+        handle = self.server.handle
+        def fail(method, target, headers, body):
+            if self.ids[0] in target:
+                return 500, {}, b"error"
+            return handle(method, target, headers, body)
+        self.server.handle = fail
+        client = starkinfra.Client(user=project, pool=self.server.pool(), retries=starkinfra.Retry(attempts=1))
+        with self.assertRaises(starkinfra.error.BulkError) as context:
+            client.pixrequest.get_many(self.ids)
+        entities = context.exception.entities
+        self.assertEqual(list(entities), self.ids)
+        self.assertIsNone(entities[self.ids[0]])
+        self.assertEqual(entities[self.ids[100]].id, self.ids[100])
+        self.assertEqual(len(context.exception.errors), 1)
+        self.assertEqual(context.exception.errors[0].offset, 0)
+        self.assertEqual(len(context.exception.errors[0].entities), 100)
+
+
+if __name__ == "__main__":
+    main()
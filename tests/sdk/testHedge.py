@@ -0,0 +1,158 @@
+import starkinfra
+from time import time
+from asyncio import run, sleep as async_sleep
+from threading import Thread
+from unittest import TestCase, main
+from starkcore.utils.request import Response
+from starkinfra.aio.utils.request import _hedged
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+_json = {
+    "key": {"id": "+5511989898989"},
+    "card": {"id": "1"},
+    "previews": [{"id": "00020126580014br.gov.bcb.pix"}],
+    "request": {"id": "1"},
+    "requests": [{"id": "1"}],
+}
+
+
+def _client(script, **hedge):
+    hedge = starkinfra.Hedge(**dict({"delay": 0.05, "budget": 1}, **hedge))
+    return starkinfra.Client(user=project, pool=_pool(script), hedge=hedge), hedge
+
+
+def _pool(script):
+    return FakePool([{"delay": delay, "status": status} for delay, status in script], json=_json)
+
+
+class TestHedgePolicy(TestCase):
+
+    def test_success_percentile(self):
+        hedge = starkinfra.Hedge(percentile=90, delay=2)
+        self.assertEqual(hedge.wait("GET pix-key"), 2)
+        for i in range(1, 101):
+            hedge.observe("GET pix-key", seconds=i / 100.0)
+        self.assertAlmostEqual(hedge.wait("GET pix-key"), 0.9)
+        self.assertEqual(hedge.wait("GET issuing-card"), 2)
+
+    def test_success_samples(self):
+        hedge = starkinfra.Hedge(percentile=50, samples=20)
+        for i in range(100):
+            hedge.observe("GET pix-key", seconds=i)
+        self.assertEqual(hedge.wait("GET pix-key"), 89)
+
+    def test_success_budget(self):
+        hedge = starkinfra.Hedge(budget=0.1)
+        allowed = []
+        for _ in range(100):
+            hedge.wait("GET pix-key")
+            allowed.append(hedge.allow())
+        self.assertEqual(sum(allowed), 10)
+        self.assertEqual((hedge.requests, hedge.hedges), (100, 10))
+        self.assertFalse(allowed[0])
+
+
+class TestHedgeRequest(TestCase):
+
+    def test_success_slow_read(self):
+        client, hedge = _client([(1, 200)])
+        start = time()
+        client.pixkey.get("+5511989898989", payer_id="012.345.678-90")
+        self.assertLess(time() - start, 0.5)
+        self.assertEqual(client.pool.methods, ["GET", "GET"])
+        self.assertEqual((hedge.requests, hedge.hedges, hedge.wins), (1, 1, 1))
+
+    def test_success_fast_read(self):
+        client, hedge = _client([])
+        client.issuingcard.get("1")
+        self.assertEqual(client.pool.methods, ["GET"])
+        self.assertEqual((hedge.requests, hedge.hedges), (1, 0))
+
+    def test_success_failed_original(self):
+        client, hedge = _client([(0.1, 503), (0, 200)])
+        client.pixrequest.get("1")
+        self.assertEqual(client.pool.methods, ["GET", "GET"])
+        self.assertEqual(hedge.wins, 1)
+
+    def test_success_brcode_preview(self):
+        client, hedge = _client([(1, 200)])
+        start = time()
+        client.brcodepreview.create([starkinfra.BrcodePreview(id="00020126580014br.gov.bcb.pix", payer_id="012.345.678-90")])
+        self.assertLess(time() - start, 0.5)
+        self.assertEqual(client.pool.methods, ["POST", "POST"])
+
+    def test_success_concurrent_reads(self):
+        client, hedge = _client([(0.2, 200)] * 64, delay=1, workers=2)
+        threads = [Thread(target=client.issuingcard.get, args=("1",)) for _ in range(64)]
+        start = time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(time() - start, 0.6)
+        self.assertEqual(len(client.pool.requests), 64)
+        self.assertEqual(hedge.hedges, 0)
+
+    def test_success_rate_limited(self):
+        limiter = starkinfra.RateLimiter(rate=1, burst=1, min_rate=1)
+        client, hedge = _client([], delay=0.1)
+        client.rate_limiter = limiter
+        client.issuingcard.get("1")
+        start = time()
+        client.issuingcard.get("1")
+        self.assertGreater(time() - start, 0.3)
+        self.assertEqual(client.pool.methods, ["GET", "GET"])
+        self.assertEqual(hedge.hedges, 0)
+
+    def test_success_budget_exhausted(self):
+        client, hedge = _client([(0.2, 200)], budget=0)
+        client.pixrequest.get("1")
+        self.assertEqual(client.pool.methods, ["GET"])
+        self.assertEqual(hedge.hedges, 0)
+
+    def test_success_write_not_hedged(self):
+        client, hedge = _client([(0.2, 200)])
+        client.pixrequest.create(generateFakePixRequests(1))
+        self.assertEqual(client.pool.methods, ["POST"])
+        self.assertEqual(hedge.requests, 0)
+
+    def test_success_disabled(self):
+        client = starkinfra.Client(user=project, pool=_pool([(0.2, 200)]))
+        client.pixrequest.get("1")
+        self.assertEqual(client.pool.methods, ["GET"])
+
+
+class TestHedgeAsync(TestCase):
+
+    def test_success(self):
+        delays = [1, 0]
+
+        async def send(sent=None):
+            sent()
+            await async_sleep(delays.pop(0))
+            return Response(status=200, content=b"{}", headers={})
+
+        hedge = starkinfra.Hedge(delay=0.05, budget=1)
+        start = time()
+        response = run(_hedged(send=send, hedge=hedge, endpoint="GET pix-key"))
+        self.assertEqual(response.status, 200)
+        self.assertLess(time() - start, 0.5)
+        self.assertEqual((hedge.hedges, hedge.wins), (1, 1))
+
+    def test_success_held(self):
+        async def send(sent=None):
+            await async_sleep(0.2)
+            sent()
+            return Response(status=200, content=b"{}", headers={})
+
+        hedge = starkinfra.Hedge(delay=0.05, budget=1)
+        response = run(_hedged(send=send, hedge=hedge, endpoint="GET pix-key"))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(hedge.hedges, 0)
+
+
+if __name__ == "__main__":
+    main()
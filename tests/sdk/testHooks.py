@@ -0,0 +1,171 @@
+import starkinfra
+from json import dumps
+from unittest import TestCase, main
+from starkcore.error import InputErrors
+from starkinfra.utils.hooks import RequestRecord
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+_json = {
+    "request": {"id": "1"},
+    "requests": [{"id": str(i)} for i in range(3)],
+    "cursor": None,
+}
+
+
+def _client(statuses=(), **settings):
+    records = []
+    client = starkinfra.Client(
+        user=project,
+        pool=FakePool(statuses, json=_json),
+        retries=starkinfra.Retry(backoff=0),
+        hooks=[records.append],
+        **settings
+    )
+    return client, records
+
+
+class _Span:
+
+    def __init__(self, spans, name, start_time, attributes):
+        self.spans = spans
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.end_time = None
+
+    def end(self, end_time):
+        self.end_time = end_time
+        self.spans.append(self)
+
+
+class _Tracer:
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, start_time, attributes):
+        return _Span(self.spans, name=name, start_time=start_time, attributes=attributes)
+
+
+def _record(method, path, network):
+    record = RequestRecord(method=method, path=path, attempt=1, hooks=None)
+    record.status = 200
+    record.network = network
+    return record
+
+
+class TestHooksRequest(TestCase):
+
+    def test_success_get(self):
+        client, records = _client()
+        client.pixrequest.get("1")
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertEqual(
+            (record.resource, record.method, record.path, record.status),
+            ("pix-request", "GET", "pix-request/1", 200),
+        )
+        self.assertEqual(record.bytes_sent, 0)
+        self.assertGreater(record.bytes_received, 0)
+        self.assertGreater(record.signing, 0)
+        self.assertGreater(record.decode, 0)
+        self.assertAlmostEqual(record.total, record.queue_wait + record.signing + record.network + record.decode)
+
+    def test_success_create(self):
+        client, records = _client()
+        client.pixrequest.create(generateFakePixRequests(3))
+        self.assertEqual(records[0].method, "POST")
+        self.assertEqual(records[0].bytes_sent, len(client.pool.requests[0]["data"]))
+
+    def test_success_retries(self):
+        client, records = _client([503, 200])
+        client.pixrequest.get("1")
+        self.assertEqual([(record.attempt, record.status) for record in records], [(1, 503), (2, 200)])
+
+    def test_success_error(self):
+        client, records = _client([400])
+        with self.assertRaises(InputErrors):
+            client.pixrequest.get("1")
+        self.assertEqual([record.status for record in records], [400])
+
+    def test_success_query(self):
+        client, records = _client()
+        self.assertEqual(len(list(client.pixrequest.query())), 3)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].path, "pix-request")
+
+    def test_success_stream(self):
+        client, records = _client(stream=True)
+        requests = client.pixrequest.query()
+        self.assertEqual(len(list(requests)), 3)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].bytes_received, len(dumps(_json)))
+
+    def test_success_raw(self):
+        client, records = _client()
+        client.request.get(path="pix-request/1")
+        self.assertEqual(records[0].path, "pix-request/1")
+
+    def test_success_module_hooks(self):
+        histogram = starkinfra.Histogram()
+        starkinfra.hooks.append(histogram)
+        starkinfra.pool = FakePool(json=_json)
+        try:
+            starkinfra.pixrequest.get("1", user=project)
+        finally:
+            starkinfra.hooks.remove(histogram)
+            starkinfra.pool = None
+        self.assertEqual(histogram.summary()["GET pix-request"]["count"], 1)
+
+    def test_success_disabled(self):
+        pool = FakePool(json=_json)
+        response = starkinfra.Client(user=project, pool=pool).request.get(path="pix-request/1")
+        self.assertFalse(hasattr(response, "record"))
+
+
+class TestHistogram(TestCase):
+
+    def test_success(self):
+        histogram = starkinfra.Histogram(precision=0.01)
+        for i in range(1, 1001):
+            histogram(_record("GET", "pix-key/" + str(i), network=i / 1000.0))
+        histogram(_record("POST", "pix-request", network=0.5))
+        self.assertAlmostEqual(histogram.percentile("GET pix-key", 50), 0.5, delta=0.5 * 0.01)
+        self.assertAlmostEqual(histogram.percentile("GET pix-key", 99), 0.99, delta=0.99 * 0.01)
+        self.assertAlmostEqual(histogram.percentile("GET pix-key", 100), 1, delta=0.01)
+        self.assertIsNone(histogram.percentile("GET issuing-card", 50))
+
+        summary = histogram.summary(percentiles=[50, 99.9])
+        self.assertEqual(sorted(summary), ["GET pix-key", "POST pix-request"])
+        self.assertEqual(summary["GET pix-key"]["count"], 1000)
+        self.assertAlmostEqual(summary["GET pix-key"]["mean"], 0.5005)
+        self.assertIn("p99.9", summary["GET pix-key"])
+
+        histogram.reset()
+        self.assertEqual(histogram.summary(), {})
+
+    def test_success_field(self):
+        histogram = starkinfra.Histogram(field="decode")
+        histogram(_record("GET", "pix-key", network=1))
+        self.assertEqual(histogram.summary()["GET pix-key"]["max"], 0)
+
+
+class TestSpans(TestCase):
+
+    def test_success(self):
+        tracer = _Tracer()
+        client, records = _client()
+        client.hooks.append(starkinfra.Spans(tracer=tracer))
+        client.pixrequest.get("1")
+        span = tracer.spans[0]
+        self.assertEqual(span.name, "starkinfra GET pix-request")
+        self.assertEqual(span.attributes["http.status_code"], 200)
+        self.assertEqual(span.attributes["starkinfra.resource"], "pix-request")
+        self.assertGreater(span.end_time, span.start_time)
+
+
+if __name__ == "__main__":
+    main()
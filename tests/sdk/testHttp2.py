@@ -0,0 +1,110 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import gather, run
+from threading import Thread
+from unittest import TestCase, main
+from starkcore.error import InputErrors
+from starkinfra.pixrequest.__pixrequest import _resource
+from tests.utils.server import ApiServer, LocalHttp2Pool
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+class TestHttp2Pool(TestCase):
+
+    def setUp(self):
+        self.server = ApiServer(http2=True)
+        self.pools = []
+
+    def tearDown(self):
+        for pool in self.pools:
+            pool.close()
+        self.server.close()
+
+    def pool(self, **kwargs):
+        pool = LocalHttp2Pool(port=self.server.port, **kwargs)
+        self.pools.append(pool)
+        return pool
+
+    def test_success(self):
+        client = starkinfra.Client(user=project, pool=self.pool())
+        requests = client.pixrequest.create(generateFakePixRequests(250))
+        self.assertEqual(client.pixrequest.get(requests[0].id).amount, requests[0].amount)
+        self.assertEqual(len(list(client.pixrequest.query())), 250)
+        with self.assertRaises(InputErrors):
+            client.pixrequest.get("1")
+        client.close()
+        self.assertEqual(self.server.connections, 1)
+
+    def test_success_stream(self):
+        self.server.seed(_resource, generateFakePixRequests(250))
+        client = starkinfra.Client(user=project, pool=self.pool(), stream=True)
+        self.assertEqual(len(list(client.pixrequest.query())), 250)
+        self.assertEqual(len(list(client.pixrequest.query())), 250)
+        client.close()
+        self.assertEqual(self.server.connections, 1)
+
+    def test_success_streams(self):
+        self.server.latency = 0.05
+        request = self.server.seed(_resource, generateFakePixRequests(1))[0]
+        client = starkinfra.Client(user=project, pool=self.pool(streams=4))
+        workers = [Thread(target=client.pixrequest.get, args=(request["id"],)) for _ in range(16)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        client.close()
+        self.assertEqual(self.server.requests["GET pix-request"], 16)
+        self.assertEqual(self.server.max_in_flight, 4)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_success_idle(self):
+        request = self.server.seed(_resource, generateFakePixRequests(1))[0]
+        pool = self.pool()
+        pool.idle_timeout = 0
+        client = starkinfra.Client(user=project, pool=pool)
+        client.pixrequest.get(request["id"])
+        client.pixrequest.get(request["id"])
+        client.close()
+        self.assertEqual(self.server.connections, 2)
+
+    def test_success_async(self):
+        request = self.server.seed(_resource, generateFakePixRequests(1))[0]
+        starkinfra.pool = self.pool()
+        try:
+            requests = run(_gather(*[starkinfra.aio.pixrequest.get(request["id"], user=project) for _ in range(16)]))
+        finally:
+            starkinfra.pool = None
+        self.assertEqual(set(request.id for request in requests), {request["id"]})
+        self.assertEqual(self.server.requests["GET pix-request"], 16)
+        self.assertEqual(self.server.connections, 1)
+
+
+class TestHttp2PoolFallback(TestCase):
+
+    def setUp(self):
+        self.server = ApiServer(latency=0.05)
+        self.pool = LocalHttp2Pool(port=self.server.port, connections=2, streams=8, http1=True)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.close()
+
+    def test_success(self):
+        request = self.server.seed(_resource, generateFakePixRequests(1))[0]
+        client = starkinfra.Client(user=project, pool=self.pool)
+        workers = [Thread(target=client.pixrequest.get, args=(request["id"],)) for _ in range(16)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(self.server.requests["GET pix-request"], 16)
+        self.assertEqual(self.server.max_in_flight, 16)
+
+
+async def _gather(*calls):
+    return await gather(*calls)
+
+
+if __name__ == "__main__":
+    main()
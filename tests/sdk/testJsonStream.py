@@ -0,0 +1,106 @@
+import starkinfra
+from json import dumps
+from unittest import TestCase, main
+from starkinfra.utils.jsonstream import items
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project
+
+_requests = [
+    {"id": str(i), "amount": 1000 + i, "description": u"João ☃", "tags": ["a", {"b": [1.5, None, True]}]}
+    for i in range(5)
+]
+
+
+def _split(content, size):
+    content = content.encode("utf-8")
+    return [content[i:i + size] for i in range(0, len(content), size)]
+
+
+def _decode(chunks, key):
+    generator = items(chunks, key=key)
+    decoded = []
+    while True:
+        try:
+            decoded.append(next(generator))
+        except StopIteration as stop:
+            return decoded, stop.value
+
+
+def _pool(pages):
+    return FakePool([{"json": {"cursor": cursor, "requests": entities}} for entities, cursor in pages], chunk_size=7)
+
+
+class TestJsonStreamItems(TestCase):
+
+    def test_success(self):
+        content = dumps({"cursor": "abc", "requests": _requests})
+        for size in [1, 2, 3, 7, 64, len(content)]:
+            decoded, others = _decode(_split(content, size), "requests")
+            self.assertEqual(decoded, _requests)
+            self.assertEqual(others, {"cursor": "abc"})
+
+    def test_success_key_last(self):
+        content = dumps({"requests": _requests, "cursor": None, "count": 12345})
+        decoded, others = _decode(_split(content, 1), "requests")
+        self.assertEqual(decoded, _requests)
+        self.assertEqual(others, {"cursor": None, "count": 12345})
+
+    def test_success_empty(self):
+        self.assertEqual(_decode([b'{"requests": [], "cursor": null}'], "requests"), ([], {"cursor": None}))
+        self.assertEqual(_decode([b' { } '], "requests"), ([], {}))
+
+    def test_success_numbers(self):
+        decoded, _ = _decode(_split('{"requests": [12345678, 1.25e3, -7]}', 1), "requests")
+        self.assertEqual(decoded, [12345678, 1250.0, -7])
+
+    def test_success_incremental(self):
+        chunks = _split(dumps({"requests": _requests, "cursor": None}), 16)
+        consumed = []
+
+        def source():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(items(source(), key="requests"))
+        self.assertEqual(first, _requests[0])
+        self.assertLess(len(consumed), len(chunks) / 2)
+
+    def test_fail_malformed(self):
+        with self.assertRaises(ValueError):
+            _decode([b'{"requests": [{"id": 1}, {"id": }]}'], "requests")
+        with self.assertRaises(ValueError):
+            _decode([b'{"requests": [{"id": 1}'], "requests")
+        with self.assertRaises(ValueError):
+            _decode([b'["requests"]'], "requests")
+
+
+class TestJsonStreamQuery(TestCase):
+
+    def test_success(self):
+        pool = _pool([(_requests[:3], "next"), (_requests[3:], None)])
+        client = starkinfra.Client(user=project, pool=pool, stream=True)
+        requests = list(client.pixrequest.query())
+        self.assertEqual([request.id for request in requests], ["0", "1", "2", "3", "4"])
+        self.assertEqual(requests[0].description, _requests[0]["description"])
+        self.assertIn("cursor=next", pool.requests[1]["url"])
+        self.assertEqual(len(pool.closed), 2)
+
+    def test_success_raw_fields(self):
+        pool = _pool([(_requests, None)])
+        client = starkinfra.Client(user=project, pool=pool, stream=True)
+        requests = list(client.pixrequest.query(raw=True, fields=["id"]))
+        self.assertEqual(requests, [{"id": str(i)} for i in range(5)])
+
+    def test_success_early_exit(self):
+        pool = _pool([(_requests, "next")])
+        client = starkinfra.Client(user=project, pool=pool, stream=True)
+        requests = client.pixrequest.query()
+        self.assertEqual(next(requests).id, "0")
+        requests.close()
+        self.assertEqual(len(pool.closed), 1)
+        self.assertEqual(len(pool.requests), 1)
+
+
+if __name__ == "__main__":
+    main()
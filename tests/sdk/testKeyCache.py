@@ -0,0 +1,186 @@
+import os
+import starkinfra
+from time import sleep, time
+from threading import Thread
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase, main
+from starkinfra.utils import keycache
+
+
+class _Fetcher:
+
+    def __init__(self, pems, delay=0):
+        self.pems = list(pems)
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        sleep(self.delay)
+        pem = self.pems.pop(0)
+        if isinstance(pem, Exception):
+            raise pem
+        return pem
+
+
+def _wait(condition, timeout=2):
+    deadline = time() + timeout
+    while not condition() and time() < deadline:
+        sleep(0.01)
+
+
+class TestPublicKeyCacheGet(TestCase):
+
+    def test_success(self):
+        cache = starkinfra.PublicKeyCache()
+        fetch = _Fetcher(["key-1"])
+        self.assertEqual(cache.get(fetch), "key-1")
+        self.assertEqual(cache.get(fetch), "key-1")
+        self.assertEqual(fetch.calls, 1)
+
+    def test_success_stale_while_revalidate(self):
+        cache = starkinfra.PublicKeyCache(ttl=1, margin=1)
+        fetch = _Fetcher(["key-1", "key-2"], delay=0.2)
+        self.assertEqual(cache.get(fetch), "key-1")
+        cache._attempted = 0
+
+        start = time()
+        self.assertEqual(cache.get(fetch), "key-1")
+        self.assertLess(time() - start, 0.1)
+
+        _wait(lambda: fetch.calls == 2 and not cache._refreshing)
+        self.assertEqual(cache.get(lambda: None), "key-2")
+
+    def test_success_refresh_failure(self):
+        cache = starkinfra.PublicKeyCache(ttl=1, margin=1)
+        fetch = _Fetcher(["key-1", ValueError("offline")])
+        cache.get(fetch)
+        cache._attempted = 0
+        cache.get(fetch)
+        _wait(lambda: not cache._refreshing)
+        self.assertEqual(fetch.calls, 2)
+        self.assertEqual(cache.get(fetch), "key-1")
+        self.assertEqual(fetch.calls, 2)
+
+
+class TestPublicKeyCacheRevalidate(TestCase):
+
+    def test_success_cooldown(self):
+        cache = starkinfra.PublicKeyCache()
+        fetch = _Fetcher(["key-1", "key-2"])
+        cache.get(fetch)
+        cache.revalidate(fetch)
+        self.assertEqual(fetch.calls, 1)
+
+        cache._attempted = time() - keycache._cooldown
+        cache.revalidate(fetch)
+        _wait(lambda: fetch.calls == 2 and not cache._refreshing)
+        self.assertEqual(cache.get(fetch), "key-2")
+
+
+class TestPublicKeyCacheRefetch(TestCase):
+
+    def test_success(self):
+        cache = starkinfra.PublicKeyCache()
+        fetch = _Fetcher(["key-1", "key-2"])
+        cache.get(fetch)
+        cache._attempted = 0
+        self.assertEqual(cache.refetch(fetch, pem="key-1"), "key-2")
+        self.assertEqual(cache.get(fetch), "key-2")
+        self.assertEqual(fetch.calls, 2)
+
+    def test_success_single_flight(self):
+        cache = starkinfra.PublicKeyCache()
+        cache.get(lambda: "key-1")
+        cache._attempted = 0
+        fetch = _Fetcher(["key-2"], delay=0.2)
+        results = []
+        threads = [Thread(target=lambda: results.append(cache.refetch(fetch, pem="key-1"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ["key-2"] * 8)
+        self.assertEqual(fetch.calls, 1)
+
+    def test_success_rate_limited(self):
+        cache = starkinfra.PublicKeyCache()
+        fetch = _Fetcher(["key-1", "key-1"])
+        cache.get(fetch)
+        self.assertIsNone(cache.refetch(fetch, pem="key-1"))
+        self.assertEqual(fetch.calls, 1)
+
+        cache._attempted = time() - keycache._refetch_interval
+        self.assertIsNone(cache.refetch(fetch, pem="key-1"))
+        self.assertEqual(fetch.calls, 2)
+
+    def test_success_stale_file(self):
+        directory = mkdtemp()
+        try:
+            path = os.path.join(directory, "public-key.pem")
+            starkinfra.PublicKeyCache(path=path).get(_Fetcher(["key-1"]))
+            cache = starkinfra.PublicKeyCache(path=path)
+            fetch = _Fetcher(["key-2"])
+            self.assertEqual(cache.get(fetch), "key-1")
+            self.assertEqual(cache.refetch(fetch, pem="key-1"), "key-2")
+            self.assertEqual(starkinfra.PublicKeyCache(path=path).get(fetch), "key-2")
+        finally:
+            rmtree(directory)
+
+    def test_fail(self):
+        cache = starkinfra.PublicKeyCache()
+        cache.get(lambda: "key-1")
+        cache._attempted = 0
+        fetch = _Fetcher([ValueError("offline")])
+        with self.assertRaises(ValueError):
+            cache.refetch(fetch, pem="key-1")
+        self.assertIsNone(cache.refetch(fetch, pem="key-1"))
+        self.assertEqual(cache.get(fetch), "key-1")
+
+
+class TestPublicKeyCacheDefault(TestCase):
+
+    def test_success(self):
+        self.assertIs(keycache.default("sandbox"), keycache.default("sandbox"))
+        self.assertIsNot(keycache.default("sandbox"), keycache.default("production"))
+
+
+class TestPublicKeyCachePersistence(TestCase):
+
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = os.path.join(self.directory, "public-key.pem")
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def test_success(self):
+        starkinfra.PublicKeyCache(path=self.path).get(_Fetcher(["key-1"]))
+
+        fetch = _Fetcher([])
+        self.assertEqual(starkinfra.PublicKeyCache(path=self.path).get(fetch), "key-1")
+        self.assertEqual(fetch.calls, 0)
+
+    def test_success_missing_file(self):
+        fetch = _Fetcher(["key-1"])
+        self.assertEqual(starkinfra.PublicKeyCache(path=self.path).get(fetch), "key-1")
+        self.assertEqual(fetch.calls, 1)
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_success_concurrent_saves(self):
+        workers = [
+            Thread(target=keycache._save, args=(self.path, "key-{index}".format(index=index)))
+            for index in range(16)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(os.listdir(self.directory), ["public-key.pem"])
+        with open(self.path) as file:
+            self.assertIn(file.read(), ["key-{index}".format(index=index) for index in range(16)])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import starkinfra
+from copy import deepcopy
+from datetime import datetime
+from pickle import dumps, loads
+from unittest import TestCase, main
+from starkcore.utils.api import api_json, from_api_json
+from starkinfra.utils.lazy import _Raw
+from starkinfra.event.__event import _resource as _event_resource
+from starkinfra.pixrequest.log.__log import Log, _resource as _log_resource
+
+
+_request = {
+    "id": "5656565656565656",
+    "amount": 1000,
+    "externalId": "my-external-id",
+    "endToEndId": "E20018183202201201450u34sDGd19lz",
+    "status": "success",
+    "created": "2022-01-20T14:50:00+00:00",
+    "updated": "2022-01-20T14:51:00+00:00",
+}
+_log = {
+    "id": "4545454545454545",
+    "type": "success",
+    "errors": [],
+    "created": "2022-01-20T14:51:00+00:00",
+    "request": _request,
+}
+_event = {
+    "id": "3434343434343434",
+    "subscription": "pix-request.in",
+    "isDelivered": False,
+    "workspaceId": "2323232323232323",
+    "created": "2022-01-20T14:51:00+00:00",
+    "log": _log,
+}
+
+
+class TestLazyDatetime(TestCase):
+
+    def test_success(self):
+        request = from_api_json({"class": starkinfra.PixRequest, "name": "PixRequest"}, _request)
+        self.assertIsInstance(request._created, _Raw)
+        self.assertEqual(request.created, datetime(2022, 1, 20, 14, 50))
+        self.assertIs(request.created, request._created)
+        self.assertIsInstance(request._updated, _Raw)
+
+    def test_success_assignment(self):
+        request = from_api_json({"class": starkinfra.PixRequest, "name": "PixRequest"}, _request)
+        request.updated = "2023-05-06T07:08:09+00:00"
+        self.assertEqual(request.updated, datetime(2023, 5, 6, 7, 8, 9))
+
+    def test_success_copy(self):
+        request = from_api_json({"class": starkinfra.PixRequest, "name": "PixRequest"}, _request)
+        for copied in [deepcopy(request), loads(dumps(request))]:
+            self.assertEqual(copied.created, datetime(2022, 1, 20, 14, 50))
+
+    def test_fail_invalid(self):
+        request = from_api_json({"class": starkinfra.PixRequest, "name": "PixRequest"}, dict(_request, created="now"))
+        with self.assertRaises(RuntimeError):
+            request.created
+
+
+class TestLazySubResource(TestCase):
+
+    def test_success_rules(self):
+        ledger = starkinfra.Ledger(external_id="my-ledger", rules=[{"key": "minimumBalance", "value": 0}])
+        self.assertIsInstance(ledger._rules, _Raw)
+        self.assertIsInstance(ledger.rules[0], starkinfra.ledger.Rule)
+        self.assertIs(ledger.rules, ledger.rules)
+
+    def test_success_log(self):
+        log = from_api_json(_log_resource, _log)
+        self.assertIsInstance(log._request, _Raw)
+        self.assertIsInstance(log.request, starkinfra.PixRequest)
+        self.assertEqual(log.request.amount, 1000)
+
+    def test_success_none(self):
+        log = from_api_json(_log_resource, {"id": "1"})
+        self.assertIsNone(log.request)
+        self.assertIsNone(log.created)
+
+    def test_success_event(self):
+        event = from_api_json(_event_resource, _event)
+        self.assertIsInstance(event._log, dict)
+        self.assertIsInstance(event.log, Log)
+        self.assertIs(event.log, event.log)
+        self.assertEqual(event.log.request.end_to_end_id, _request["endToEndId"])
+
+    def test_success_api_json(self):
+        log = from_api_json(_log_resource, _log)
+        self.assertEqual(api_json(log)["request"]["amount"], 1000)
+
+
+if __name__ == "__main__":
+    main()
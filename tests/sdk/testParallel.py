@@ -0,0 +1,34 @@
+import starkinfra
+from datetime import datetime, timedelta
+from unittest import TestCase, main
+from urllib.parse import urlparse, parse_qs
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import fakePixRequestJson
+
+
+class TestParallelQuery(TestCase):
+
+    def test_success_datetime(self):
+        pool = FakePool(json={"invoices": [{"id": "1"}]})
+        client = starkinfra.Client(user=project, pool=pool)
+        after = datetime.now() - timedelta(days=8, hours=6)
+        invoices = list(client.issuingbillinginvoice.query(after=after, parallel=4, raw=True))
+        self.assertEqual(len(invoices), 4)
+        queries = [parse_qs(urlparse(request["url"]).query) for request in pool.requests]
+        afters = sorted(query["after"][0] for query in queries)
+        befores = sorted(query["before"][0] for query in queries if "before" in query)
+        self.assertEqual(len(befores), 3)
+        self.assertEqual(afters[1:], befores)
+
+    def test_success_limit(self):
+        pool = FakePool(json={"requests": [fakePixRequestJson] * 100, "cursor": "next"})
+        client = starkinfra.Client(user=project, pool=pool)
+        after = datetime.now().date() - timedelta(days=30)
+        requests = list(client.pixrequest.query(after=after, limit=300, parallel=4))
+        self.assertEqual(len(requests), 300)
+        self.assertLessEqual(len(pool.requests), 3 + 4)
+
+
+if __name__ == '__main__':
+    main()
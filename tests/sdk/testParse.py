@@ -0,0 +1,103 @@
+import starkinfra
+from time import sleep, time
+from json import dumps, loads
+from unittest import TestCase, main
+from ellipticcurve import Ecdsa, PrivateKey
+from starkcore.error import InvalidSignatureError
+from starkinfra.utils.parse import verify
+from tests.utils.server import ApiServer
+from tests.utils.fakeUser import project
+
+
+_private_key = PrivateKey()
+_content = '{"acquirerId": "236090", "amount": 100, "cardId": "5671893688385536", "cardTags": [], "endToEndId": "2fa7ef9f-b889-4bae-ac02-16749c04a3b6", "holderId": "5917814565109760", "holderTags": [], "isPartialAllowed": false, "issuerAmount": 100, "issuerCurrencyCode": "BRL", "merchantAmount": 100, "merchantCategoryCode": "bookStores", "merchantCountryCode": "BRA", "merchantCurrencyCode": "BRL", "merchantFee": 0, "merchantId": "204933612653639", "merchantName": "COMPANY 123", "methodCode": "token", "purpose": "purchase", "score": null, "tax": 0, "walletId": ""}'
+_signature = Ecdsa.sign(_content, _private_key).toBase64()
+
+
+class _HangingSession:
+
+    def __init__(self, requests):
+        self.requests = requests
+
+    def request(self, method, url, data, headers, timeout):
+        self.requests.append(url)
+        sleep(timeout)
+        raise IOError("timed out")
+
+
+class _HangingPool:
+
+    def __init__(self):
+        self.requests = []
+
+    def session(self, user):
+        return _HangingSession(self.requests)
+
+    def release(self, user):
+        pass
+
+
+class TestParseVerify(TestCase):
+
+    def setUp(self):
+        starkinfra.public_key_cache = starkinfra.PublicKeyCache()
+        starkinfra.public_key_cache.get(lambda: _private_key.publicKey().toPem())
+
+    def tearDown(self):
+        starkinfra.public_key_cache = None
+
+    def test_success(self):
+        for signer in [starkinfra.Signer(), starkinfra.CoincurveSigner()]:
+            starkinfra.signer = signer
+            try:
+                self.assertEqual(verify(content=_content, signature=_signature), _content)
+            finally:
+                starkinfra.signer = None
+
+    def test_success_normalized(self):
+        content = dumps(loads(_content), sort_keys=False, indent=4)
+        signature = Ecdsa.sign(dumps(loads(_content), sort_keys=True), _private_key).toBase64()
+        self.assertEqual(verify(content=content, signature=signature), content)
+
+    def test_success_issuing_purchase(self):
+        start = time()
+        purchase = starkinfra.issuingpurchase.parse(content=_content, signature=_signature)
+        self.assertLess(time() - start, 2)
+        self.assertEqual(purchase.card_id, "5671893688385536")
+
+    def test_success_rotated_key(self):
+        server = ApiServer()
+        try:
+            cache = starkinfra.PublicKeyCache()
+            cache.get(lambda: _private_key.publicKey().toPem())
+            cache._attempted = 0
+            content = dumps({"rotated": True})
+            signature = server.sign(content)
+            self.assertEqual(verify(content=content, signature=signature, user=project, pool=server.pool(),
+                                    public_key_cache=cache), content)
+            self.assertEqual(verify(content=content, signature=signature, user=project, pool=server.pool(),
+                                    public_key_cache=cache), content)
+            self.assertEqual(server.requests["GET public-key"], 1)
+        finally:
+            server.close()
+
+    def test_fail_public_key_timeout(self):
+        pool = _HangingPool()
+        client = starkinfra.Client(user=project, pool=pool, public_key_cache=starkinfra.PublicKeyCache())
+        start = time()
+        with self.assertRaises(Exception):
+            client.issuingpurchase.parse(content=_content, signature=_signature)
+        self.assertLess(time() - start, 1.5)
+        self.assertEqual(len(pool.requests), 1)
+
+    def test_fail_mismatch(self):
+        with self.assertRaises(InvalidSignatureError):
+            verify(content=_content.replace("COMPANY 123", "COMPANY 321"), signature=_signature)
+
+    def test_fail_malformed(self):
+        with self.assertRaises(InvalidSignatureError):
+            verify(content=_content, signature="not a signature")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+from datetime import date, datetime, timedelta
+from unittest import TestCase, main
+from starkinfra.utils.partition import windows
+
+
+class TestPartitionWindows(TestCase):
+
+    def test_success(self):
+        result = windows(after=date(2020, 3, 1), before=date(2020, 3, 31), count=4)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[0][1], date(2020, 3, 31))
+        self.assertEqual(result[-1][0], date(2020, 3, 1))
+        for (after, _), (_, before) in zip(result, result[1:]):
+            self.assertEqual(after - timedelta(days=1), before)
+
+    def test_success_short_range(self):
+        result = windows(after=date(2020, 3, 1), before=date(2020, 3, 2), count=4)
+        self.assertEqual(result, [(date(2020, 3, 2), date(2020, 3, 2)), (date(2020, 3, 1), date(2020, 3, 1))])
+
+    def test_success_default_before(self):
+        result = windows(after=date.today() - timedelta(days=9), before=None, count=2)
+        self.assertEqual(result[0][1], date.today())
+
+    def test_success_datetime(self):
+        after, before = datetime(2020, 3, 1, 12), datetime(2020, 3, 31, 18, 30)
+        result = windows(after=after, before=before, count=4)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[0][1], before)
+        self.assertEqual(result[-1][0], after)
+        for (after, _), (_, before) in zip(result, result[1:]):
+            self.assertEqual(after, before)
+
+    def test_success_datetime_default_before(self):
+        after = datetime.now() - timedelta(days=9)
+        result = windows(after=after, before=None, count=2)
+        self.assertEqual(len(result), 2)
+        self.assertIsNone(result[0][1])
+        self.assertEqual(result[-1][0], after)
+        self.assertEqual(result[0][0], result[1][1])
+
+    def test_success_datetime_date_before(self):
+        result = windows(after=datetime(2020, 3, 1, 12), before=date(2020, 3, 31), count=2)
+        self.assertEqual(result[0][1], datetime(2020, 4, 1))
+
+
+if __name__ == '__main__':
+    main()
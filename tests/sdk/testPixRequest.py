@@ -37,6 +37,19 @@ class TestPixRequestQuery(TestCase):
         )
         self.assertEqual(len(list(pix_requests)), 0)
 
+    def test_success_parallel(self):
+        after = date.today() - timedelta(days=30)
+        windows = []
+        expected = [request.id for request in starkinfra.pixrequest.query(limit=300, after=after)]
+        pix_requests = starkinfra.pixrequest.query(
+            limit=300,
+            after=after,
+            parallel=4,
+            progress=lambda after, before, count, finished: windows.append((after, before)),
+        )
+        self.assertEqual([request.id for request in pix_requests], expected)
+        self.assertTrue(len(set(windows)) > 0)
+
 
 class TestPixRequestPage(TestCase):
 
@@ -0,0 +1,115 @@
+import starkinfra
+import starkinfra.aio
+from time import sleep
+from asyncio import gather, get_event_loop, run
+from unittest import TestCase, main
+from starkcore.error import InputErrors
+from starkinfra.utils.pool import _key
+from starkinfra.aio.utils.request import _clients
+from starkinfra.pixrequest.__pixrequest import _resource
+from tests.utils.server import ApiServer
+from tests.utils.fakePool import FakePool, FakeSession
+from tests.utils.fakeUser import project, secondProject
+from tests.utils.fakePixRequest import fakePixRequestJson, generateFakePixRequests
+
+
+class TestPoolSession(TestCase):
+
+    def test_success_reuse(self):
+        pool = starkinfra.Pool()
+        self.assertIs(pool.session(project), pool.session(project))
+        pool.close()
+
+    def test_success_per_user(self):
+        pool = starkinfra.Pool()
+        self.assertIsNot(pool.session(project), pool.session(secondProject))
+        pool.close()
+
+    def test_success_idle_eviction(self):
+        pool = starkinfra.Pool(idle_timeout=0.1)
+        session = pool.session(project)
+        pool.release(project)
+        sleep(0.2)
+        self.assertIsNot(session, pool.session(project))
+        pool.close()
+
+    def test_success_in_use(self):
+        pool = starkinfra.Pool(idle_timeout=0.1)
+        session = pool.session(project)
+        sleep(0.2)
+        pool.session(secondProject)
+        self.assertIs(session, pool.session(project))
+        pool.release(project)
+        pool.release(project)
+        pool.session(secondProject)
+        self.assertIs(session, pool.session(project))
+        pool.close()
+
+    def test_success_stream(self):
+        pool = _ScriptedPool(FakePool(json={"requests": [fakePixRequestJson] * 2, "request": fakePixRequestJson}))
+        client = starkinfra.Client(user=project, pool=pool, stream=True)
+        requests = client.pixrequest.query()
+        next(requests)
+        self.assertEqual(_in_use(pool, project), 1)
+        self.assertEqual(len(list(requests)), 1)
+        self.assertEqual(_in_use(pool, project), 0)
+        client.pixrequest.get("1")
+        self.assertEqual(_in_use(pool, project), 0)
+
+
+class _ScriptedPool(starkinfra.Pool):
+
+    def __init__(self, fake):
+        starkinfra.Pool.__init__(self)
+        self.fake = fake
+
+    def _open(self):
+        return FakeSession(self.fake)
+
+
+def _in_use(pool, user):
+    return pool._sessions[_key(user)][2]
+
+
+class TestPoolAsync(TestCase):
+
+    def setUp(self):
+        self.server = ApiServer()
+        starkinfra.pool = self.server.pool(size=4)
+
+    def tearDown(self):
+        starkinfra.pool = None
+        self.server.close()
+
+    def test_success(self):
+        async def calls():
+            created = await starkinfra.aio.pixrequest.create(generateFakePixRequests(250), user=project)
+            fetched = await gather(*[
+                starkinfra.aio.pixrequest.get(request.id, user=project) for request in created[:20]
+            ])
+            queried = [request async for request in starkinfra.aio.pixrequest.query(user=project)]
+            with self.assertRaises(InputErrors):
+                await starkinfra.aio.pixrequest.get("1", user=project)
+            return created, fetched, queried
+
+        created, fetched, queried = run(calls())
+        self.assertEqual([request.id for request in fetched], [request.id for request in created[:20]])
+        self.assertEqual(len(queried), 250)
+        self.assertEqual(self.server.requests["GET pix-request"], 24)
+        self.assertLessEqual(self.server.connections, 4)
+
+    def test_success_close(self):
+        request = self.server.seed(_resource, generateFakePixRequests(1))[0]
+        clients = []
+
+        async def call():
+            await starkinfra.aio.pixrequest.get(request["id"], user=project)
+            clients.extend(_clients[get_event_loop()][0].values())
+
+        run(call())
+        self.assertEqual(len(clients), 1)
+        self.assertTrue(clients[0].is_closed)
+
+
+if __name__ == '__main__':
+    main()
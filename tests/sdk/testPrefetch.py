@@ -0,0 +1,53 @@
+from time import sleep
+from unittest import TestCase, main
+from starkinfra.utils.prefetch import prefetch
+
+
+class TestPrefetch(TestCase):
+
+    def test_success(self):
+        self.assertEqual(list(prefetch(iter(range(10)), size=2)), list(range(10)))
+
+    def test_success_bounded(self):
+        produced = []
+
+        def pages():
+            for i in range(10):
+                produced.append(i)
+                yield i
+
+        stream = prefetch(pages(), size=2)
+        self.assertEqual(next(stream), 0)
+        sleep(0.3)
+        self.assertLessEqual(len(produced), 4)
+        stream.close()
+
+    def test_success_close(self):
+        produced = []
+
+        def pages():
+            while True:
+                produced.append(len(produced))
+                yield produced[-1]
+
+        stream = prefetch(pages(), size=1)
+        next(stream)
+        stream.close()
+        sleep(0.3)
+        count = len(produced)
+        sleep(0.3)
+        self.assertEqual(len(produced), count)
+
+    def test_fail(self):
+        def pages():
+            yield 1
+            raise ValueError("page error")
+
+        stream = prefetch(pages(), size=2)
+        self.assertEqual(next(stream), 1)
+        with self.assertRaises(ValueError):
+            next(stream)
+
+
+if __name__ == '__main__':
+    main()
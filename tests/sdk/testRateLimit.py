@@ -0,0 +1,99 @@
+import starkinfra
+from time import time
+from threading import Thread
+from email.utils import formatdate
+from unittest import TestCase, main
+from starkinfra.utils.ratelimit import key, retry_after
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project, secondProject
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+_json = {"request": {"id": "1"}, "requests": [{"id": "1"}]}
+
+
+class TestRateLimiterPolicy(TestCase):
+
+    def test_success_burst(self):
+        limiter = starkinfra.RateLimiter(rate=10)
+        delays = [limiter.acquire("pix-key") for _ in range(12)]
+        self.assertEqual(delays[:10], [0] * 10)
+        self.assertAlmostEqual(delays[10], 0.1, places=2)
+        self.assertAlmostEqual(delays[11], 0.2, places=2)
+
+    def test_success_throttle(self):
+        limiter = starkinfra.RateLimiter(rate=10, min_rate=4)
+        limiter.update("pix-key", status=429)
+        self.assertEqual(limiter._buckets["pix-key"].rate, 5)
+        limiter.update("pix-key", status=429)
+        self.assertEqual(limiter._buckets["pix-key"].rate, 4)
+        self.assertEqual(limiter.throttles, 2)
+        self.assertAlmostEqual(limiter.acquire("pix-key"), 0.25, places=2)
+
+    def test_success_retry_after(self):
+        limiter = starkinfra.RateLimiter(rate=10)
+        limiter.update("pix-key", status=429, retry_after=2)
+        self.assertGreaterEqual(limiter.acquire("pix-key"), 2)
+        self.assertEqual(limiter.acquire("pix-request"), 0)
+
+    def test_success_increase(self):
+        limiter = starkinfra.RateLimiter(rate=10, max_rate=12, increase=5)
+        for _ in range(20):
+            limiter.update("pix-key", status=200)
+        self.assertEqual(limiter._buckets["pix-key"].rate, 12)
+
+    def test_success_key(self):
+        self.assertEqual(key(project, "pix-key/+5511989898989"), key(project, "pix-key"))
+        self.assertNotEqual(key(project, "pix-key"), key(secondProject, "pix-key"))
+        self.assertNotEqual(key(project, "pix-key"), key(project, "pix-request"))
+
+    def test_success_retry_after_header(self):
+        self.assertEqual(retry_after({"Retry-After": "2"}), 2)
+        self.assertAlmostEqual(retry_after({"Retry-After": formatdate(time() + 30, usegmt=True)}), 30, delta=1.5)
+        self.assertIsNone(retry_after({"Retry-After": "soon"}))
+        self.assertIsNone(retry_after({}))
+
+
+class TestRateLimiterRequest(TestCase):
+
+    def test_success_throttled_create(self):
+        limiter = starkinfra.RateLimiter(rate=100)
+        pool = FakePool([{"status": 429, "headers": {"Retry-After": "0.2"}}], json=_json)
+        client = starkinfra.Client(user=project, pool=pool, rate_limiter=limiter)
+        requests = generateFakePixRequests(1)
+        requests[0].external_id = None
+        client.pixrequest.create(requests)
+        first, second = [request["time"] for request in pool.requests]
+        self.assertEqual(pool.methods, ["POST", "POST"])
+        self.assertGreaterEqual(second - first, 0.2)
+        self.assertEqual(limiter.throttles, 1)
+
+    def test_success_shared_budget(self):
+        limiter = starkinfra.RateLimiter(rate=100, burst=1, max_rate=100)
+        pool = FakePool(json=_json)
+        client = starkinfra.Client(user=project, pool=pool, rate_limiter=limiter)
+
+        def work():
+            for _ in range(5):
+                client.pixrequest.get("1")
+
+        workers = [Thread(target=work) for _ in range(4)]
+        start = time()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(len(pool.requests), 20)
+        self.assertGreaterEqual(time() - start, 0.18)
+
+    def test_success_disabled(self):
+        pool = FakePool(json=_json)
+        client = starkinfra.Client(user=project, pool=pool)
+        start = time()
+        for _ in range(20):
+            client.pixrequest.get("1")
+        self.assertLess(time() - start, 0.5)
+
+
+if __name__ == "__main__":
+    main()
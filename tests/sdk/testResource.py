@@ -0,0 +1,36 @@
+import starkinfra
+from copy import deepcopy
+from pickle import dumps, loads
+from unittest import TestCase, main
+from starkcore.utils.api import api_json, from_api_json
+from tests.utils.fakePixRequest import fakePixRequestJson
+
+
+_resource = {"class": starkinfra.PixRequest, "name": "PixRequest"}
+
+
+class TestResourceSlots(TestCase):
+
+    def test_success(self):
+        request = from_api_json(_resource, fakePixRequestJson)
+        self.assertEqual(request.amount, 1000)
+        self.assertEqual(request.created.minute, 50)
+        self.assertEqual(vars(request), {})
+
+    def test_success_api_json(self):
+        request = from_api_json(_resource, fakePixRequestJson)
+        self.assertEqual(api_json(request), fakePixRequestJson)
+
+    def test_success_copy(self):
+        request = from_api_json(_resource, fakePixRequestJson)
+        for copied in [deepcopy(request), loads(dumps(request))]:
+            self.assertEqual(api_json(copied), fakePixRequestJson)
+
+    def test_success_extra_attribute(self):
+        request = from_api_json(_resource, fakePixRequestJson)
+        request.note = "kept in the instance dictionary"
+        self.assertEqual(request.note, "kept in the instance dictionary")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+import starkinfra
+from time import time
+from unittest import TestCase, main
+from starkcore.error import InternalServerError, InputErrors, UnknownError
+from tests.utils.fakePool import FakePool
+from tests.utils.fakeUser import project
+from tests.utils.fakePixRequest import generateFakePixRequests
+
+
+_json = {
+    "requests": [],
+    "request": {"id": "1"},
+    "webhook": {"id": "1", "url": "https://webhook.site", "subscriptions": []},
+    "cursor": None,
+}
+
+
+def _client(statuses, **retry):
+    retries = starkinfra.Retry(backoff=0, **retry)
+    return starkinfra.Client(user=project, pool=FakePool(statuses, json=_json), retries=retries), retries
+
+
+class TestRetryPolicy(TestCase):
+
+    def test_success_backoff(self):
+        retry = starkinfra.Retry(attempts=10, backoff=1, max_backoff=3)
+        delays = [retry.delay(attempt=attempt, start=time(), status=503, idempotent=True) for attempt in range(1, 10)]
+        self.assertTrue(all(0 <= delay <= 3 for delay in delays))
+        self.assertLessEqual(delays[0], 1)
+        self.assertEqual(retry.retries, 9)
+
+    def test_success_not_retried(self):
+        retry = starkinfra.Retry()
+        self.assertIsNone(retry.delay(attempt=1, start=time(), status=503, idempotent=False))
+        self.assertIsNone(retry.delay(attempt=1, start=time(), status=400, idempotent=True))
+        self.assertIsNone(retry.delay(attempt=1, start=time(), status=200, idempotent=True))
+        self.assertEqual((retry.retries, retry.exhaustions), (0, 0))
+
+    def test_success_throttled(self):
+        retry = starkinfra.Retry(attempts=3, backoff=0.1)
+        self.assertEqual(retry.delay(attempt=1, start=time(), status=429, idempotent=False, retry_after=3), 3)
+        self.assertLessEqual(retry.delay(attempt=2, start=time(), status=429, idempotent=False), 0.2)
+        self.assertIsNone(retry.delay(attempt=3, start=time(), status=429, idempotent=False))
+
+    def test_success_deadline(self):
+        retry = starkinfra.Retry(attempts=10, backoff=1, deadline=5)
+        self.assertIsNone(retry.delay(attempt=1, start=time() - 10, status=0, idempotent=True))
+        self.assertEqual(retry.exhaustions, 1)
+
+    def test_success_disabled(self):
+        retry = starkinfra.Retry(attempts=1)
+        self.assertIsNone(retry.delay(attempt=1, start=time(), status=500, idempotent=True))
+        self.assertEqual(retry.exhaustions, 0)
+
+
+class TestRetryRequest(TestCase):
+
+    def test_success_read(self):
+        client, retries = _client([503, None, 200])
+        client.pixrequest.get("1")
+        self.assertEqual(client.pool.methods, ["GET", "GET", "GET"])
+        self.assertEqual((retries.retries, retries.recoveries, retries.exhaustions), (2, 1, 0))
+
+    def test_success_query(self):
+        client, retries = _client([502])
+        self.assertEqual(list(client.pixrequest.query()), [])
+        self.assertEqual(retries.recoveries, 1)
+
+    def test_success_create_with_external_id(self):
+        client, retries = _client([500])
+        client.pixrequest.create(generateFakePixRequests(2))
+        self.assertEqual(client.pool.methods, ["POST", "POST"])
+        self.assertEqual(retries.recoveries, 1)
+
+    def test_fail_create_without_external_id(self):
+        client, retries = _client([500])
+        requests = generateFakePixRequests(2)
+        requests[1].external_id = None
+        with self.assertRaises(InternalServerError):
+            client.pixrequest.create(requests)
+        self.assertEqual(client.pool.methods, ["POST"])
+        self.assertEqual(retries.retries, 0)
+
+    def test_fail_update(self):
+        client, retries = _client([503])
+        with self.assertRaises(UnknownError):
+            client.webhook.delete("1")
+        self.assertEqual(client.pool.methods, ["DELETE"])
+
+    def test_fail_input_errors(self):
+        client, retries = _client([400])
+        with self.assertRaises(InputErrors):
+            client.pixrequest.get("1")
+        self.assertEqual(client.pool.methods, ["GET"])
+
+    def test_fail_exhausted(self):
+        client, retries = _client([503, 503, 503, 503], attempts=3)
+        with self.assertRaises(UnknownError):
+            client.pixrequest.get("1")
+        self.assertEqual(client.pool.methods, ["GET"] * 3)
+        self.assertEqual((retries.retries, retries.recoveries, retries.exhaustions), (2, 0, 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import starkinfra
+from unittest import TestCase, main
+from ellipticcurve import Ecdsa, PrivateKey, Signature
+from starkinfra.utils.request import _authentication_headers
+from starkinfra.utils.signer import Signer, CoincurveSigner, default
+
+
+_private_key, _ = starkinfra.key.create()
+_message = "project/1234:1700000000.0:{\"requests\": []}"
+
+
+class TestSignerSign(TestCase):
+
+    def _assert_valid(self, signer):
+        signature = signer.sign(message=_message, pem=_private_key)
+        public_key = PrivateKey.fromPem(_private_key).publicKey()
+        self.assertTrue(Ecdsa.verify(_message, Signature.fromBase64(signature), public_key))
+        self.assertFalse(Ecdsa.verify(_message + " ", Signature.fromBase64(signature), public_key))
+
+    def test_success(self):
+        self._assert_valid(Signer())
+
+    def test_success_coincurve(self):
+        self._assert_valid(CoincurveSigner())
+
+    def test_success_default(self):
+        self._assert_valid(default)
+
+    def test_success_custom(self):
+        signatures = []
+
+        class RecordingSigner(Signer):
+            def sign(self, message, pem):
+                signatures.append(message)
+                return Signer.sign(self, message, pem)
+
+        project = starkinfra.Project(environment="sandbox", id="1234", private_key=_private_key)
+        headers = _authentication_headers(user=project, body="{}", signer=RecordingSigner())
+        self.assertEqual(signatures, ["project/1234:{}:{{}}".format(headers["Access-Time"])])
+
+
+class TestSignerVerify(TestCase):
+
+    def test_success(self):
+        private_key = PrivateKey.fromPem(_private_key)
+        pem = private_key.publicKey().toPem()
+        signature = Ecdsa.sign(_message, private_key)
+        high_s = Signature(r=signature.r, s=private_key.curve.N - signature.s)
+        for signer in [Signer(), CoincurveSigner()]:
+            self.assertTrue(signer.verify(message=_message, signature=signature, pem=pem))
+            self.assertTrue(signer.verify(message=_message, signature=high_s, pem=pem))
+            self.assertFalse(signer.verify(message=_message + " ", signature=signature, pem=pem))
+            self.assertFalse(signer.verify(message=_message, signature=Signature(r=0, s=signature.s), pem=pem))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+from starkinfra import PixRequest, endtoendid
+
+
+fakePixRequestJson = {
+    "amount": 1000,
+    "externalId": "my-external-id",
+    "senderName": "Edward Stark",
+    "senderTaxId": "01234567890",
+    "senderBranchCode": "0001",
+    "senderAccountNumber": "876543-2",
+    "senderAccountType": "checking",
+    "receiverName": "Tony Stark",
+    "receiverTaxId": "20.018.183/0001-80",
+    "receiverBankCode": "20018183",
+    "receiverAccountNumber": "123456-7",
+    "receiverBranchCode": "0001",
+    "receiverAccountType": "checking",
+    "endToEndId": "E20018183202201201450u34sDGd19lz",
+    "tags": ["monthly"],
+    "id": "5656565656565656",
+    "fee": 0,
+    "status": "success",
+    "flow": "in",
+    "senderBankCode": "20018183",
+    "created": "2022-01-20T14:50:00+00:00",
+    "updated": "2022-01-20T14:51:00+00:00",
+}
+
+
+def generateFakePixRequests(n):
+    return [
+        PixRequest(
+            amount=100 + i,
+            external_id="my-external-id-{i}".format(i=i),
+            sender_account_number="76543-8",
+            sender_branch_code="2201",
+            sender_account_type="checking",
+            sender_name="checking",
+            sender_tax_id="594.739.480-42",
+            receiver_bank_code="341",
+            receiver_account_number="00000-0",
+            receiver_branch_code="0001",
+            receiver_account_type="checking",
+            receiver_name="Daenerys Targaryen Stormborn",
+            receiver_tax_id="012.345.678-90",
+            end_to_end_id=endtoendid.create("20018183"),
+        )
+        for i in range(n)
+    ]
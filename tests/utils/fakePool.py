@@ -0,0 +1,83 @@
+from json import dumps
+from time import sleep, time
+from threading import Lock
+
+
+class FakePool:
+    """Stand-in for starkinfra.Pool that answers every request with the next step of a script instead of
+    reaching the API, recording each request it receives. A step is either a status code, None to raise
+    a connection error, or a dict with any of status, delay, headers and json. Requests beyond the script
+    are answered with status 200 and the pool's json. Pass chunk_size to stream responses in chunks of
+    that many bytes, whatever the size requested by the SDK.
+    """
+
+    def __init__(self, script=(), json=None, chunk_size=None):
+        self.script = list(script)
+        self.json = json or {}
+        self.chunk_size = chunk_size
+        self.requests = []
+        self.closed = []
+        self.lock = Lock()
+
+    @property
+    def methods(self):
+        return [request["method"] for request in self.requests]
+
+    def session(self, user):
+        return FakeSession(self)
+
+    def release(self, user):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def request(self, method, url, data, headers, timeout, stream=False):
+        with self.pool.lock:
+            self.pool.requests.append({
+                "method": method,
+                "url": url,
+                "data": data,
+                "headers": headers,
+                "timeout": timeout,
+                "time": time(),
+            })
+            step = self.pool.script.pop(0) if self.pool.script else 200
+        if step is None:
+            raise ConnectionError("connection reset by peer")
+        if not isinstance(step, dict):
+            step = {"status": step}
+        sleep(step.get("delay", 0))
+        status = step.get("status", 200)
+        if "json" in step:
+            content = dumps(step["json"])
+        elif status == 200:
+            content = dumps(self.pool.json)
+        elif status == 400:
+            content = dumps({"errors": [{"code": "invalidJson", "message": "invalid"}]})
+        else:
+            content = "error"
+        return FakeResponse(status, content, headers=step.get("headers"), pool=self.pool)
+
+
+class FakeResponse:
+
+    def __init__(self, status, content, headers=None, pool=None):
+        self.status_code = status
+        self.content = content.encode()
+        self.headers = headers or {}
+        self.pool = pool
+
+    def iter_content(self, chunk_size):
+        chunk_size = self.pool.chunk_size or chunk_size
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        self.pool.closed.append(True)
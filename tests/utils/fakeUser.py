@@ -0,0 +1,8 @@
+import starkinfra
+
+
+privateKey, publicKey = starkinfra.key.create()
+
+project = starkinfra.Project(environment="sandbox", id="1111111111111111", private_key=privateKey)
+
+secondProject = starkinfra.Project(environment="sandbox", id="2222222222222222", private_key=privateKey)
@@ -0,0 +1,418 @@
+import sys
+import starkinfra
+from re import sub
+from time import sleep
+from json import dumps, loads
+from gzip import decompress
+from zlib import decompress as inflate
+from datetime import datetime
+from itertools import count
+from asyncio import all_tasks, current_task, ensure_future, new_event_loop, run_coroutine_threadsafe, set_event_loop, \
+    sleep as sleep_async, start_server
+from threading import Event, Lock, Thread
+from urllib.parse import urlsplit, parse_qs
+from requests import Session
+from requests.adapters import HTTPAdapter
+from ellipticcurve import PrivateKey
+from httpx import AsyncBaseTransport
+from h2.config import H2Configuration
+from h2.connection import H2Connection, ConnectionState
+from h2.exceptions import ProtocolError
+from h2.events import DataReceived, RequestReceived, StreamEnded, StreamReset, WindowUpdated
+from h2.settings import Settings, SettingCodes
+from starkcore.utils.api import api_json, endpoint, last_name, last_name_plural
+from starkinfra.utils.signer import default as _signer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+_maxLimit = 100
+
+
+class ApiServer:
+    """In-process stand-in for the Stark Infra API, serving the REST routes of every resource module
+    from memory with signed responses, so the SDK can be measured without network access.
+    Entities posted to a resource are stored with an id, status and dates, and may then be listed,
+    retrieved, updated and deleted. Pass latency to add a fixed delay to each response, and http2
+    to speak HTTP/2 without TLS, allowing up to the given number of concurrent streams per connection.
+    """
+
+    def __init__(self, latency=0, http2=False, streams=100):
+        self.latency = latency
+        self.private_key = PrivateKey().toPem()
+        self.public_key = PrivateKey.fromPem(self.private_key).publicKey().toPem()
+        self.routes = _routes()
+        self.store = {}
+        self.requests = {}
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._ids = count(5000000000000000)
+        self._lock = Lock()
+        self._server = _Http2Server(self, streams=streams) if http2 else _Http1Server(self)
+
+    @property
+    def port(self):
+        return self._server.port
+
+    def pool(self, size=10):
+        if isinstance(self._server, _Http2Server):
+            return LocalHttp2Pool(port=self.port, streams=size)
+        return LocalPool(port=self.port, size=size)
+
+    def sign(self, content):
+        return _signer.sign(message=content, pem=self.private_key)
+
+    def seed(self, resource, entities):
+        path = endpoint(resource)
+        return [self._create(path, entity) for entity in entities]
+
+    def close(self):
+        self._server.close()
+
+    def handle(self, method, target, headers, body):
+        url = urlsplit(target)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        body = _decode(body, encoding=headers.get("content-encoding"))
+        path = url.path.split("/", 2)[-1].strip("/")
+
+        if path == "public-key":
+            self._count(method, path)
+            return _json(200, {"publicKeys": [{"content": self.public_key}]}, sign=self.sign)
+
+        resource, rest = self._match(path)
+        self._count(method, resource)
+        singular, plural = self.routes.get(resource) or _names(resource)
+        with self._lock:
+            entities = dict(self.store.get(resource, {}))
+
+        if not rest and method == "GET":
+            return _json(200, _page(entities, plural, query), sign=self.sign)
+        if not rest and method in ("POST", "PUT"):
+            if isinstance(body.get(plural), list):
+                created = [self._create(resource, entity) for entity in body[plural]]
+                return _json(200, {plural: created, "message": "Entities successfully created"}, sign=self.sign)
+            return _json(200, {singular: self._create(resource, body)}, sign=self.sign)
+
+        entity = entities.get(rest[0])
+        if entity is None:
+            return _json(400, {"errors": [
+                {"code": "invalidId", "message": "{id} is not a valid id".format(id=rest[0])}
+            ]}, sign=self.sign)
+        if len(rest) > 1:
+            content = "{resource} {id} {content}".format(resource=resource, id=rest[0], content=rest[1])
+            return 200, {"content-type": "application/octet-stream"}, content.encode("utf-8")
+        if method == "PATCH":
+            entity.update(body)
+        if method == "DELETE":
+            entity["status"] = "canceled"
+        return _json(200, {singular: entity}, sign=self.sign)
+
+    def _match(self, path):
+        parts = path.split("/")
+        for size in range(len(parts), 0, -1):
+            resource = "/".join(parts[:size])
+            if resource in self.routes:
+                return resource, parts[size:]
+        return parts[0], parts[1:]
+
+    def _create(self, path, entity):
+        entity = dict(api_json(entity))
+        now = datetime.utcnow().isoformat() + "+00:00"
+        with self._lock:
+            entity["id"] = entity.get("id") or str(next(self._ids))
+            entity.setdefault("status", "created")
+            entity.setdefault("created", now)
+            entity["updated"] = now
+            self.store.setdefault(path, {})[entity["id"]] = entity
+        return entity
+
+    def _count(self, method, path):
+        key = "{method} {path}".format(method=method, path=path)
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def _connect(self):
+        with self._lock:
+            self.connections += 1
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+
+class _Http1Server(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, api):
+        ThreadingHTTPServer.__init__(self, ("127.0.0.1", 0), _Handler)
+        self.api = api
+        Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.api._connect()
+
+    def do_GET(self):
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PUT(self):
+        self._route("PUT")
+
+    def do_PATCH(self):
+        self._route("PATCH")
+
+    def do_DELETE(self):
+        self._route("DELETE")
+
+    def _route(self, method):
+        api = self.server.api
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        body = self.rfile.read(int(headers.get("content-length") or 0))
+        api._enter()
+        try:
+            if api.latency:
+                sleep(api.latency)
+            status, headers, content = api.handle(method, self.path, headers, body)
+        finally:
+            api._leave()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _Http2Server:
+
+    def __init__(self, api, streams):
+        self.api = api
+        self.streams = streams
+        self._loop = new_event_loop()
+        ready = Event()
+        Thread(target=self._run, args=(ready,), daemon=True).start()
+        ready.wait()
+
+    def close(self):
+        run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+
+    async def _shutdown(self):
+        self._server.close()
+        for task in all_tasks(self._loop):
+            if task is not current_task():
+                task.cancel()
+        self._loop.call_soon(self._loop.stop)
+
+    def _run(self, ready):
+        set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(start_server(self._serve, "127.0.0.1", 0))
+        self.port = self._server.sockets[0].getsockname()[1]
+        ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _serve(self, reader, writer):
+        try:
+            await self._exchange(reader, writer)
+        finally:
+            writer.close()
+
+    async def _exchange(self, reader, writer):
+        self.api._connect()
+        connection = H2Connection(config=H2Configuration(client_side=False, header_encoding="utf-8"))
+        connection.local_settings = Settings(client=False, initial_values={
+            SettingCodes.MAX_CONCURRENT_STREAMS: self.streams,
+        })
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+        requests = {}
+        pending = {}
+        while not connection.state_machine.state == ConnectionState.CLOSED:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in connection.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    requests[event.stream_id] = (dict(event.headers), bytearray())
+                elif isinstance(event, DataReceived):
+                    requests[event.stream_id][1].extend(event.data)
+                    connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, StreamEnded):
+                    headers, body = requests.pop(event.stream_id)
+                    ensure_future(self._respond(connection, writer, event.stream_id, headers, bytes(body), pending))
+                elif isinstance(event, StreamReset):
+                    pending.pop(event.stream_id, None)
+                elif isinstance(event, WindowUpdated):
+                    _flush(connection, pending)
+            writer.write(connection.data_to_send())
+
+    async def _respond(self, connection, writer, stream_id, headers, body, pending):
+        self.api._enter()
+        try:
+            if self.api.latency:
+                await sleep_async(self.api.latency)
+            status, response, content = self.api.handle(headers[":method"], headers[":path"], headers, body)
+        finally:
+            self.api._leave()
+        response = [(":status", str(status))] + list(response.items()) + [("content-length", str(len(content)))]
+        try:
+            connection.send_headers(stream_id, response)
+        except ProtocolError:
+            return
+        pending[stream_id] = content
+        _flush(connection, pending)
+        writer.write(connection.data_to_send())
+
+
+class _LocalSession(Session):
+
+    def __init__(self, port, size):
+        Session.__init__(self)
+        self.port = port
+        self.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=size))
+
+    def request(self, method, url, **kwargs):
+        url = sub(r"^https://[^/]+", "http://127.0.0.1:{port}".format(port=self.port), url)
+        return Session.request(self, method, url, **kwargs)
+
+
+class LocalPool(starkinfra.Pool):
+    """Pool whose keep-alive connections are opened to a local ApiServer instead of the Stark Infra API"""
+
+    def __init__(self, port, size=10, idle_timeout=60):
+        starkinfra.Pool.__init__(self, size=size, idle_timeout=idle_timeout)
+        self.port = port
+
+    def _open(self):
+        return _LocalSession(port=self.port, size=self.size)
+
+    def _transport(self):
+        return _LocalTransport(port=self.port, transport=starkinfra.Pool._transport(self))
+
+
+class LocalHttp2Pool(starkinfra.Http2Pool):
+    """Http2Pool whose connections are opened to a local ApiServer speaking HTTP/2 without TLS. Pass http1
+    to keep the Http2Pool transport, which falls back to HTTP/1.1 on plain connections as it would against
+    a server that doesn't offer HTTP/2.
+    """
+
+    def __init__(self, port, connections=1, streams=100, http1=False):
+        starkinfra.Http2Pool.__init__(self, connections=connections, streams=streams)
+        self.port = port
+        self.http1 = http1
+
+    def _transport(self):
+        if self.http1:
+            return _LocalTransport(port=self.port, transport=starkinfra.Http2Pool._transport(self))
+        return _LocalTransport(port=self.port, transport=self._httpx.AsyncHTTPTransport(
+            http1=False,
+            http2=True,
+            limits=self._httpx.Limits(max_connections=self.connections),
+        ))
+
+
+class _LocalTransport(AsyncBaseTransport):
+
+    def __init__(self, port, transport):
+        self.port = port
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self.port)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def _json(status, json, sign):
+    content = dumps(json)
+    headers = {"content-type": "application/json", "digital-signature": sign(content)}
+    return status, headers, content.encode("utf-8")
+
+
+def _decode(body, encoding):
+    if not body:
+        return {}
+    if encoding == "gzip":
+        body = decompress(body)
+    if encoding == "deflate":
+        body = inflate(body)
+    return loads(body.decode("utf-8"))
+
+
+def _flush(connection, pending):
+    for stream_id, content in list(pending.items()):
+        while content:
+            size = min(connection.local_flow_control_window(stream_id), connection.max_outbound_frame_size)
+            if size <= 0:
+                break
+            connection.send_data(stream_id, content[:size])
+            content = content[size:]
+        if content:
+            pending[stream_id] = content
+            continue
+        connection.end_stream(stream_id)
+        del pending[stream_id]
+
+
+def _page(entities, plural, query):
+    selected = list(entities.values())
+    if query.get("ids"):
+        ids = query["ids"].split(",")
+        selected = [entity for entity in selected if entity["id"] in ids]
+    if query.get("status"):
+        statuses = query["status"].split(",")
+        selected = [entity for entity in selected if entity.get("status") in statuses]
+    if query.get("after"):
+        selected = [entity for entity in selected if entity["created"][:10] >= query["after"]]
+    if query.get("before"):
+        selected = [entity for entity in selected if entity["created"][:10] <= query["before"]]
+
+    offset = int(query.get("cursor") or 0)
+    limit = min(int(query.get("limit") or _maxLimit), _maxLimit)
+    cursor = str(offset + limit) if offset + limit < len(selected) else None
+    return {plural: selected[offset:offset + limit], "cursor": cursor}
+
+
+def _names(resource):
+    name = "".join(word.capitalize() for word in resource.replace("/", "-").split("-"))
+    return last_name({"name": name}), last_name_plural({"name": name})
+
+
+def _routes():
+    for package in starkinfra._packages:
+        getattr(starkinfra, package)
+    routes = {}
+    for name, module in list(sys.modules.items()):
+        resource = getattr(module, "_resource", None)
+        if name.startswith("starkinfra.") and isinstance(resource, dict):
+            routes[endpoint(resource)] = (last_name(resource), last_name_plural(resource))
+    return routes